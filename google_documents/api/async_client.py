@@ -0,0 +1,198 @@
+import asyncio
+import inspect
+
+import aiohttp
+import httplib2
+from googleapiclient.errors import HttpError
+
+from google_documents.api.credentials import credentials_pool
+from google_documents.api.scheduler import scheduler
+
+
+class AsyncClient:
+    """
+    Sends requests built by the Google API services
+    over non-blocking aiohttp transport.
+
+    Count of requests running at the same time
+    is limited by `max_concurrency`. Requests are executed
+    within quotas and retried by the scheduler rules
+    """
+
+    max_concurrency = 10
+
+    # Total timeout of the single request in seconds
+    timeout = 120
+
+    def __init__(self, max_concurrency=None, timeout=None,
+                 request_scheduler=None):
+        self.max_concurrency = max_concurrency or self.max_concurrency
+        self.timeout = timeout or self.timeout
+        self.scheduler = request_scheduler or scheduler
+
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+
+    async def _prepare(self):
+        """
+        Creates session and semaphore for the running event loop,
+        closing the session of the previous loop
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._session is not None and not self._session.closed \
+                and self._loop is loop:
+            return
+
+        # New session is set before awaiting,
+        # so concurrent requests don't create their own ones
+        old_session, old_loop = self._session, self._loop
+        self._loop = loop
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if old_session is not None:
+            await self._close_session(old_session, old_loop)
+
+    @staticmethod
+    async def _close_session(session, session_loop):
+        """
+        Closes the session on the event loop it has been created in
+        """
+        if session.closed:
+            return
+
+        loop = asyncio.get_running_loop()
+        if session_loop is loop:
+            await session.close()
+        elif session_loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                session.close(), session_loop))
+        elif not session_loop.is_closed():
+            await loop.run_in_executor(
+                None, session_loop.run_until_complete, session.close())
+        else:
+            # Connections can't be closed by the closed loop,
+            # they are released with the detached connector
+            session.detach()
+
+    @staticmethod
+    async def _get_headers(request):
+        headers = dict(request.headers)
+
+        credentials = getattr(request.http, "credentials", None)
+        if credentials is not None:
+            if not credentials.valid:
+                # Refreshing token without blocking the event loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, credentials_pool.refresh_if_needed, credentials)
+
+            credentials.apply(headers)
+
+        return headers
+
+    async def execute(self, request):
+        """
+        Executes the request of the Google API service
+        :param request: googleapiclient.http.HttpRequest
+        :return: Deserialized response
+        """
+        await self._prepare()
+
+        attempt = 0
+        while True:
+            await self._acquire(request)
+
+            try:
+                return await self._send(request)
+            except (HttpError, ConnectionError, TimeoutError) as e:
+                delay = self.scheduler.get_retry_delay(
+                    e, attempt, self.scheduler.is_idempotent(request))
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _acquire(self, request):
+        """
+        Waits until the request fits all the quotas
+        without blocking the event loop
+        """
+        priority = self.scheduler.get_priority(request)
+
+        for bucket in self.scheduler.get_buckets(request):
+            delay = bucket.try_acquire(priority)
+            while delay is not None:
+                await asyncio.sleep(delay)
+                delay = bucket.try_acquire(priority)
+
+    async def _send(self, request):
+        headers = await self._get_headers(request)
+
+        try:
+            async with self._semaphore:
+                async with self._session.request(
+                        request.method, request.uri,
+                        data=request.body, headers=headers) as response:
+                    content = await response.read()
+
+                    http_response = httplib2.Response({
+                        **response.headers,
+                        "status": response.status
+                    })
+        # Transport errors are raised as built-in ones to be retried
+        except aiohttp.ClientConnectionError as e:
+            raise ConnectionError(str(e)) from e
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(str(e)) from e
+
+        # Raises HttpError for the unsuccessful responses
+        return request.postproc(http_response, content)
+
+    async def execute_request(self, service, request, callback=None,
+                              error_callback=None, batchable=True):
+        """
+        Asynchronous version of the `execute_request`
+        """
+        try:
+            response = await self.execute(request)
+        except HttpError as e:
+            if error_callback:
+                return await self._resolve(error_callback(e))
+            raise
+
+        return await self._resolve(callback(response)) if callback \
+            else response
+
+    @staticmethod
+    async def _resolve(result):
+        """
+        Awaits result of the callback,
+        which may send the next request depending on the response
+        """
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    async def resolved_result(self, result):
+        """
+        Asynchronous version of the `resolved_result`
+        """
+        return result
+
+    async def close(self):
+        if self._session is not None:
+            await self._close_session(self._session, self._loop)
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+default_async_client = AsyncClient()
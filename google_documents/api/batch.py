@@ -0,0 +1,197 @@
+import threading
+from concurrent.futures import Future
+
+from googleapiclient.errors import HttpError
+
+from google_documents.api.scheduler import scheduler
+from google_documents.api.transport import get_thread_http
+
+
+class BatchEntry:
+    def __init__(self, service, request, callback=None, error_callback=None):
+        self.service = service
+        self.request = request
+        self.callback = callback
+        self.error_callback = error_callback
+        self.future = Future()
+
+    def _get_result(self, response, exception):
+        if exception is not None:
+            if self.error_callback and isinstance(exception, HttpError):
+                return self.error_callback(exception)
+            raise exception
+
+        return self.callback(response) if self.callback else response
+
+    def resolve(self, response, exception):
+        """
+        Sets result of the request to the future
+        """
+        try:
+            self.future.set_result(self._get_result(response, exception))
+        except Exception as e:
+            self.future.set_exception(e)
+
+
+class Batch:
+    """
+    Collects API requests and sends them as multipart batch requests.
+
+    While the batch is active (used as a context manager),
+    requests made via `execute_request` are queued
+    and futures are returned instead of the responses.
+    Queued requests are sent on exit from the context
+    """
+
+    # Google APIs accept up to 100 calls in the single batch request
+    max_batch_size = 100
+
+    _local = threading.local()
+
+    def __init__(self, max_batch_size=None):
+        self.max_batch_size = max_batch_size or self.max_batch_size
+        self._entries = []
+
+    @classmethod
+    def _get_stack(cls):
+        if not hasattr(cls._local, "stack"):
+            cls._local.stack = []
+        return cls._local.stack
+
+    @classmethod
+    def get_current(cls):
+        """
+        Returns batch active in the current thread or None
+        """
+        stack = cls._get_stack()
+        return stack[-1] if stack else None
+
+    def __enter__(self):
+        self._get_stack().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._get_stack().remove(self)
+
+        if exc_type is None:
+            self.execute()
+        else:
+            # Requests are not sent if the block has failed
+            for entry in self._entries:
+                entry.future.cancel()
+            self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, service, request, callback=None, error_callback=None):
+        """
+        Queues the request
+        :param service: Service the request has been built with
+        :param request: API request
+        :param callback: Function, transforming the response
+        :param error_callback: Function, returning result on the HTTP error.
+        By default the error is set to the future
+        :return: Future of the transformed response
+        """
+        entry = BatchEntry(service, request, callback, error_callback)
+        self._entries.append(entry)
+        return entry.future
+
+    def _group_entries(self, entries):
+        """
+        Groups entries by the service, because every batch request
+        is sent to the single API using single credentials
+        """
+        groups = {}
+        for entry in entries:
+            groups.setdefault(id(entry.service), []).append(entry)
+        return groups.values()
+
+    @staticmethod
+    def _get_entry_callback(entry):
+        def callback(request_id, response, exception):
+            entry.resolve(response, exception)
+
+        return callback
+
+    @staticmethod
+    def _execute_chunk(batch_request, chunk):
+        """
+        Sends the batch request, each call of which is counted in quotas
+        """
+        def acquire():
+            for entry in chunk:
+                scheduler.acquire(entry.request)
+
+        scheduler.retry(
+            lambda: batch_request.execute(
+                http=get_thread_http(chunk[0].request)),
+            before_attempt=acquire,
+            idempotent=all(
+                scheduler.is_idempotent(entry.request) for entry in chunk)
+        )
+
+    def execute(self):
+        """
+        Sends all queued requests
+        """
+        entries, self._entries = self._entries, []
+
+        for group in self._group_entries(entries):
+            for start in range(0, len(group), self.max_batch_size):
+                chunk = group[start:start + self.max_batch_size]
+
+                batch_request = chunk[0].service.new_batch_http_request()
+                for entry in chunk:
+                    batch_request.add(
+                        entry.request,
+                        callback=self._get_entry_callback(entry))
+
+                try:
+                    self._execute_chunk(batch_request, chunk)
+                except Exception as e:
+                    # Transport errors fail all the chunk requests
+                    for entry in chunk:
+                        if not entry.future.done():
+                            entry.future.set_exception(e)
+
+
+def execute_request(service, request, callback=None, error_callback=None,
+                    batchable=True):
+    """
+    Executes the request or queues it, if there is active batch
+    :param service: Service the request has been built with
+    :param request: API request
+    :param callback: Function, transforming the response
+    :param error_callback: Function, returning result on the HTTP error.
+    By default the error is raised
+    :param batchable: False if the request should be executed
+    immediately even if there is active batch
+    :return: Transformed response or its future in the batch mode
+    """
+    batch = Batch.get_current()
+    if batch is not None and batchable:
+        return batch.add(service, request, callback, error_callback)
+
+    try:
+        response = scheduler.execute(request, http=get_thread_http(request))
+    except HttpError as e:
+        if error_callback:
+            return error_callback(e)
+        raise
+
+    return callback(response) if callback else response
+
+
+def resolved_result(result):
+    """
+    Returns already known result the same way as `execute_request` does,
+    i.e. as a done future if there is active batch
+    """
+    if Batch.get_current() is None:
+        return result
+
+    future = Future()
+    future.set_result(result)
+    return future
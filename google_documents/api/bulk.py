@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from google_documents.api.scheduler import Priority, scheduler
+
+
+class BulkResult:
+    """
+    Result of the bulk operation for the single item
+    """
+
+    def __init__(self, item, result=None, error=None):
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error {self.error!r}"
+        return f"<{self.__class__.__name__}: {self.item!r} - {status}>"
+
+
+class BulkError(Exception):
+    """
+    Raised when some items of the bulk operation have failed
+    """
+
+    def __init__(self, results):
+        """
+        :param results: List of BulkResult of the failed items
+        """
+        self.results = results
+        super().__init__(
+            f"{len(results)} items have failed, "
+            f"the first error: {results[0].error!r}")
+
+
+def raise_errors(results):
+    """
+    Raises BulkError with the failed results, if there are any
+    :param results: List of BulkResult
+    :return: The results, if all of them are ok
+    """
+    failed_results = [result for result in results if not result.ok]
+    if failed_results:
+        raise BulkError(failed_results) from failed_results[0].error
+    return results
+
+
+class BulkOperation:
+    """
+    Runs the function for every item on the thread pool
+    collecting result or error for each item
+    """
+
+    max_workers = 8
+
+    def __init__(self, function, max_workers=None):
+        """
+        :param function: Function called for every item
+        :param max_workers: Count of the threads
+        """
+        self.function = function
+        self.max_workers = max_workers or self.max_workers
+
+    # Bulk requests give way to the interactive ones
+    priority = Priority.BULK
+
+    def _run_item(self, item):
+        try:
+            with scheduler.priority(self.priority):
+                return BulkResult(item, result=self.function(item))
+        except Exception as e:
+            return BulkResult(item, error=e)
+
+    def run(self, items):
+        """
+        :param items: Items to run function for
+        :return: List of BulkResult in the order of the items
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self._run_item, items))
@@ -0,0 +1,177 @@
+"""
+Key-value caches with LRU eviction and per-entry TTL
+"""
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class CacheBackend(ABC):
+    """
+    Interface of the cache storage.
+    Values should be JSON-serializable to be stored by any backend
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """
+        Returns cached value or None if it is missing or expired
+        """
+
+    @abstractmethod
+    def set(self, key, value, ttl):
+        """
+        Stores value for the ttl seconds
+        """
+
+    @abstractmethod
+    def delete(self, key):
+        pass
+
+    @abstractmethod
+    def keys(self, prefix=""):
+        """
+        Returns keys of the stored values starting with the prefix
+        """
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Cache in the memory of the process
+    """
+    max_size = 1000
+
+    def __init__(self, max_size=None):
+        """
+        :param max_size: Count of the values, after which
+        least recently used ones are evicted
+        """
+        self.max_size = max_size or self.max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def keys(self, prefix=""):
+        with self._lock:
+            return [key for key in self._items if key.startswith(prefix)]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache in the SQLite database file,
+    which is shared by the processes of the host
+    """
+    max_size = 10000
+
+    # Seconds to wait for the database locked by another process
+    timeout = 30
+
+    def __init__(self, file_name, max_size=None):
+        """
+        :param file_name: Path to the database file
+        :param max_size: Count of the values, after which
+        least recently used ones are evicted
+        """
+        self.file_name = file_name
+        self.max_size = max_size or self.max_size
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT, "
+                "expires_at REAL, accessed_at REAL)")
+
+    @contextmanager
+    def _connect(self):
+        """
+        Opens connection per call, which makes the backend safe for threads.
+        Changes are committed on exit from the block
+        """
+        connection = sqlite3.connect(self.file_name, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, key):
+        now = time.time()
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, now)).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        now = time.time()
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + ttl, now))
+            connection.execute(
+                "DELETE FROM cache WHERE expires_at <= ? OR key IN ("
+                "SELECT key FROM cache ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)", (now, self.max_size))
+
+    def delete(self, key):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def keys(self, prefix=""):
+        with self._connect() as connection:
+            return [
+                key for key, in connection.execute(
+                    "SELECT key FROM cache WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix))
+            ]
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM cache")
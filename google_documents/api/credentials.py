@@ -0,0 +1,98 @@
+import datetime
+import os
+import threading
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2 import service_account
+
+# Google account scopes
+SCOPES = [
+    'https://www.googleapis.com/auth/drive'  # Google Drive full access
+]
+
+
+class CredentialsPool:
+    """
+    Pool of the service account credentials keyed by the file path
+    and the delegated subject.
+
+    Service account file is parsed only when its modification time
+    changes, so all managers and entities using the same file share
+    single credentials object and therefore single OAuth token.
+    """
+
+    # Token is renewed this long before its expiration
+    refresh_margin = datetime.timedelta(minutes=5)
+
+    def __init__(self, scopes):
+        self.scopes = scopes
+
+        # (absolute file path, subject) -> (file mtime, credentials)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def _load(self, service_account_file, subject=None):
+        return service_account.Credentials.from_service_account_file(
+            service_account_file, scopes=self.scopes, subject=subject)
+
+    def get(self, service_account_file, subject=None):
+        """
+        Returns credentials from the service account file
+        with a valid token
+        :param service_account_file: Path to the service account file
+        :param subject: Email of the user to impersonate
+        by the domain-wide delegation
+        """
+        path = os.path.abspath(service_account_file)
+        mtime = os.stat(path).st_mtime_ns
+        key = (path, subject)
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != mtime:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[0] != mtime:
+                    entry = (mtime, self._load(path, subject))
+                    self._entries[key] = entry
+
+        credentials = entry[1]
+        self.refresh_if_needed(credentials)
+
+        return credentials
+
+    def _needs_refresh(self, credentials):
+        if not credentials.token or not credentials.expiry:
+            return True
+
+        # Credentials expiry is naive datetime in UTC
+        now = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None)
+        return credentials.expiry - self.refresh_margin <= now
+
+    @staticmethod
+    def _refresh(credentials):
+        credentials.refresh(google_auth_httplib2.Request(httplib2.Http()))
+
+    def refresh_if_needed(self, credentials):
+        """
+        Renews the token if it is missing or is going to expire soon.
+        Only one thread refreshes the token, others wait and reuse it
+        """
+        if not self._needs_refresh(credentials):
+            return
+
+        with self._refresh_lock:
+            # Token may be refreshed by another thread
+            # while we were waiting for the lock
+            if self._needs_refresh(credentials):
+                self._refresh(credentials)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Credentials are shared between all managers and entities
+credentials_pool = CredentialsPool(SCOPES)
@@ -0,0 +1,183 @@
+import contextlib
+import io
+import os
+import uuid
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import (
+    MediaFileUpload,
+    MediaIoBaseDownload,
+    MediaIoBaseUpload
+)
+
+from google_documents.api.scheduler import scheduler
+from google_documents.api.transport import get_thread_http
+
+# Size of the chunks in which media is transferred by default
+DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
+
+
+def download(request, file, chunk_size=None, progress_callback=None):
+    """
+    Downloads media of the request to the file by chunks,
+    so only one chunk is kept in memory
+    :param request: Media request, e.g. files().export_media(...)
+    :param file: Writable binary file object
+    :param chunk_size: Size of the chunks in bytes
+    :param progress_callback: Function called after every chunk
+    with count of the downloaded bytes and total size
+    """
+    request.http = get_thread_http(request) or request.http
+    downloader = MediaIoBaseDownload(
+        file, request, chunksize=chunk_size or DEFAULT_CHUNK_SIZE)
+
+    done = False
+    while not done:
+        # Failed chunk is requested again from the same position
+        status, done = scheduler.retry(
+            downloader.next_chunk,
+            before_attempt=lambda: scheduler.acquire(request)
+        )
+
+        if progress_callback:
+            progress_callback(status.resumable_progress, status.total_size)
+
+
+@contextlib.contextmanager
+def open_atomically(file_name):
+    """
+    Opens temporary file for writing,
+    which is renamed to the file name only if the writing succeeds
+    """
+    temp_file_name = f"{file_name}.{uuid.uuid4().hex}.part"
+
+    try:
+        with open(temp_file_name, "xb") as file:
+            yield file
+        os.replace(temp_file_name, file_name)
+    except BaseException:
+        if os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
+        raise
+
+
+def get_media_upload(source, mime_type, chunk_size=None):
+    """
+    Returns resumable media upload from the source
+    :param source: File name, bytes, file-like object or memory-mapped file
+    :param mime_type: Mime type of the media
+    :param chunk_size: Size of the uploaded chunks in bytes
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+
+    if isinstance(source, (str, os.PathLike)):
+        return MediaFileUpload(os.fspath(source), mimetype=mime_type,
+                               chunksize=chunk_size, resumable=True)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    # File-like objects and memory-mapped files are read by chunks
+    return MediaIoBaseUpload(source, mimetype=mime_type,
+                             chunksize=chunk_size, resumable=True)
+
+
+class StateFile:
+    """
+    Keeps a short state, e.g. URI or token, in the file,
+    so an interrupted operation can be continued where it stopped,
+    even by another process
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def load(self):
+        try:
+            with open(self.file_name) as file:
+                return file.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def save(self, value):
+        with open_atomically(self.file_name) as file:
+            file.write(value.encode())
+
+    def clear(self):
+        if os.path.exists(self.file_name):
+            os.remove(self.file_name)
+
+
+class UploadSession(StateFile):
+    """
+    Keeps URI of the resumable upload session in the file
+    """
+
+
+def _resume(request, uri):
+    """
+    Makes request continue the upload session with the URI
+    from the position already received by the server
+    :return: Response of the request if the upload has been completed
+    """
+    size = request.resumable.size()
+    response, content = request.http.request(uri, "PUT", headers={
+        "Content-Range": f"bytes */{'*' if size is None else size}",
+        "Content-Length": "0"
+    })
+
+    if response.status in (200, 201):
+        return request.postproc(response, content)
+    if response.status != 308:
+        raise HttpError(response, content, uri=uri)
+
+    request.resumable_uri = uri
+    request.resumable_progress = \
+        int(response["range"].split("-")[1]) + 1 \
+        if "range" in response else 0
+    return None
+
+
+def upload(request, session=None, progress_callback=None):
+    """
+    Uploads media of the request by chunks
+    :param request: Request with the resumable media body
+    :param session: UploadSession to save and resume upload URI
+    :param progress_callback: Function called after every chunk
+    with count of the uploaded bytes and total size
+    :return: Response of the request
+    """
+    request.http = get_thread_http(request) or request.http
+
+    response = None
+
+    saved_uri = session and session.load()
+    if saved_uri:
+        try:
+            response = scheduler.retry(
+                lambda: _resume(request, saved_uri),
+                before_attempt=lambda: scheduler.acquire(request)
+            )
+        except HttpError as e:
+            # Saved session has expired, so upload is started again
+            if e.resp.status not in (404, 410):
+                raise
+
+    while response is None:
+        status, response = scheduler.retry(
+            request.next_chunk,
+            before_attempt=lambda: scheduler.acquire(request)
+        )
+
+        if session and request.resumable_uri \
+                and request.resumable_uri != saved_uri:
+            saved_uri = request.resumable_uri
+            session.save(saved_uri)
+
+        if status and progress_callback:
+            progress_callback(status.resumable_progress, status.total_size)
+
+    if session:
+        session.clear()
+
+    return response
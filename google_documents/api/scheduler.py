@@ -0,0 +1,364 @@
+import contextlib
+import email.utils
+import heapq
+import itertools
+import json
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+class Priority:
+    """
+    Priority classes of the requests.
+    Requests with the lower value get quota earlier
+    """
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+
+class TokenBucket:
+    """
+    Limits rate of the requests, granting tokens
+    to the waiting requests in the order of their priority
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        :param rate: Tokens added per second
+        :param capacity: Maximal count of the tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+
+        self.tokens = capacity
+        self._updated = time.monotonic()
+
+        self._condition = threading.Condition()
+        # Heap of the (priority, sequence number) of the waiting requests
+        self._waiters = []
+        self._sequence = itertools.count()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority=Priority.DEFAULT):
+        """
+        Blocks until the token is granted
+        :param priority: Priority of the request
+        """
+        with self._condition:
+            waiter = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, waiter)
+
+            try:
+                while True:
+                    self._refill()
+
+                    if self._waiters[0] != waiter:
+                        # Request with the higher priority is served first
+                        self._condition.wait()
+                    elif self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    else:
+                        self._condition.wait((1 - self.tokens) / self.rate)
+            finally:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def try_acquire(self, priority=Priority.DEFAULT):
+        """
+        Grants the token without blocking
+        :param priority: Priority of the request
+        :return: None if the token is granted,
+        otherwise delay in seconds before the next attempt
+        """
+        with self._condition:
+            self._refill()
+
+            # Blocked requests with the same or higher priority go first
+            if self._waiters and self._waiters[0][0] <= priority:
+                return 1 / self.rate
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return None
+            return (1 - self.tokens) / self.rate
+
+
+class QuotaLimit:
+    """
+    Limit of the requests count for the API in the period
+    """
+
+    def __init__(self, api_name, scope, requests, period, kind=None):
+        """
+        :param api_name: Name of the API, e.g. "drive" or "sheets"
+        :param scope: "user" - quota per credentials,
+        "project" - quota per Google Cloud project
+        :param requests: Count of the requests allowed in the period
+        :param period: Period in seconds
+        :param kind: "read" or "write" if the limit is applied
+        only to that kind of requests
+        """
+        self.api_name = api_name
+        self.scope = scope
+        self.requests = requests
+        self.period = period
+        self.kind = kind
+
+
+class RequestScheduler:
+    """
+    Executes all API requests within the quotas,
+    retrying failed requests with the jittered exponential backoff
+    """
+
+    # Default quotas of the Google Drive and Google Sheets APIs
+    quota_limits = [
+        QuotaLimit("drive", "user", 12000, 60),
+        QuotaLimit("drive", "project", 12000, 60),
+        QuotaLimit("sheets", "user", 60, 60, kind="read"),
+        QuotaLimit("sheets", "user", 60, 60, kind="write"),
+        QuotaLimit("sheets", "project", 300, 60, kind="read"),
+        QuotaLimit("sheets", "project", 300, 60, kind="write"),
+    ]
+
+    max_retries = 5
+    # Initial and maximal delays between retries in seconds
+    backoff_base = 1
+    backoff_max = 64
+
+    retry_statuses = {429, 500, 502, 503, 504}
+    # Reasons of the 403 responses, which mean exceeded quota
+    retry_reasons = {"rateLimitExceeded", "userRateLimitExceeded"}
+    # Transport errors, after which request is retried
+    retry_errors = (httplib2.HttpLib2Error, ConnectionError, TimeoutError)
+
+    # Ends of the paths of the POST requests, which create a new resource
+    # on every call, e.g. files and spreadsheets creation, copying,
+    # adding sheets and appending values
+    non_idempotent_paths = ("/files", "/copy", "/spreadsheets", ":append")
+
+    def __init__(self, quota_limits=None):
+        if quota_limits is not None:
+            self.quota_limits = quota_limits
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def priority(self, priority):
+        """
+        Sets priority of the requests made by the current thread
+        within the context
+        """
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def get_priority(self, request):
+        priority = getattr(self._local, "priority", None)
+        if priority is not None:
+            return priority
+
+        # Reads are considered interactive by default
+        return Priority.INTERACTIVE if self._is_read(request) \
+            else Priority.DEFAULT
+
+    @staticmethod
+    def _is_read(request):
+        return getattr(request, "method", "GET") == "GET"
+
+    def is_idempotent(self, request):
+        """
+        Returns False if repeating the request may duplicate its effect
+        """
+        if getattr(request, "method", "GET") != "POST":
+            return True
+
+        path = urlparse(getattr(request, "uri", "")).path
+        # Structural updates of the spreadsheet, unlike values updates
+        if path.endswith(":batchUpdate") and "/values" not in path:
+            return False
+        return not path.endswith(self.non_idempotent_paths)
+
+    @staticmethod
+    def get_api_name(request):
+        uri = getattr(request, "uri", "")
+        if "sheets.googleapis.com" in uri:
+            return "sheets"
+        if "/drive/" in uri or "drive.googleapis.com" in uri:
+            return "drive"
+        return None
+
+    @staticmethod
+    def _get_scope_id(request, scope):
+        credentials = getattr(
+            getattr(request, "http", None), "credentials", None)
+
+        if scope == "project":
+            return getattr(credentials, "project_id", None)
+        return getattr(credentials, "service_account_email", None) \
+            or id(credentials)
+
+    def _get_bucket(self, quota_limit, scope_id):
+        key = (quota_limit.api_name, quota_limit.scope,
+               quota_limit.kind, scope_id)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(
+                    rate=quota_limit.requests / quota_limit.period,
+                    capacity=quota_limit.requests)
+                self._buckets[key] = bucket
+
+        return bucket
+
+    def get_buckets(self, request):
+        """
+        Returns token buckets of all the quotas applied to the request
+        """
+        api_name = self.get_api_name(request)
+        kind = "read" if self._is_read(request) else "write"
+
+        return [
+            self._get_bucket(
+                quota_limit, self._get_scope_id(request, quota_limit.scope))
+            for quota_limit in self.quota_limits
+            if quota_limit.api_name == api_name
+            and quota_limit.kind in (None, kind)
+        ]
+
+    def acquire(self, request):
+        """
+        Blocks until the request fits all the quotas
+        """
+        priority = self.get_priority(request)
+
+        for bucket in self.get_buckets(request):
+            bucket.acquire(priority)
+
+    @staticmethod
+    def _get_error_reason(error):
+        try:
+            errors = json.loads(error.content)["error"]["errors"]
+            return errors[0]["reason"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            return None
+
+    @staticmethod
+    def _get_retry_after(error):
+        """
+        Returns delay from the `Retry-After` header in seconds
+        """
+        retry_after = error.resp.get("retry-after")
+        if not retry_after:
+            return None
+
+        try:
+            return max(0, float(retry_after))
+        except ValueError:
+            pass
+
+        # Retry-After may be specified as HTTP date
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return max(0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _is_rate_limited(self, error):
+        """
+        Returns True if the request has been rejected by the quota,
+        so it has not been executed
+        """
+        return isinstance(error, HttpError) and (
+            error.resp.status == 429 or (
+                error.resp.status == 403
+                and self._get_error_reason(error) in self.retry_reasons))
+
+    def is_retryable(self, error, idempotent=True):
+        """
+        :param idempotent: False if the request may duplicate its effect,
+        then it is retried only if it has been rejected by the quota
+        """
+        if not idempotent:
+            return self._is_rate_limited(error)
+
+        if isinstance(error, HttpError):
+            return error.resp.status in self.retry_statuses \
+                or self._is_rate_limited(error)
+
+        return isinstance(error, self.retry_errors)
+
+    def get_retry_delay(self, error, attempt, idempotent=True):
+        """
+        Returns delay in seconds before retrying the failed request
+        or None if request should not be retried
+        :param error: Error raised by the request
+        :param attempt: Number of the failed attempt starting from 0
+        :param idempotent: False if the request may duplicate its effect
+        """
+        if attempt >= self.max_retries \
+                or not self.is_retryable(error, idempotent):
+            return None
+
+        if isinstance(error, HttpError):
+            retry_after = self._get_retry_after(error)
+            if retry_after is not None:
+                return retry_after
+
+        # Full jitter spreads retries of the concurrent requests
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return random.uniform(0, backoff)
+
+    def retry(self, function, before_attempt=None, idempotent=True):
+        """
+        Calls function retrying it on the retryable errors
+        :param function: Function sending the request
+        :param before_attempt: Function called before every attempt
+        :param idempotent: False if the request may duplicate its effect
+        """
+        for attempt in itertools.count():
+            if before_attempt:
+                before_attempt()
+
+            try:
+                return function()
+            except (HttpError, *self.retry_errors) as e:
+                delay = self.get_retry_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+
+    def execute(self, request, http=None):
+        """
+        Executes the request within quotas retrying it if needed
+        :param request: googleapiclient.http.HttpRequest
+        :param http: Transport to use instead of the request one
+        """
+        return self.retry(
+            lambda: request.execute(http=http),
+            before_attempt=lambda: self.acquire(request),
+            idempotent=self.is_idempotent(request)
+        )
+
+
+# Scheduler of all the requests made by managers and entities
+scheduler = RequestScheduler()
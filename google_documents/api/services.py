@@ -0,0 +1,103 @@
+import threading
+
+import google_auth_httplib2
+from googleapiclient import discovery
+
+from google_documents.api.transport import default_transport
+
+
+class ServiceRegistry:
+    """
+    Process-wide registry of the built Google API services.
+
+    Building a service parses the discovery document and constructs
+    the whole resource tree, so it is done once per
+    (resource, version, credentials identity) and reused afterwards.
+    """
+
+    def __init__(self, transport=None):
+        """
+        :param transport: Transport with the `httplib2.Http` interface
+        used by the built services. Shared pooled transport by default
+        """
+        self.transport = transport or default_transport
+
+        self._services = {}
+        self._lock = threading.Lock()
+
+    def set_transport(self, transport):
+        """
+        Replaces transport of the services.
+        Services built with the previous transport are dropped
+        """
+        with self._lock:
+            self.transport = transport
+            self._services.clear()
+
+    @staticmethod
+    def get_credentials_identity(credentials):
+        """
+        Returns hashable identity of the credentials.
+        Service account credentials issued from the same key
+        for the same scopes and delegated subject are considered to be the same
+        """
+        signer = getattr(credentials, "signer", None)
+        email = getattr(credentials, "service_account_email", None)
+
+        if signer is not None and email:
+            return (
+                email,
+                getattr(signer, "key_id", None),
+                tuple(sorted(getattr(credentials, "scopes", None) or ())),
+                # Impersonated user of the domain-wide delegation
+                getattr(credentials, "_subject", None),
+            )
+
+        # Registry keeps reference to the credentials
+        # via built service, so `id` can't be reused while it is stored
+        return id(credentials)
+
+    def build(self, resource_name, version, credentials):
+        return discovery.build(
+            resource_name,
+            version,
+            http=google_auth_httplib2.AuthorizedHttp(
+                credentials, http=self.transport),
+            # Using discovery documents bundled into the client library
+            # instead of fetching them over the network
+            static_discovery=True,
+            cache_discovery=False,
+        )
+
+    def get(self, resource_name, version, credentials):
+        """
+        Returns built service for the resource,
+        building it on the first access
+        :param resource_name: API name, e.g. "drive" or "sheets"
+        :param version: API version, e.g. "v3"
+        :param credentials: Credentials to authorize service with
+        """
+        key = (resource_name, version,
+               self.get_credentials_identity(credentials))
+
+        service = self._services.get(key)
+        if service is None:
+            with self._lock:
+                # Service may be built by another thread
+                # while we were waiting for the lock
+                service = self._services.get(key)
+                if service is None:
+                    service = self.build(resource_name, version, credentials)
+                    self._services[key] = service
+
+        return service
+
+    def clear(self):
+        with self._lock:
+            self._services.clear()
+
+    def __len__(self):
+        return len(self._services)
+
+
+service_registry = ServiceRegistry()
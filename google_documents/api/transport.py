@@ -0,0 +1,152 @@
+import gzip
+import threading
+
+import google_auth_httplib2
+import httplib2
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class PooledHttp:
+    """
+    Thread-safe transport with the `httplib2.Http` interface,
+    expected by the Google API client.
+
+    Connections are kept alive in the pool and shared between
+    all the services, responses are received gzipped
+    and large JSON request bodies are gzipped before sending
+    """
+
+    thread_safe = True
+
+    # Count of the connections kept alive per host
+    pool_size = 20
+
+    # Connect and read timeout in seconds
+    timeout = 120
+
+    # Request bodies larger than that (in bytes) are gzipped.
+    # None disables compression of the requests
+    compress_min_size = 64 * 1024
+
+    def __init__(self, pool_size=None, timeout=None, compress_min_size=None):
+        self.pool_size = pool_size or self.pool_size
+        self.timeout = timeout or self.timeout
+        if compress_min_size is not None:
+            self.compress_min_size = compress_min_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size,
+                              pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    # Types of the request bodies, which are gzipped
+    compressed_content_types = ("application/json", "text/")
+
+    def _is_compressible(self, uri, body, headers):
+        """
+        Returns True for large JSON and text bodies. Media is not gzipped,
+        because uploaded chunks are addressed by the raw bytes
+        """
+        if body is None or self.compress_min_size is None \
+                or len(body) < self.compress_min_size \
+                or "content-encoding" in headers:
+            return False
+
+        if "content-range" in headers or "uploadType=" in uri:
+            return False
+
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(self.compressed_content_types)
+
+    def _compress(self, uri, body, headers):
+        if not self._is_compressible(uri, body, headers):
+            return body
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        headers["content-encoding"] = "gzip"
+        return gzip.compress(body)
+
+    def request(self, uri, method="GET", body=None, headers=None,
+                redirections=httplib2.DEFAULT_MAX_REDIRECTS,
+                connection_type=None):
+        headers = {
+            key.lower(): value for key, value in (headers or {}).items()}
+        headers.setdefault("accept-encoding", "gzip, deflate")
+        body = self._compress(uri, body, headers)
+
+        try:
+            response = self.session.request(
+                method, uri, data=body, headers=headers,
+                timeout=self.timeout, allow_redirects=redirections > 0)
+        # Transport errors are raised as built-in ones,
+        # which are retried by the Google API client and the scheduler
+        except requests.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+
+        http_response = httplib2.Response({
+            **response.headers,
+            "status": response.status_code
+        })
+        content = response.content
+
+        # Content is already decompressed, mirroring httplib2 behaviour
+        if "content-encoding" in http_response:
+            http_response["content-length"] = str(len(content))
+            http_response["-content-encoding"] = \
+                http_response.pop("content-encoding")
+
+        return http_response, content
+
+    def close(self):
+        self.session.close()
+
+
+_local = threading.local()
+
+
+def _build_http(credentials):
+    return google_auth_httplib2.AuthorizedHttp(
+        credentials, http=httplib2.Http())
+
+
+def get_thread_http(request):
+    """
+    Returns authorized HTTP transport of the current thread
+    for the request credentials.
+
+    httplib2 is not thread-safe, so if the service is built with it,
+    service is shared between threads, but every thread sends requests
+    via its own transport
+    :param request: googleapiclient.http.HttpRequest
+    :return: Transport or None, if request transport should be used
+    """
+    authorized_http = getattr(request, "http", None)
+    credentials = getattr(authorized_http, "credentials", None)
+    if credentials is None:
+        return None
+
+    # Thread-safe transports are shared between threads
+    if getattr(authorized_http.http, "thread_safe", False):
+        return None
+
+    if not hasattr(_local, "transports"):
+        _local.transports = {}
+
+    # Transport keeps reference to the credentials,
+    # so their `id` can't be reused while the transport is stored
+    http = _local.transports.get(id(credentials))
+    if http is None:
+        http = _build_http(credentials)
+        _local.transports[id(credentials)] = http
+
+    return http
+
+
+# Transport used by all the managers and entities by default
+default_transport = PooledHttp()
@@ -0,0 +1,153 @@
+import asyncio
+import functools
+
+from google_documents.api.async_client import default_async_client
+from google_documents.entities.file import (
+    GoogleDriveFile,
+    GoogleDriveDocument,
+    GoogleDriveSpreadsheet
+)
+from google_documents.entity_managers.async_file import (
+    AsyncGoogleDriveDocumentManager,
+    AsyncGoogleDriveSpreadsheetManager
+)
+from google_documents.entities.range import SheetRange
+from google_documents.entity_managers.async_sheet import AsyncSheetsManager
+from google_documents.settings import MIME_TYPES
+
+
+class AsyncEntityMixin:
+    """
+    Makes API methods of the entity awaitable.
+    Requests are sent via non-blocking async client,
+    which limits count of the concurrent requests
+    """
+    async_client = default_async_client
+
+    def _execute_request(self, service, request,
+                         callback=None, error_callback=None, batchable=True):
+        return self.async_client.execute_request(
+            service, request, callback, error_callback, batchable)
+
+    def _resolved_result(self, result):
+        return self.async_client.resolved_result(result)
+
+    @classmethod
+    def files(cls):
+        return AsyncGoogleDriveDocumentManager(cls)
+
+    def _load_missing_fields(self):
+        if self._missing_fields_loaded or not self._get_missing_fields():
+            return
+
+        raise TypeError("Missing fields can't be loaded lazily without "
+                        "blocking the event loop, "
+                        "use `await file.load_fields()` first")
+
+    async def load_fields(self):
+        """
+        Loads all lazy fields missing in the file item by single API call
+        """
+        missing_fields = self._get_missing_fields()
+        if missing_fields and not self._missing_fields_loaded:
+            item = await self.async_client.execute(
+                self._get_missing_fields_request(missing_fields))
+            self._update_missing_fields(item)
+
+        self._missing_fields_loaded = True
+        return self
+
+
+class AsyncGoogleDriveFile(AsyncEntityMixin, GoogleDriveFile):
+    pass
+
+
+class AsyncGoogleDriveDocument(AsyncEntityMixin, GoogleDriveDocument):
+    async def export(self, file_name, mime_type=MIME_TYPES['docx']):
+        """
+        Exports content of the file to format specified
+        in the MimeType and writes it to the File
+        """
+        service = self._api_service
+        export_bytes = await self.async_client.execute(
+            service.files().export(fileId=self.id, mimeType=mime_type))
+
+        # Writing file without blocking the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write_export, file_name, export_bytes)
+
+    async def update(self, *args, **kwargs):
+        """
+        Uploads new content of the file in the executor,
+        see `GoogleDriveDocument.update`.
+        Progress callback is called from the executor thread
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(super().update, *args, **kwargs))
+
+
+class AsyncGoogleDriveSpreadsheet(AsyncGoogleDriveDocument,
+                                  GoogleDriveSpreadsheet):
+    @classmethod
+    def files(cls):
+        return AsyncGoogleDriveSpreadsheetManager(cls)
+
+    @property
+    def sheets(self):
+        return AsyncSheetsManager(self)
+
+    def __setitem__(self, item, value):
+        raise TypeError("Item assignment can't be awaited, "
+                        "use `await spreadsheet.write(...)` instead")
+
+    def buffered(self, max_cells=None):
+        raise TypeError("Buffered writes can't be awaited, "
+                        "use `await spreadsheet.batch_write(...)` instead")
+
+    async def read_iter(self, range_name, chunk_rows=None):
+        """
+        Asynchronous version of the `read_iter`, used by `async for`.
+        Next window is fetched by the task while rows are handled
+        :param range_name: Range to read
+        :param chunk_rows: Count of rows read by one request
+        """
+        sheet_range = SheetRange.parse(range_name)
+
+        rows_count = None
+        if sheet_range.end_row is None:
+            sheets = self.sheets
+            all_sheets = await sheets.all()
+            sheet = sheets[sheet_range.sheet_title] \
+                if sheet_range.sheet_title else all_sheets[0]
+            rows_count = sheet.grid_properties.row_count
+
+        windows = sheet_range.split_rows(
+            chunk_rows or self.read_chunk_rows, rows_count)
+        if not windows:
+            return
+
+        task = asyncio.ensure_future(self.read(windows[0].to_a1()))
+        try:
+            # Trailing empty rows are not returned by the API,
+            # so empty rows are yielded only if there is data after them
+            empty_rows_count = 0
+
+            for index, window in enumerate(windows):
+                rows = await task
+
+                if index + 1 < len(windows):
+                    task = asyncio.ensure_future(
+                        self.read(windows[index + 1].to_a1()))
+
+                if rows:
+                    for _ in range(empty_rows_count):
+                        yield []
+                    empty_rows_count = 0
+                for row in rows:
+                    yield row
+
+                empty_rows_count += \
+                    window.end_row - window.start_row + 1 - len(rows)
+        finally:
+            # Prefetching is not needed if iteration is stopped
+            task.cancel()
@@ -1,19 +1,41 @@
+import json
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-from googleapiclient.http import MediaFileUpload
-
+from google_documents.api import media
+from google_documents.api.batch import execute_request, resolved_result
 from google_documents.entities.api_credentials_mixin import ApiCredentialsMixin
 from google_documents.entities.from_itemable import FromItemable
+from google_documents.entities.lazy_field import LazyField
+from google_documents.entities.range import CoalescedRanges, SheetRange, \
+    split_values
+from google_documents.entities.write_buffer import WriteBuffer
 from google_documents.entity_managers.file import GoogleDriveSpreadsheetManager
+from google_documents.entity_managers.query import FilesQuery
 from google_documents.entity_managers.sheet import SheetsManager
+from google_documents.entity_managers.walk import FolderWalk
 from google_documents.settings import MIME_TYPES
 
 
 class GoogleDriveFile(FromItemable, ApiCredentialsMixin):
     id: str
-    name: str
     mime_type = None
 
+    # Executes requests to the API, may be overridden
+    # to execute them in the different way (e.g. asynchronously)
+    _execute_request = staticmethod(execute_request)
+
+    # Returns already known result the same way as `_execute_request`
+    _resolved_result = staticmethod(resolved_result)
+
+    # Fields, loaded from the API on the first access
+    # if they are missing in the file item
+    name = LazyField('name')
+    parent_ids = LazyField('parents')
+    modified_time = LazyField('modifiedTime')
+    version = LazyField('version')
+
     @property
     def _api_service(self):
         return self.files().get_api_service(
@@ -27,22 +49,60 @@ class GoogleDriveFile(FromItemable, ApiCredentialsMixin):
     def filter(cls, *args, **kwargs):
         return cls.files().filter(*args, **kwargs)
 
+    @classmethod
+    def get_by_path(cls, *args, **kwargs):
+        return cls.files().get_by_path(*args, **kwargs)
+
     def __eq__(self, other):
         return self and other and self.id == other.id
 
     def __repr__(self):
-        return f"<{self.__class__.__name__}: {self.id} - {self.name}>"
+        # Representation should not load missing fields
+        return f"<{self.__class__.__name__}: {self.id} - " \
+               f"{self._item.get('name')}>"
 
-    @property
-    def parents(self):
-        # TODO lazy loading of the all files attributes
+    def _get_missing_fields(self):
+        """
+        Returns API names of the lazy fields missing in the file item
+        """
+        return [
+            api_name for api_name in LazyField.get_api_names(type(self))
+            if api_name not in self._item
+        ]
+
+    def _get_missing_fields_request(self, missing_fields):
+        return self._api_service.files().get(
+            fileId=self.id, fields=', '.join(missing_fields))
+
+    def _update_missing_fields(self, item):
+        # Item from the API is not overriding already known fields
+        self._item = {**item, **self._item}
+
+    def _load_missing_fields(self):
+        """
+        Loads all lazy fields missing in the file item by single API call.
+        Loading happens only once, even if some fields
+        are not returned by the API, unless the request has failed
+        """
+        if self._missing_fields_loaded:
+            return
 
-        response = self._api_service.files().get(
-            fileId=self.id, fields='parents'
-        ).execute()
+        missing_fields = self._get_missing_fields()
+        if missing_fields:
+            item = execute_request(
+                self._api_service,
+                self._get_missing_fields_request(missing_fields),
+                batchable=False
+            )
+            self._update_missing_fields(item)
 
-        for parent in response["parents"]:
-            yield GoogleDriveFolder(id=parent)
+        # Failed loading is repeated on the next access
+        self._missing_fields_loaded = True
+
+    @property
+    def parents(self):
+        for parent_id in self.parent_ids or []:
+            yield GoogleDriveFolder(id=parent_id)
 
     @property
     def url(self):
@@ -53,7 +113,13 @@ class GoogleDriveFile(FromItemable, ApiCredentialsMixin):
 
         self.id = id
 
-        self.name = name
+        # Google Drive API item describing the file
+        self._item = {"id": id}
+        self._missing_fields_loaded = False
+
+        # Name is loaded lazily if it is not passed
+        if name is not None:
+            self.name = name
         self.mime_type = mime_type
 
     @classmethod
@@ -61,61 +127,157 @@ class GoogleDriveFile(FromItemable, ApiCredentialsMixin):
         """
         Constructs Google Document from the item, in which Google describe it
         """
-        return cls(
+        file = cls(
             id=item["id"],
             name=item.get("name"),
             mime_type=item.get("mimeType")
         )
+        # Keeping all the requested fields
+        file._item.update(item)
+
+        return file
 
     def copy(self, file_name: str):
         """
         Makes copy of the file
         :param file_name: Destination file name
-        :return: GoogleDriveDocument copy
+        :return: GoogleDriveDocument copy (its future in the batch mode)
         """
-        file_item = self._api_service.files().copy(
-            fileId=self.id, body={"name": file_name}
-        ).execute()
-
-        return self.from_item(file_item)
+        service = self._api_service
+        return self._execute_request(
+            service,
+            service.files().copy(fileId=self.id, body={"name": file_name}),
+            callback=self.from_item
+        )
 
     def delete(self):
         """
         Delets file from the Google Drive
         """
-        return self._api_service.files().delete(
-            fileId=self.id
-        ).execute()
+        service = self._api_service
+        return self._execute_request(
+            service, service.files().delete(fileId=self.id))
+
+    def _update_parents_from_response(self, response):
+        # Keeping known parents up to date
+        self.parent_ids = response.get('parents')
+        return response
 
     def put_to_folder(self, folder):
         """
         Puts the file into folder
         """
         # Calling API
-        return self._api_service.files().update(
-            fileId=self.id,
-            addParents=folder.id,
-            fields='id, parents').execute()
+        service = self._api_service
+        return self._execute_request(
+            service,
+            service.files().update(
+                fileId=self.id,
+                addParents=folder.id,
+                fields='id, parents'),
+            callback=self._update_parents_from_response
+        )
 
 
 class GoogleDriveFolder(GoogleDriveFile):
     mime_type = MIME_TYPES['folder']
 
     def __contains__(self, item):
-        return self in item.parents
+        return self.id in (item.parent_ids or [])
 
     @property
     def url(self):
         return f"https://drive.google.com/drive/folders/{self.id}"
 
+    def _get_children_parent_ids(self):
+        """
+        Returns parents ids of the folder children by their ids,
+        requesting only the ids and parents of the children
+        """
+        manager = self.files()
+
+        files_index = manager._get_files_index()
+        if files_index is not None:
+            children_items = files_index.filter_items(parent_id=self.id)
+        else:
+            children_items = FilesQuery(
+                manager, q=f"'{self.id}' in parents",
+                page_size=manager.page_size,
+                fields=manager._get_fields_mask('parents')
+            )._iter_items()
+
+        return {item['id']: item['parents'] for item in children_items}
+
+    def contains_many(self, files):
+        """
+        Returns list of flags, whether the folder contains each of the files.
+        Known parents of the files are used, for the rest children
+        of the folder are listed once
+        :param files: Files to check
+        """
+        children_parent_ids = None
+        contained = []
+
+        for file in files:
+            # Parents are not loaded file by file
+            parent_ids = file._item.get('parents')
+
+            if parent_ids is None:
+                if children_parent_ids is None:
+                    children_parent_ids = self._get_children_parent_ids()
+
+                parent_ids = children_parent_ids.get(file.id)
+                # Parents of the found children are known now
+                if parent_ids is not None:
+                    file.parent_ids = parent_ids
+
+            contained.append(self.id in (parent_ids or []))
+
+        return contained
+
+    def filter_members(self, files):
+        """
+        Returns files contained in the folder, see `contains_many`
+        :param files: Files to filter
+        """
+        files = list(files)
+        return [
+            file for file, is_contained in zip(files, self.contains_many(files))
+            if is_contained
+        ]
+
     @property
     def children(self):
-        children_items = self._api_service.files().list(
-          q=f"\"{self.id}\" in parents").execute()['files']
+        manager = self.files()
+
+        # Loaded files index answers without the API calls
+        files_index = manager._get_files_index()
+        if files_index is not None:
+            children_items = files_index.filter_items(parent_id=self.id)
+        else:
+            children_items = FilesQuery(
+                manager, q=f"'{self.id}' in parents",
+                page_size=manager.page_size, fields=manager.fields
+            )._iter_items()
 
         for item in children_items:
             yield GoogleDriveFilesFactory.from_item(item)
 
+    def walk(self, max_depth=None, concurrency=None):
+        """
+        Yields files of the folder and its subfolders breadth-first
+        as they arrive. Children of many folders are requested
+        by one query and the queries are sent concurrently.
+        Trashed files are skipped
+        :param max_depth: Depth of the walk, 1 means only children.
+        All the levels are walked if None
+        :param concurrency: Count of the concurrent requests
+        """
+        manager = self.files()
+
+        for item in FolderWalk(manager, self.id, max_depth, concurrency):
+            yield manager._get_typed_file_from_item(item)
+
     def __str__(self):
         return f"{self.name}"
 
@@ -123,26 +285,69 @@ class GoogleDriveFolder(GoogleDriveFile):
 class GoogleDriveDocument(GoogleDriveFile):
     mime_type = MIME_TYPES['document']
 
-    def export(self, file_name, mime_type=MIME_TYPES['docx']):
+    # Size of the chunks in which exported file is downloaded
+    export_chunk_size = media.DEFAULT_CHUNK_SIZE
+
+    def export(self, file_name, mime_type=MIME_TYPES['docx'],
+               chunk_size=None, progress_callback=None):
         """
         Exports content of the file to format specified
-        in the MimeType and writes it to the File
+        in the MimeType and writes it to the File by chunks
+        :param file_name: Path or writable binary file object.
+        File at the path appears only when the export is completed
+        :param mime_type: Format to export
+        :param chunk_size: Size of the downloaded chunks in bytes
+        :param progress_callback: Function called after every chunk
+        with count of the downloaded bytes and total size
         """
-        export_bytes = self._api_service.files().export(
-            fileId=self.id, mimeType=mime_type
-        ).execute()
+        request = self._api_service.files().export_media(
+            fileId=self.id, mimeType=mime_type)
+        chunk_size = chunk_size or self.export_chunk_size
+
+        if hasattr(file_name, "write"):
+            media.download(request, file_name, chunk_size, progress_callback)
+            return
+
+        with media.open_atomically(file_name) as file:
+            media.download(request, file, chunk_size, progress_callback)
+
+    @staticmethod
+    def _write_export(file_name, export_bytes):
+        with media.open_atomically(file_name) as file:
+            file.write(export_bytes)
 
-        open(file_name, "wb+").write(export_bytes)
+    # Size of the chunks in which file is uploaded
+    update_chunk_size = media.DEFAULT_CHUNK_SIZE
 
-    def update(self, file_name, mime_type=MIME_TYPES['docx']):
+    def update(self, file_name, mime_type=MIME_TYPES['docx'],
+               chunk_size=None, session_file=None, progress_callback=None):
+        """
+        Uploads new content of the file by chunks
+        :param file_name: File name, bytes, file-like object
+        or memory-mapped file with the content
+        :param mime_type: Mime type of the content
+        :param chunk_size: Size of the uploaded chunks in bytes,
+        should be multiple of 256 KB
+        :param session_file: File to keep upload session URI in.
+        If upload is interrupted, calling update with the same
+        session file continues it where it stopped
+        :param progress_callback: Function called after every chunk
+        with count of the uploaded bytes and total size
+        """
         # Making media body for the request
-        media_body = MediaFileUpload(file_name, mimetype=mime_type,
-                                     resumable=True)
+        media_body = media.get_media_upload(
+            file_name, mime_type, chunk_size or self.update_chunk_size)
 
-        self._api_service.files().update(
+        request = self._api_service.files().update(
             fileId=self.id,
             media_body=media_body
-        ).execute()
+        )
+
+        return media.upload(
+            request,
+            session=session_file and media.UploadSession(session_file),
+            progress_callback=progress_callback
+        )
 
 
 class GoogleDriveSpreadsheet(GoogleDriveDocument):
@@ -174,27 +379,236 @@ class GoogleDriveSpreadsheet(GoogleDriveDocument):
         :param range_name:
         :return:
         """
-        response = self._sheets_api_service.spreadsheets().values().get(
-            spreadsheetId=self.id, range=range_name).execute()
-        values = response.get('values', [])
+        return self._with_values_version(
+            lambda version: self._read(range_name, version))
+
+    def _read(self, range_name, version=None):
+        if self.values_cache is not None:
+            values = self.values_cache.get(self.id, range_name, version)
+            if values is not None:
+                return self._resolved_result(
+                    self._apply_write_buffer(range_name, values))
+
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().get(
+                spreadsheetId=self.id, range=range_name),
+            callback=lambda response: self._apply_write_buffer(
+                range_name, self._cache_values(
+                    range_name, self._get_values_from_response(response),
+                    version))
+        )
+
+    # Cache of the read values, e.g. `ValuesCache()`, disabled by default
+    values_cache = None
+
+    def _with_values_version(self, function):
+        """
+        Calls function with the version of the spreadsheet
+        if cached values are validated by it, otherwise with None
+        """
+        if self.values_cache is None or not self.values_cache.check_version:
+            return function(None)
+
+        service = self._api_service
+        return self._execute_request(
+            service,
+            service.files().get(fileId=self.id, fields='version'),
+            callback=lambda item: function(item['version'])
+        )
 
+    def _cache_values(self, range_name, values, version=None):
+        if self.values_cache is not None:
+            self.values_cache.set(self.id, range_name, values, version)
         return values
 
-    def batch_read(self, ranges_names: [str]):
+    def _invalidate_values_cache(self, ranges_names, response=None):
         """
-        Reads multiple ranges from the spreadsheet
-        :param ranges_names: List of ranges to get data from
+        Removes cached values of the changed ranges
+        :return: Response of the changing request
+        """
+        if self.values_cache is not None:
+            self.values_cache.invalidate(self.id, ranges_names)
+        return response
+
+    # Buffer of the pending writes within `buffered()`
+    _active_write_buffer = None
+
+    @property
+    def _write_buffer(self):
+        """
+        Buffer of the pending writes or None if requests are sent directly,
+        e.g. by the buffer flushing them
+        """
+        write_buffer = self._active_write_buffer
+        if write_buffer is None or write_buffer.is_detached:
+            return None
+        return write_buffer
+
+    @contextmanager
+    def buffered(self, max_cells=None):
         """
-        response = self._sheets_api_service.spreadsheets().values().batchGet(
-            spreadsheetId=self.id, ranges=ranges_names).execute()
+        Collects writes and clears made within the block and sends them
+        by a few batch requests when the block exits or when count
+        of the pending cells reaches the max. Reads see pending values.
+        Pending changes are dropped if the block raises
+        :param max_cells: Count of the pending cells which triggers flushing
+        """
+        if self._active_write_buffer is not None:
+            yield self._active_write_buffer
+            return
+
+        write_buffer = WriteBuffer(
+            self, self.set_item_value_input_option, max_cells)
+        self._active_write_buffer = write_buffer
+        try:
+            yield write_buffer
+            write_buffer.flush()
+        finally:
+            self._active_write_buffer = None
+
+    def _apply_write_buffer(self, range_name, values):
+        if self._write_buffer is None:
+            return values
+        return self._write_buffer.overlay(range_name, values)
+
+    def read_columns(self, range_name,
+                     value_render_option="UNFORMATTED_VALUE",
+                     date_time_render_option="SERIAL_NUMBER"):
+        """
+        Returns columns of the range. By default values keep their types
+        and dates are returned as serial numbers of days since 1899-12-30.
+        Values cache is not used, pending buffered changes are sent before
+        :param range_name: Range to read
+        :param value_render_option: How values should be represented
+        :param date_time_render_option: How dates should be represented,
+        if values are not formatted
+        """
+        if self._write_buffer is not None:
+            self._write_buffer.flush()
+
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().get(
+                spreadsheetId=self.id, range=range_name,
+                majorDimension="COLUMNS",
+                valueRenderOption=value_render_option,
+                dateTimeRenderOption=date_time_render_option),
+            callback=self._get_values_from_response
+        )
 
+    @staticmethod
+    def _get_values_from_response(value_range):
+        return value_range.get('values', [])
+
+    @classmethod
+    def _get_batch_values_from_response(cls, response):
         value_ranges = response.get('valueRanges', [])
 
         # Extract values from value_ranges
-        values = []
-        for value_range in value_ranges:
-            values.append(value_range.get('values', []))
-        return values
+        return list(map(cls._get_values_from_response, value_ranges))
+
+    # Count of rows read by one request in `read_iter`
+    read_chunk_rows = 1000
+
+    def _get_sheet_rows_count(self, sheet_title):
+        """
+        Returns count of rows in the sheet,
+        the first sheet is used if title is None
+        """
+        sheet = self.sheets[sheet_title] if sheet_title \
+            else self.sheets.all()[0]
+        return sheet.grid_properties.row_count
+
+    def read_iter(self, range_name, chunk_rows=None):
+        """
+        Yields rows of the range, reading it by windows of rows.
+        Next window is fetched while rows of the current one are handled
+        :param range_name: Range to read
+        :param chunk_rows: Count of rows read by one request
+        """
+        sheet_range = SheetRange.parse(range_name)
+
+        rows_count = None
+        if sheet_range.end_row is None:
+            rows_count = self._get_sheet_rows_count(sheet_range.sheet_title)
+
+        windows = sheet_range.split_rows(
+            chunk_rows or self.read_chunk_rows, rows_count)
+        if not windows:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.read, windows[0].to_a1())
+
+            # Trailing empty rows are not returned by the API,
+            # so empty rows are yielded only if there is data after them
+            empty_rows_count = 0
+
+            for index, window in enumerate(windows):
+                rows = future.result()
+
+                if index + 1 < len(windows):
+                    future = executor.submit(
+                        self.read, windows[index + 1].to_a1())
+
+                if rows:
+                    yield from ([] for _ in range(empty_rows_count))
+                    empty_rows_count = 0
+                yield from rows
+
+                empty_rows_count += \
+                    window.end_row - window.start_row + 1 - len(rows)
+
+    def batch_read(self, ranges_names: [str]):
+        """
+        Reads multiple ranges from the spreadsheet,
+        overlapping and adjacent ranges are requested once
+        :param ranges_names: List of ranges to get data from
+        """
+        return self._with_values_version(
+            lambda version: self._batch_read(ranges_names, version))
+
+    def _batch_read(self, ranges_names, version=None):
+        values = {}
+        if self.values_cache is not None:
+            for range_name in ranges_names:
+                cached_values = self.values_cache.get(
+                    self.id, range_name, version)
+                if cached_values is not None:
+                    values[range_name] = cached_values
+
+        missing_ranges_names = [
+            range_name for range_name in ranges_names
+            if range_name not in values
+        ]
+
+        def get_values(fetched_values):
+            for range_name, range_values in zip(missing_ranges_names,
+                                                fetched_values):
+                values[range_name] = \
+                    self._cache_values(range_name, range_values, version)
+
+            return [
+                self._apply_write_buffer(range_name, values[range_name])
+                for range_name in ranges_names
+            ]
+
+        if not missing_ranges_names:
+            return self._resolved_result(get_values([]))
+
+        plan = CoalescedRanges(missing_ranges_names)
+
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().batchGet(
+                spreadsheetId=self.id, ranges=plan.fetched_ranges_names),
+            callback=lambda response: get_values(
+                plan.cut(self._get_batch_values_from_response(response)))
+        )
 
     def batch_write(self, value_ranges, value_input_option="RAW"):
         """
@@ -204,24 +618,107 @@ class GoogleDriveSpreadsheet(GoogleDriveDocument):
         values: [[ 2 dimensional array]]}
         :param value_input_option: How to recognize input data
         """
+        if self._write_buffer is not None:
+            for value_range in value_ranges:
+                self._write_buffer.write(value_range["range"],
+                                         value_range["values"],
+                                         value_input_option)
+            return
+
         # TODO Support of the value
         body = {
             'valueInputOption': value_input_option,
             'data': value_ranges
         }
 
-        return self._sheets_api_service.spreadsheets().values().batchUpdate(
-            spreadsheetId=self.id,
-            body=body).execute()
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.id, body=body),
+            callback=lambda response: self._invalidate_values_cache(
+                [value_range["range"] for value_range in value_ranges],
+                response)
+        )
+
+    # Maximal size of values in the single request of `batch_write_chunked`
+    max_write_request_size = 2 * 1024 * 1024
+
+    def batch_write_chunked(self, value_ranges, value_input_option="RAW",
+                            max_request_size=None, max_workers=None):
+        """
+        Writes to the multiple ranges splitting values by rows
+        into requests not larger than the max size.
+        Requests are sent concurrently within the quotas
+        :param value_ranges: List of objects like
+        {"range": "{sheet name}!{range name}":
+        values: [[ 2 dimensional array]]}
+        :param value_input_option: How to recognize input data
+        :param max_request_size: Maximal size of values in the request
+        :param max_workers: Count of the concurrent requests
+        :return: List of BulkResult, items of which are value ranges
+        written by the request. Failed items may be written again
+        """
+        max_request_size = max_request_size or self.max_write_request_size
+
+        # Packing parts of all value ranges into requests
+        requests_value_ranges, request_size = [], 0
+        for value_range in value_ranges:
+            for part in split_values(value_range["range"],
+                                     value_range["values"],
+                                     max_request_size):
+                part_size = len(json.dumps(part, default=str))
+
+                if not requests_value_ranges \
+                        or request_size + part_size > max_request_size:
+                    requests_value_ranges.append([])
+                    request_size = 0
+
+                requests_value_ranges[-1].append(part)
+                request_size += part_size
+
+        return self.files()._run_bulk(
+            lambda request_value_ranges: self.batch_write(
+                request_value_ranges, value_input_option),
+            requests_value_ranges, max_workers
+        )
+
+    def write_chunked(self, range_name, data, value_input_option="RAW",
+                      max_request_size=None, max_workers=None):
+        """
+        Writes large data into the Google Sheet
+        by concurrent requests not larger than the max size
+        :param range_name: Range to write in
+        :param data: Data to write
+        :param value_input_option: How to recognize input data
+        :param max_request_size: Maximal size of values in the request
+        :param max_workers: Count of the concurrent requests
+        :return: List of BulkResult, items of which are value ranges
+        written by the request. Failed items may be written again
+        """
+        return self.batch_write_chunked(
+            [{"range": range_name, "values": data}],
+            value_input_option, max_request_size, max_workers
+        )
 
     def batch_clear(self, ranges_names: [str]):
         """
         Clears data in spreadsheet ranges
         :param ranges_names: Ranges to clear
         """
-        return self._sheets_api_service.spreadsheets().values().batchClear(
-            spreadsheetId=self.id,
-            body={"ranges": ranges_names}).execute()
+        if self._write_buffer is not None:
+            for range_name in ranges_names:
+                self._write_buffer.clear(range_name)
+            return
+
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().batchClear(
+                spreadsheetId=self.id, body={"ranges": ranges_names}),
+            callback=lambda response: self._invalidate_values_cache(
+                ranges_names, response)
+        )
 
     def get_range(self, range_name):
         warnings.warn("`get_range()` has been renamed to `read()`",
@@ -233,9 +730,18 @@ class GoogleDriveSpreadsheet(GoogleDriveDocument):
         Clears data on spreadsheet at the specified range
         :param range_name: Range to clear
         """
-        return self._sheets_api_service.spreadsheets().values().clear(
-            spreadsheetId=self.id, range=range_name,
-            body={"range": range_name}).execute()
+        if self._write_buffer is not None:
+            return self._write_buffer.clear(range_name)
+
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().clear(
+                spreadsheetId=self.id, range=range_name,
+                body={"range": range_name}),
+            callback=lambda response: self._invalidate_values_cache(
+                [range_name], response)
+        )
 
     def write(self, range_name, data, value_input_option="RAW"):
         """
@@ -244,10 +750,19 @@ class GoogleDriveSpreadsheet(GoogleDriveDocument):
         :param data: Data to write
         :param value_input_option: How to recognize input data
         """
-        return self._sheets_api_service.spreadsheets().values().update(
-            spreadsheetId=self.id, range=range_name,
-            body={"values": data}, valueInputOption=value_input_option
-        ).execute()
+        if self._write_buffer is not None:
+            return self._write_buffer.write(
+                range_name, data, value_input_option)
+
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().values().update(
+                spreadsheetId=self.id, range=range_name,
+                body={"values": data}, valueInputOption=value_input_option),
+            callback=lambda response: self._invalidate_values_cache(
+                [range_name], response)
+        )
 
     @property
     def sheets(self):
@@ -0,0 +1,38 @@
+class LazyField:
+    """
+    Attribute of the Google Drive file, stored in the file item.
+
+    If the field has not been requested from the API,
+    it is loaded on the first access together
+    with all other missing lazy fields of the file
+    """
+
+    def __init__(self, api_name):
+        """
+        :param api_name: Name of the field in the Google Drive API
+        """
+        self.api_name = api_name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        if self.api_name not in instance._item:
+            instance._load_missing_fields()
+
+        return instance._item.get(self.api_name)
+
+    def __set__(self, instance, value):
+        instance._item[self.api_name] = value
+
+    @classmethod
+    def get_api_names(cls, owner):
+        """
+        Returns API names of the all lazy fields of the class
+        """
+        return list(dict.fromkeys(
+            value.api_name
+            for klass in owner.__mro__
+            for value in vars(klass).values()
+            if isinstance(value, cls)
+        ))
@@ -0,0 +1,567 @@
+import json
+import re
+
+# Maximal count of columns in the sheet
+MAX_COLUMN = 18278
+
+# Column letters are limited, because of the maximal count of columns
+_CELL_REGEX = re.compile(r"^([A-Za-z]{0,3})(\d*)$")
+_R1C1_CELL_REGEX = re.compile(r"^[Rr](\d+)[Cc](\d+)$")
+# Single cell with both column and row, e.g. A1 or $B$12
+_FULL_CELL_REGEX = re.compile(r"^\$?[A-Za-z]{1,3}\$?\d+$")
+_SHEET_TITLE_REGEX = re.compile(r"^(?:'((?:[^']|'')+)'|([^'!]+))!(.*)$")
+_QUOTED_TITLE_REGEX = re.compile(r"^'((?:[^']|'')+)'$")
+
+
+def column_letters_to_number(letters):
+    """
+    Converts column letters to 1-based number, e.g. "AB" -> 28
+    """
+    number = 0
+    for letter in letters.upper():
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+def column_number_to_letters(number):
+    """
+    Converts 1-based column number to letters, e.g. 28 -> "AB"
+    """
+    letters = ""
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _start_le(start, other):
+    """
+    Compares bounds, None start means the first row or column
+    """
+    return (start or 1) <= (other or 1)
+
+
+def _end_le(end, other):
+    """
+    Compares ends, None end means no limit
+    """
+    if other is None:
+        return True
+    return end is not None and end <= other
+
+
+def _max_start(start, other):
+    if start is None:
+        return other
+    if other is None:
+        return start
+    return max(start, other)
+
+
+def _min_start(start, other):
+    if start is None or other is None:
+        return None
+    return min(start, other)
+
+
+def _min_end(end, other):
+    if end is None:
+        return other
+    if other is None:
+        return end
+    return min(end, other)
+
+
+def _max_end(end, other):
+    if end is None or other is None:
+        return None
+    return max(end, other)
+
+
+def _touch(start, end, other_start, other_end):
+    """
+    Returns True if intervals overlap or are adjacent
+    """
+    return _end_le((start or 1) - 1, other_end) \
+        and _end_le((other_start or 1) - 1, end)
+
+
+def quote_sheet_title(title):
+    """
+    Quotes sheet title for using in the range name if needed
+    """
+    if re.match(r"^[A-Za-z0-9_]+$", title) \
+            and not _CELL_REGEX.match(title):
+        return title
+
+    escaped_title = title.replace("'", "''")
+    return f"'{escaped_title}'"
+
+
+class SheetRange:
+    """
+    Range of the cells in the sheet.
+
+    Rows and columns are 1-based and inclusive,
+    None bound means that range is not limited from that side
+    """
+
+    def __init__(self, sheet_title=None, start_row=None, start_column=None,
+                 end_row=None, end_column=None):
+        self.sheet_title = sheet_title
+        self.start_row = start_row
+        self.start_column = start_column
+        self.end_row = end_row
+        self.end_column = end_column
+
+    @staticmethod
+    def _parse_cell(cell):
+        r1c1_match = _R1C1_CELL_REGEX.match(cell)
+        if r1c1_match:
+            row, column = r1c1_match.groups()
+            return int(row), int(column)
+
+        # Absolute references like $A$1 are the same cells
+        cell = cell.replace("$", "")
+
+        match = _CELL_REGEX.match(cell)
+        if not match or not cell:
+            raise ValueError(f"`{cell}` is not a valid cell")
+
+        letters, digits = match.groups()
+        return (int(digits) if digits else None,
+                column_letters_to_number(letters) if letters else None)
+
+    @classmethod
+    def parse(cls, range_name):
+        """
+        Parses range in A1 notation, e.g. "'My sheet'!A1:B5", "Sheet1!A:B"
+        or "Sheet1", or R1C1 notation, e.g. "Sheet1!R1C1:R5C2".
+        Bare name without cells, e.g. "Mar", is the title of the sheet
+        or the named range, unless it is a single cell like "A1"
+        """
+        sheet_title, cells = None, range_name
+
+        match = _SHEET_TITLE_REGEX.match(range_name)
+        if match:
+            quoted_title, title, cells = match.groups()
+            sheet_title = quoted_title.replace("''", "'") \
+                if quoted_title else title
+        elif _QUOTED_TITLE_REGEX.match(range_name):
+            return cls(sheet_title=_QUOTED_TITLE_REGEX.match(range_name)
+                       .group(1).replace("''", "'"))
+        elif range_name and ":" not in range_name \
+                and not _FULL_CELL_REGEX.match(range_name) \
+                and not _R1C1_CELL_REGEX.match(range_name):
+            # Whole sheet is referenced by the title
+            return cls(sheet_title=range_name)
+
+        if not cells:
+            return cls(sheet_title=sheet_title)
+
+        start, _, end = cells.partition(":")
+        start_row, start_column = cls._parse_cell(start)
+        end_row, end_column = cls._parse_cell(end) if end \
+            else (start_row, start_column)
+
+        return cls(sheet_title, start_row, start_column, end_row, end_column)
+
+    def _format_cells(self):
+        start_column = column_number_to_letters(self.start_column or 1)
+        end_column = column_number_to_letters(self.end_column or MAX_COLUMN)
+
+        if self.start_column is None and self.end_column is None:
+            if self.start_row is None and self.end_row is None:
+                # Whole sheet
+                return ""
+            if self.end_row is not None:
+                return f"{self.start_row or 1}:{self.end_row}"
+
+        if self.start_row is None and self.end_row is None:
+            return f"{start_column}:{end_column}"
+
+        start = f"{start_column}{self.start_row or 1}"
+        end = f"{end_column}{self.end_row or ''}"
+        return start if start == end else f"{start}:{end}"
+
+    def to_a1(self):
+        """
+        Returns range name in A1 notation
+        """
+        cells = self._format_cells()
+
+        if self.sheet_title is None:
+            return cells
+        if not cells:
+            return quote_sheet_title(self.sheet_title)
+        return f"{quote_sheet_title(self.sheet_title)}!{cells}"
+
+    @property
+    def is_cell(self):
+        return self.start_row is not None \
+            and self.start_column is not None \
+            and self.start_row == self.end_row \
+            and self.start_column == self.end_column
+
+    def split_rows(self, chunk_rows, rows_count=None):
+        """
+        Splits range into the windows of the rows
+        :param chunk_rows: Count of rows in the window
+        :param rows_count: Count of rows in the sheet,
+        is used when range is not limited at the bottom
+        :return: List of the ranges
+        """
+        start_row = self.start_row or 1
+        end_row = self.end_row or rows_count
+        if end_row is None:
+            raise ValueError(
+                "Count of rows is needed to split unlimited range")
+
+        return [
+            SheetRange(self.sheet_title, window_start, self.start_column,
+                       min(window_start + chunk_rows - 1, end_row),
+                       self.end_column)
+            for window_start in range(start_row, end_row + 1, chunk_rows)
+        ]
+
+    def split_columns(self, chunk_columns, columns_count=None):
+        """
+        Splits range into the windows of the columns
+        :param chunk_columns: Count of columns in the window
+        :param columns_count: Count of columns in the sheet,
+        is used when range is not limited at the right
+        :return: List of the ranges
+        """
+        start_column = self.start_column or 1
+        end_column = self.end_column or columns_count
+        if end_column is None:
+            raise ValueError(
+                "Count of columns is needed to split unlimited range")
+
+        return [
+            SheetRange(self.sheet_title, self.start_row, window_start,
+                       self.end_row,
+                       min(window_start + chunk_columns - 1, end_column))
+            for window_start in range(
+                start_column, end_column + 1, chunk_columns)
+        ]
+
+    @property
+    def is_bounded(self):
+        """
+        True if all the bounds of the range are known
+        """
+        return None not in (self.start_row, self.start_column,
+                            self.end_row, self.end_column)
+
+    @property
+    def is_unbounded(self):
+        """
+        True if none of the bounds of the range is known,
+        e.g. for the whole sheet or the named range
+        """
+        return (self.start_row, self.start_column,
+                self.end_row, self.end_column) == (None, None, None, None)
+
+    def _is_same_sheet(self, other):
+        return self.sheet_title == other.sheet_title
+
+    def contains(self, other):
+        """
+        Returns True if other range is inside the range
+        """
+        return self._is_same_sheet(other) \
+            and _start_le(self.start_row, other.start_row) \
+            and _start_le(self.start_column, other.start_column) \
+            and _end_le(other.end_row, self.end_row) \
+            and _end_le(other.end_column, self.end_column)
+
+    def __contains__(self, other):
+        return self.contains(other)
+
+    def intersection(self, other):
+        """
+        Returns range of the cells being in both ranges
+        or None if ranges don't intersect
+        """
+        if not self._is_same_sheet(other):
+            return None
+
+        result = SheetRange(
+            self.sheet_title,
+            _max_start(self.start_row, other.start_row),
+            _max_start(self.start_column, other.start_column),
+            _min_end(self.end_row, other.end_row),
+            _min_end(self.end_column, other.end_column),
+        )
+
+        if not _end_le(result.start_row or 1, result.end_row) \
+                or not _end_le(result.start_column or 1, result.end_column):
+            return None
+        return result
+
+    def union(self, other):
+        """
+        Returns range of the cells being in any of the ranges
+        or None if such cells don't form a rectangular range
+        """
+        if self.contains(other):
+            return self
+        if other.contains(self):
+            return other
+        if not self._is_same_sheet(other):
+            return None
+
+        same_columns = (self.start_column or 1) == (other.start_column or 1) \
+            and self.end_column == other.end_column
+        same_rows = (self.start_row or 1) == (other.start_row or 1) \
+            and self.end_row == other.end_row
+
+        if same_columns and _touch(self.start_row, self.end_row,
+                                   other.start_row, other.end_row):
+            return SheetRange(
+                self.sheet_title,
+                _min_start(self.start_row, other.start_row),
+                self.start_column,
+                _max_end(self.end_row, other.end_row),
+                self.end_column,
+            )
+
+        if same_rows and _touch(self.start_column, self.end_column,
+                                other.start_column, other.end_column):
+            return SheetRange(
+                self.sheet_title,
+                self.start_row,
+                _min_start(self.start_column, other.start_column),
+                self.end_row,
+                _max_end(self.end_column, other.end_column),
+            )
+
+        return None
+
+    def bounding(self, other):
+        """
+        Returns the smallest range containing both ranges
+        or None if they are in different sheets
+        """
+        if not self._is_same_sheet(other):
+            return None
+
+        return SheetRange(
+            self.sheet_title,
+            _min_start(self.start_row, other.start_row),
+            _min_start(self.start_column, other.start_column),
+            _max_end(self.end_row, other.end_row),
+            _max_end(self.end_column, other.end_column),
+        )
+
+    def cut(self, values, sub_range):
+        """
+        Returns values of the sub range from the values of the range,
+        trimming trailing empty rows and cells the same way the API does
+        :param values: Values of the range as returned by the API
+        :param sub_range: Range inside the range
+        """
+        row_offset = (sub_range.start_row or 1) - (self.start_row or 1)
+        column_offset = \
+            (sub_range.start_column or 1) - (self.start_column or 1)
+
+        rows = values[row_offset:]
+        if sub_range.end_row is not None:
+            rows = rows[:sub_range.end_row - (sub_range.start_row or 1) + 1]
+
+        column_end = None
+        if sub_range.end_column is not None:
+            column_end = column_offset + sub_range.end_column - \
+                (sub_range.start_column or 1) + 1
+
+        return trim_values([row[column_offset:column_end] for row in rows])
+
+    def __eq__(self, other):
+        return isinstance(other, SheetRange) and vars(self) == vars(other)
+
+    def __hash__(self):
+        return hash(tuple(vars(self).values()))
+
+    def __str__(self):
+        return self.to_a1()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.to_a1()}>"
+
+
+def split_values(range_name, values, max_size):
+    """
+    Splits values to write by rows, so JSON of every part
+    is not larger than the max size (unless single row is larger)
+    :param range_name: Range to write values in
+    :param values: Two-dimensional list of values
+    :param max_size: Maximal size of the part in bytes
+    :return: List of {"range": range name, "values": values} parts.
+    Values are not split if the range has no start cell, since it may be
+    a named range whose location is unknown
+    """
+    sheet_range = SheetRange.parse(range_name)
+    if sheet_range.start_row is None and sheet_range.start_column is None:
+        return [{"range": range_name, "values": values}]
+
+    start_row = sheet_range.start_row or 1
+    start_column = sheet_range.start_column or 1
+
+    # Single cell is the top left corner of the written values
+    end_column = sheet_range.end_column
+    if sheet_range.is_cell:
+        end_column = None
+
+    def make_part(offset, rows):
+        part_end_column = end_column or \
+            start_column + max(map(len, rows), default=1) - 1
+        part_range = SheetRange(
+            sheet_range.sheet_title, start_row + offset, start_column,
+            start_row + offset + len(rows) - 1, part_end_column)
+        return {"range": part_range.to_a1(), "values": rows}
+
+    parts = []
+    part_offset, part_rows, part_size = 0, [], 0
+
+    for offset, row in enumerate(values):
+        row_size = len(json.dumps(row, default=str)) + 1
+
+        if part_rows and part_size + row_size > max_size:
+            parts.append(make_part(part_offset, part_rows))
+            part_offset, part_rows, part_size = offset, [], 0
+
+        part_rows.append(row)
+        part_size += row_size
+
+    if part_rows:
+        parts.append(make_part(part_offset, part_rows))
+
+    return parts
+
+
+def trim_values(values):
+    """
+    Removes trailing empty cells and rows the same way the API does
+    """
+    result = []
+    for row in values:
+        row = list(row)
+        while row and row[-1] == "":
+            row.pop()
+        result.append(row)
+
+    while result and not result[-1]:
+        result.pop()
+    return result
+
+
+def merge_range(ranges, sheet_range):
+    """
+    Adds range to the list of ranges, merging it with the ranges
+    which form a rectangular range together with it.
+    Overlapping ranges are merged into their bounding range,
+    which may contain a few cells of neither of them
+    :return: New list of ranges
+    """
+    ranges = list(ranges)
+
+    merged = True
+    while merged:
+        merged = False
+        for index, other in enumerate(ranges):
+            union = other.union(sheet_range)
+            if union is None \
+                    and other.intersection(sheet_range) is not None:
+                union = other.bounding(sheet_range)
+            if union is not None:
+                sheet_range = union
+                del ranges[index]
+                merged = True
+                break
+
+    ranges.append(sheet_range)
+    return ranges
+
+
+class CoalescedRanges:
+    """
+    Plan of reading multiple ranges by the minimal count of requested ranges,
+    duplicated, nested, adjacent and overlapping ranges of the sheet
+    are read once
+    """
+
+    def __init__(self, ranges_names):
+        """
+        :param ranges_names: List of ranges to get data from
+        """
+        self.ranges_names = list(ranges_names)
+
+        parsed_ranges = [self._parse(name) for name in self.ranges_names]
+
+        merged_ranges = []
+        for sheet_range in parsed_ranges:
+            if sheet_range is not None:
+                merged_ranges = merge_range(merged_ranges, sheet_range)
+
+        # Ranges kept untouched are requested by their original names
+        original_names = {}
+        for name, sheet_range in zip(self.ranges_names, parsed_ranges):
+            original_names.setdefault(sheet_range, name)
+
+        self.fetched_ranges = []
+        self.fetched_ranges_names = []
+        self._sources = []
+        for name, sheet_range in zip(self.ranges_names, parsed_ranges):
+            if sheet_range is None:
+                fetched_range = None
+                fetched_name = name
+            else:
+                fetched_range = next(
+                    merged for merged in merged_ranges
+                    if merged.contains(sheet_range))
+                fetched_name = original_names.get(
+                    fetched_range, fetched_range.to_a1())
+
+            if fetched_name not in self.fetched_ranges_names:
+                self.fetched_ranges.append(fetched_range)
+                self.fetched_ranges_names.append(fetched_name)
+
+            self._sources.append(
+                (self.fetched_ranges_names.index(fetched_name), sheet_range))
+
+    @staticmethod
+    def _parse(range_name):
+        """
+        Returns parsed range or None if it can't be coalesced
+        """
+        try:
+            sheet_range = SheetRange.parse(range_name)
+        except ValueError:
+            return None
+
+        # Bare name could be a named range, so it is read as is
+        if sheet_range.is_unbounded:
+            return None
+        return sheet_range
+
+    def cut(self, fetched_values):
+        """
+        Returns values of the requested ranges from the values
+        of the fetched ranges
+        :param fetched_values: List of values in order of
+        `fetched_ranges_names`
+        """
+        result = []
+        for fetched_index, sheet_range in self._sources:
+            values = fetched_values[fetched_index]
+            fetched_range = self.fetched_ranges[fetched_index]
+
+            if sheet_range is not None and sheet_range != fetched_range:
+                values = fetched_range.cut(values, sheet_range)
+
+            result.append(values)
+        return result
+
+    def __len__(self):
+        return len(self.fetched_ranges_names)
@@ -1,4 +1,5 @@
 from google_documents.entities.from_itemable import FromItemable
+from google_documents.entities.range import quote_sheet_title
 
 
 class Color(FromItemable):
@@ -51,7 +52,18 @@ class Sheet(FromItemable):
         """
         Returns range name in the sheet
         """
-        return f"{self.title}!{sheet_range_name}"
+        return f"{quote_sheet_title(self.title)}!{sheet_range_name}"
+
+    def buffered(self, max_cells=None):
+        """
+        Collects writes and clears of the spreadsheet made within the block
+        and sends them by a few batch requests, see
+        `GoogleDriveSpreadsheet.buffered`
+        :param max_cells: Count of the pending cells which triggers flushing
+        """
+        assert self.spreadsheet, "Spreadsheet for the sheet is unknown."
+
+        return self.spreadsheet.buffered(max_cells)
 
     def read(self, range_name):
         """
@@ -64,6 +76,18 @@ class Sheet(FromItemable):
             self._get_spreadsheet_range_name(range_name)
         )
 
+    def read_iter(self, range_name, chunk_rows=None):
+        """
+        Yields rows of the range in the sheet, reading it by windows of rows
+        :param range_name: Range to read
+        :param chunk_rows: Count of rows read by one request
+        """
+        assert self.spreadsheet, "Spreadsheet for the sheet is unknown."
+
+        return self.spreadsheet.read_iter(
+            self._get_spreadsheet_range_name(range_name), chunk_rows
+        )
+
     def write(self, range_name, data, value_input_option="RAW"):
         """
         Writes data into the sheet
@@ -144,16 +168,26 @@ class Sheet(FromItemable):
     def delete(self):
         assert self.spreadsheet, "Spreadsheet for the sheet is unknown."
 
-        response = self.spreadsheet._sheets_api_service. \
-            spreadsheets().batchUpdate(
-                spreadsheetId=self.spreadsheet.id,
-                body={"requests": [{"deleteSheet": {"sheetId": self.id}}]}
-            ).execute()
+        spreadsheet = self.spreadsheet
 
-        # Delete spreadhseet from sheet
-        self.spreadsheet = None
+        def on_deleted(response):
+            spreadsheet._invalidate_values_cache(
+                [quote_sheet_title(self.title)])
 
-        return response
+            # Delete spreadhseet from sheet
+            self.spreadsheet = None
+
+            return response
+
+        service = spreadsheet._sheets_api_service
+        return spreadsheet._execute_request(
+            service,
+            service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet.id,
+                body={"requests": [{"deleteSheet": {"sheetId": self.id}}]}
+            ),
+            callback=on_deleted
+        )
 
     @classmethod
     def from_item(cls, item):
@@ -0,0 +1,112 @@
+"""
+Cache of the spreadsheets values
+"""
+import copy
+
+from google_documents.api.cache import MemoryCacheBackend
+from google_documents.entities.range import SheetRange
+
+
+class ValuesCache:
+    """
+    Caches values of the ranges read from the spreadsheets.
+    Changes made via the spreadsheet invalidate cached ranges
+    overlapping changed ones
+    """
+    # Seconds the values are cached for
+    ttl = 60
+
+    # If True, cached values are used only if the version
+    # of the spreadsheet has not changed, what costs a light request
+    check_version = False
+
+    def __init__(self, backend=None, ttl=None, check_version=None):
+        """
+        :param backend: CacheBackend storing the values,
+        in-memory one is used by default
+        :param ttl: Seconds the values are cached for
+        :param check_version: Whether to check the version
+        of the spreadsheet before using cached values
+        """
+        self.backend = backend or MemoryCacheBackend()
+        self.ttl = ttl or self.ttl
+        if check_version is not None:
+            self.check_version = check_version
+
+    @staticmethod
+    def _get_key_prefix(spreadsheet_id):
+        return f"{spreadsheet_id}!"
+
+    def _get_key(self, spreadsheet_id, range_name):
+        return self._get_key_prefix(spreadsheet_id) + range_name
+
+    def get(self, spreadsheet_id, range_name, version=None):
+        """
+        Returns cached values of the range or None
+        :param version: Current version of the spreadsheet,
+        values cached for another version are not returned
+        """
+        entry = self.backend.get(self._get_key(spreadsheet_id, range_name))
+        if entry is None:
+            return None
+        if version is not None and entry["version"] != version:
+            return None
+
+        # Cached values are protected from changes made by the caller
+        return copy.deepcopy(entry["values"])
+
+    def set(self, spreadsheet_id, range_name, values, version=None,
+            ttl=None):
+        """
+        Caches values of the range
+        :param version: Version of the spreadsheet values are read from
+        :param ttl: Seconds the values are cached for
+        """
+        self.backend.set(
+            self._get_key(spreadsheet_id, range_name),
+            {"version": version, "values": copy.deepcopy(values)},
+            ttl or self.ttl
+        )
+
+    @staticmethod
+    def _overlap(range_name, other_range_name):
+        """
+        Returns True if ranges may overlap.
+        Unknown ranges (like named ones) are considered overlapping
+        """
+        try:
+            sheet_range = SheetRange.parse(range_name)
+            other = SheetRange.parse(other_range_name)
+        except ValueError:
+            return True
+
+        # Bare name may be a named range, which bounds are unknown
+        if sheet_range.is_unbounded or other.is_unbounded:
+            return True
+
+        # Range without the sheet title is in the first sheet,
+        # which is unknown here
+        if sheet_range.sheet_title is None or other.sheet_title is None:
+            sheet_range = copy.copy(sheet_range)
+            sheet_range.sheet_title = other.sheet_title
+
+        return sheet_range.intersection(other) is not None
+
+    def invalidate(self, spreadsheet_id, ranges_names=None):
+        """
+        Removes cached ranges overlapping the ranges
+        :param ranges_names: Changed ranges,
+        all the cached ranges of the spreadsheet are removed if None
+        """
+        prefix = self._get_key_prefix(spreadsheet_id)
+
+        for key in self.backend.keys(prefix):
+            cached_range_name = key[len(prefix):]
+
+            if ranges_names is None or any(
+                    self._overlap(cached_range_name, range_name)
+                    for range_name in ranges_names):
+                self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
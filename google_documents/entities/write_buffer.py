@@ -0,0 +1,256 @@
+"""
+Write-behind buffer of the spreadsheet values
+"""
+import threading
+from contextlib import contextmanager
+
+from google_documents.entities.range import SheetRange, merge_range, \
+    trim_values
+
+
+class WriteBuffer:
+    """
+    Collects writes and clears of the spreadsheet
+    and sends them by a few batch requests
+    """
+    # Count of the pending cells which triggers flushing
+    max_cells = 10000
+
+    def __init__(self, spreadsheet, value_input_option="RAW",
+                 max_cells=None):
+        """
+        :param spreadsheet: Spreadsheet to write to
+        :param value_input_option: How to recognize written data
+        :param max_cells: Count of the pending cells which triggers flushing
+        """
+        self.spreadsheet = spreadsheet
+        self.value_input_option = value_input_option
+        self.max_cells = max_cells or self.max_cells
+
+        # Cleared ranges are sent before the written cells,
+        # so cells written before clearing are dropped
+        self._clears = []
+        self._cells = {}
+        self._lock = threading.RLock()
+
+        # Requests of the threads flushing the buffer are sent directly
+        self._local = threading.local()
+        self._first_sheet_title = None
+
+    @property
+    def is_detached(self):
+        """
+        True if requests of the current thread are sent directly
+        """
+        return getattr(self._local, "detached", False)
+
+    def _get_first_sheet_title(self):
+        with self._lock:
+            if self._first_sheet_title is None:
+                self._first_sheet_title = \
+                    self.spreadsheet.sheets.all()[0].title
+            return self._first_sheet_title
+
+    def _parse(self, range_name):
+        """
+        Returns parsed range or None if it can't be buffered
+        """
+        try:
+            sheet_range = SheetRange.parse(range_name)
+        except ValueError:
+            return None
+
+        # Bare name may be a named range, which bounds are unknown
+        if sheet_range.is_unbounded:
+            return None
+
+        # Range without the title is on the first sheet,
+        # so its cells are the same as the ones addressed by the title
+        if sheet_range.sheet_title is None:
+            sheet_range.sheet_title = self._get_first_sheet_title()
+        return sheet_range
+
+    @staticmethod
+    def _get_cell_range(cell):
+        sheet_title, row, column = cell
+        return SheetRange(sheet_title, row, column, row, column)
+
+    @contextmanager
+    def _detached(self):
+        """
+        Sends requests of the spreadsheet made by the current thread
+        directly within the block, other threads keep buffering
+        """
+        detached = self.is_detached
+        self._local.detached = True
+        try:
+            yield
+        finally:
+            self._local.detached = detached
+
+    def write(self, range_name, values, value_input_option=None):
+        """
+        Adds values written to the range
+        :param range_name: Range to write in
+        :param values: Data to write
+        :param value_input_option: How to recognize input data
+        """
+        value_input_option = value_input_option or self.value_input_option
+        sheet_range = self._parse(range_name)
+
+        if sheet_range is None \
+                or value_input_option != self.value_input_option:
+            self.flush()
+            with self._detached():
+                return self.spreadsheet.write(
+                    range_name, values, value_input_option)
+
+        start_row = sheet_range.start_row or 1
+        start_column = sheet_range.start_column or 1
+
+        with self._lock:
+            for row_offset, row in enumerate(values):
+                for column_offset, value in enumerate(row):
+                    # None doesn't change the cell
+                    if value is not None:
+                        self._cells[(sheet_range.sheet_title,
+                                     start_row + row_offset,
+                                     start_column + column_offset)] = value
+
+            needs_flush = len(self._cells) >= self.max_cells
+
+        if needs_flush:
+            self.flush()
+
+    def clear(self, range_name):
+        """
+        Adds cleared range
+        :param range_name: Range to clear
+        """
+        sheet_range = self._parse(range_name)
+
+        if sheet_range is None:
+            self.flush()
+            with self._detached():
+                return self.spreadsheet.clear(range_name)
+
+        with self._lock:
+            self._cells = {
+                cell: value for cell, value in self._cells.items()
+                if not sheet_range.contains(self._get_cell_range(cell))
+            }
+            self._clears = merge_range(self._clears, sheet_range)
+
+    def overlay(self, range_name, values):
+        """
+        Returns values of the range read from the API
+        with the pending changes applied
+        :param range_name: Read range
+        :param values: Values of the range returned by the API
+        """
+        sheet_range = self._parse(range_name)
+
+        with self._lock:
+            if sheet_range is None or not (self._clears or self._cells):
+                return values
+
+            start_row = sheet_range.start_row or 1
+            start_column = sheet_range.start_column or 1
+            grid = [list(row) for row in values]
+
+            for cleared_range in self._clears:
+                intersection = sheet_range.intersection(cleared_range)
+                if intersection is None:
+                    continue
+
+                # Cells out of the grid are empty already
+                rows = grid[(intersection.start_row or 1) - start_row:]
+                if intersection.end_row is not None:
+                    rows = rows[:intersection.end_row -
+                                (intersection.start_row or 1) + 1]
+
+                column_offset = (intersection.start_column or 1) - start_column
+                for row in rows:
+                    column_end = len(row)
+                    if intersection.end_column is not None:
+                        column_end = min(
+                            column_end,
+                            intersection.end_column - start_column + 1)
+
+                    for column_index in range(column_offset, column_end):
+                        row[column_index] = ""
+
+            for cell, value in self._cells.items():
+                if not sheet_range.contains(self._get_cell_range(cell)):
+                    continue
+
+                _, row, column = cell
+                row_index, column_index = \
+                    row - start_row, column - start_column
+
+                while len(grid) <= row_index:
+                    grid.append([])
+                grid_row = grid[row_index]
+                while len(grid_row) <= column_index:
+                    grid_row.append("")
+                grid_row[column_index] = value
+
+        return trim_values(grid)
+
+    @staticmethod
+    def _get_value_ranges(cells):
+        """
+        Packs cells into the value ranges of the consecutive rows,
+        gaps between the cells are filled by None, which keeps them intact
+        """
+        rows = {}
+        for (sheet_title, row, column), value in cells.items():
+            rows.setdefault((sheet_title, row), {})[column] = value
+
+        blocks = []
+        for sheet_title, row in sorted(
+                rows, key=lambda key: (key[0] is not None, key[0] or "",
+                                       key[1])):
+            if blocks and blocks[-1][0] == sheet_title \
+                    and blocks[-1][2] == row - 1:
+                blocks[-1][2] = row
+            else:
+                blocks.append([sheet_title, row, row])
+
+        value_ranges = []
+        for sheet_title, start_row, end_row in blocks:
+            blocks_rows = [rows[(sheet_title, row)]
+                           for row in range(start_row, end_row + 1)]
+            start_column = min(min(row) for row in blocks_rows)
+            end_column = max(max(row) for row in blocks_rows)
+
+            value_ranges.append({
+                "range": SheetRange(sheet_title, start_row, start_column,
+                                    end_row, end_column).to_a1(),
+                "values": [
+                    [row.get(column)
+                     for column in range(start_column, max(row) + 1)]
+                    for row in blocks_rows
+                ]
+            })
+        return value_ranges
+
+    def flush(self):
+        """
+        Sends pending clears and writes
+        """
+        with self._lock:
+            clears, self._clears = self._clears, []
+            cells, self._cells = self._cells, {}
+
+            with self._detached():
+                if clears:
+                    self.spreadsheet.batch_clear(
+                        [sheet_range.to_a1() for sheet_range in clears])
+                if cells:
+                    self.spreadsheet.batch_write(
+                        self._get_value_ranges(cells),
+                        self.value_input_option)
+
+    def __len__(self):
+        return len(self._cells)
@@ -0,0 +1,80 @@
+import asyncio
+
+from google_documents.api.bulk import BulkResult
+from google_documents.entity_managers.file import (
+    GoogleDriveDocumentManager,
+    GoogleDriveSpreadsheetManager
+)
+from google_documents.entity_managers.query import AsyncFilesQuery, \
+    AsyncIdFilesQuery
+
+
+class AsyncManagerMixin:
+    """
+    Makes manager methods awaitable,
+    sending requests via async client of the file class
+    """
+    query_cls = AsyncFilesQuery
+    id_query_cls = AsyncIdFilesQuery
+
+    # Lookups in the local index can't be awaited
+    files_index = None
+
+    def _execute_request(self, service, request,
+                         callback=None, error_callback=None, batchable=True):
+        return self.file_cls.async_client.execute_request(
+            service, request, callback, error_callback, batchable)
+
+    @staticmethod
+    def batch(max_batch_size=None):
+        raise TypeError("Batch mode is not supported by asynchronous "
+                        "managers, requests are already sent concurrently")
+
+    def changes(self, *args, **kwargs):
+        raise TypeError("Changes feed is not supported by asynchronous "
+                        "managers, use the synchronous one")
+
+    def get_by_path(self, *args, **kwargs):
+        raise TypeError("Lookup by path is not supported by asynchronous "
+                        "managers, use the synchronous one")
+
+    @staticmethod
+    async def _run_bulk(function, items, max_workers=None):
+        """
+        Awaits function results for all the items concurrently.
+        Count of concurrent requests is limited by the async client
+        """
+        items = list(items)
+        results = await asyncio.gather(
+            *map(function, items), return_exceptions=True)
+
+        return [
+            BulkResult(item, error=result)
+            if isinstance(result, Exception)
+            else BulkResult(item, result=result)
+            for item, result in zip(items, results)
+        ]
+
+    async def in_bulk(self, ids):
+        """
+        Returns dictionary of files by their ids, fetching them concurrently.
+        Not found files are omitted
+        """
+        ids = list(ids)
+        files = await asyncio.gather(*map(self.get, ids))
+
+        return {
+            id_: file_obj
+            for id_, file_obj in zip(ids, files)
+            if file_obj is not None
+        }
+
+
+class AsyncGoogleDriveDocumentManager(
+        AsyncManagerMixin, GoogleDriveDocumentManager):
+    pass
+
+
+class AsyncGoogleDriveSpreadsheetManager(
+        AsyncManagerMixin, GoogleDriveSpreadsheetManager):
+    pass
@@ -0,0 +1,51 @@
+from google_documents.entities.sheet import Sheet
+from google_documents.entity_managers.sheet import SheetsManager
+
+
+class AsyncSheetsManager(SheetsManager):
+    """
+    Awaitable version of the sheets manager.
+    Sheets are fetched by `await spreadsheet.sheets.all()`,
+    iteration and lookups by title are available after that
+    """
+
+    @property
+    def _sheets(self):
+        if self._sheets_objects is None:
+            raise TypeError("Sheets can't be fetched without blocking "
+                            "the event loop, "
+                            "use `await spreadsheet.sheets.all()` first")
+
+        return self._sheets_objects
+
+    async def all(self):
+        if self._sheets_objects is None:
+            response = await self.spreadsheet.async_client.execute(
+                self._get_fetch_request())
+            self._set_sheets_from_response(response)
+
+        return self._sheets_objects
+
+    async def create(self, **kwargs):
+        """
+        Creates sheet in the spreadsheet
+        """
+        sheet = Sheet(**kwargs)
+
+        await self.batch_create([sheet])
+
+        return sheet
+
+    async def batch_create(self, sheets: [Sheet]):
+        """
+        Creates sheets in the Spreadsheet from the Sheet files
+        """
+        # Sheets are fetched before, so new ones are appended only once
+        await self.all()
+
+        response = await self.spreadsheet.async_client.execute(
+            self._get_batch_create_request(sheets))
+
+        self._update_sheets_from_response(sheets, response)
+
+        return response
@@ -0,0 +1,147 @@
+from google_documents.api.media import StateFile
+
+
+class FileChange:
+    """
+    Change of the file in the Google Drive
+    """
+
+    def __init__(self, file_id, removed=False, time=None, file=None):
+        """
+        :param file_id: Id of the changed file
+        :param removed: True if the file has been deleted
+        or access to it has been lost
+        :param time: Time of the change in RFC 3339 format
+        :param file: Changed file, None if the file is removed
+        """
+        self.file_id = file_id
+        self.removed = removed
+        self.time = time
+        self.file = file
+
+    @classmethod
+    def from_item(cls, item, get_file_from_item):
+        """
+        :param item: Change item of the API
+        :param get_file_from_item: Function building file from its item
+        """
+        file_item = item.get('file')
+
+        return cls(
+            file_id=item['fileId'],
+            removed=item.get('removed', False),
+            time=item.get('time'),
+            file=get_file_from_item(file_item) if file_item else None
+        )
+
+    def __repr__(self):
+        if self.removed:
+            return f"<{self.__class__.__name__}: {self.file_id} removed>"
+        return f"<{self.__class__.__name__}: {self.file!r}>"
+
+
+class PageTokenFile(StateFile):
+    """
+    Keeps the page token of the changes in the file
+    """
+
+
+class ChangesFeed:
+    """
+    Lazy feed of the files changes.
+
+    Pages of the changes are requested while iterating.
+    Page token is moved to the next page only when all the changes
+    of the page have been consumed, so an interrupted sync repeats
+    the unfinished page instead of losing its changes
+    """
+
+    def __init__(self, manager, start_page_token=None, page_size=None,
+                 fields=None, token_file=None):
+        """
+        :param manager: Manager that builds the changed files
+        :param start_page_token: Token to start from. If None, the token
+        saved in the token file is used, otherwise only changes made
+        after the first iteration are returned
+        :param page_size: Count of changes requested per API call
+        :param fields: Fields of the file item to request
+        :param token_file: Path to the file keeping the page token
+        """
+        self.manager = manager
+        self.page_size = page_size
+        self.fields = fields
+        self.token_file = PageTokenFile(token_file) if token_file else None
+
+        self.page_token = start_page_token
+        if self.page_token is None and self.token_file is not None:
+            self.page_token = self.token_file.load()
+
+    def get_start_page_token(self):
+        """
+        Returns token of the changes made after the call
+        """
+        service = self.manager._api_service
+        return self.manager._execute_request(
+            service,
+            service.changes().getStartPageToken(),
+            callback=lambda response: response['startPageToken'],
+            batchable=False
+        )
+
+    def _set_page_token(self, page_token):
+        self.page_token = page_token
+        if self.token_file is not None:
+            self.token_file.save(page_token)
+
+    def _list_page(self, page_token):
+        service = self.manager._api_service
+        return self.manager._execute_request(
+            service,
+            service.changes().list(
+                pageToken=page_token,
+                pageSize=self.page_size,
+                spaces='drive',
+                includeRemoved=True,
+                fields=f'nextPageToken, newStartPageToken, '
+                       f'changes(changeType, fileId, removed, time, '
+                       f'file({self.fields}))'),
+            # Next page can't be requested without the previous one
+            batchable=False
+        )
+
+    def _iter_items(self):
+        if self.page_token is None:
+            self._set_page_token(self.get_start_page_token())
+
+        while True:
+            response = self._list_page(self.page_token)
+            yield from response.get('changes', [])
+
+            # The last page has the token for the future changes
+            if 'newStartPageToken' in response:
+                self._set_page_token(response['newStartPageToken'])
+                return
+            self._set_page_token(response['nextPageToken'])
+
+    def _is_file_change(self, item):
+        """
+        Skips changes of the shared drives and files of other types,
+        if the manager is for the specific type.
+        Removed files are kept, because their type is unknown
+        """
+        if item.get('changeType', 'file') != 'file':
+            return False
+
+        mime_type = self.manager.file_cls.mime_type
+        file_item = item.get('file')
+        return not mime_type or file_item is None \
+            or file_item.get('mimeType') == mime_type
+
+    def __iter__(self):
+        for item in self._iter_items():
+            if self._is_file_change(item):
+                yield FileChange.from_item(
+                    item, self.manager._get_typed_file_from_item)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} page_token={self.page_token}>"
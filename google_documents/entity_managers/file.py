@@ -1,18 +1,19 @@
-# Google account scopes
+import copy
 import json
 import os
 import re
 from warnings import warn
 
-import googleapiclient
-from google.oauth2 import service_account
-from googleapiclient import discovery
-
+from google_documents.api.batch import Batch, execute_request
+from google_documents.api.bulk import BulkOperation
+from google_documents.api.cache import MemoryCacheBackend
+from google_documents.api.credentials import SCOPES, credentials_pool
+from google_documents.api.services import service_registry
 from google_documents.entities.from_itemable import FromItemable
-
-SCOPES = [
-    'https://www.googleapis.com/auth/drive'  # Google Drive full access
-]
+from google_documents.entity_managers.changes import ChangesFeed
+from google_documents.entity_managers.path import PathResolver
+from google_documents.entity_managers.query import FilesQuery, \
+    IdFilesQuery, IndexedFilesQuery
 
 
 class GoogleDriveDocumentManager:
@@ -30,18 +31,89 @@ class GoogleDriveDocumentManager:
     resource_name = 'drive'
     version = 3
 
+    # Count of files requested per one `files().list` call
+    page_size = 1000
+    # Fields of the file items requested from the API.
+    # Other fields are loaded lazily on the first access
+    fields = 'id, name, mimeType, parents'
+
+    # Fields which are always requested,
+    # because they are needed to construct the file object
+    required_fields = ('id', 'mimeType')
+
+    # Executes requests to the API, may be overridden
+    # to execute them in the different way (e.g. asynchronously)
+    _execute_request = staticmethod(execute_request)
+
+    # Class of the lazy search results
+    query_cls = FilesQuery
+    id_query_cls = IdFilesQuery
+
+    # CacheBackend of the files items, e.g. `MemoryCacheBackend()`.
+    # Cached items are used only if the version of the file has not changed,
+    # which is checked by a light request. Disabled by default
+    items_cache = None
+    # Seconds the files items are cached for
+    items_cache_ttl = 24 * 60 * 60
+
+    # Local `FilesIndex`, which answers the lookups by name, mime type
+    # and folder, when it is loaded. Disabled by default
+    files_index = None
+
+    # CacheBackend of the files and folders resolved by `get_by_path`,
+    # shared by all the managers. May be set to None to disable caching
+    paths_cache = MemoryCacheBackend(max_size=10000)
+    # Seconds the resolved files are cached for
+    paths_cache_ttl = 10 * 60
+
+    # Built services are shared across all managers and entities
+    service_registry = service_registry
+    credentials_pool = credentials_pool
+
     @classmethod
     def get_api_service(cls, credentials, resource_name=None, version=None):
-        return discovery.build(
+        return cls.service_registry.get(
             resource_name or cls.resource_name,
             f"v{version or cls.version}",
-            credentials=credentials
+            credentials
         )
 
     @property
     def _api_service(self):
         return self.get_api_service(self._get_api_credentials())
 
+    @staticmethod
+    def _to_camel_case(name):
+        """
+        Replace pythonic names like 'some_cool_parameter'
+        To google names like 'someCoolParameter'
+        """
+        return re.sub('_[a-z]', lambda p: p.group(0)[-1].upper(), name)
+
+    def _get_fields_mask(self, fields):
+        """
+        Returns fields mask for the API from the fields names
+        :param fields: Pythonic or API names of the fields
+        or comma separated fields mask
+        """
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(',')]
+
+        api_fields = [self._to_camel_case(field) for field in fields]
+
+        return ', '.join(dict.fromkeys(
+            [*self.required_fields, *api_fields]))
+
+    def only(self, *fields):
+        """
+        Returns manager requesting only specified fields of the files,
+        e.g. GoogleDriveFile.files().only('name', 'modified_time')
+        :param fields: Pythonic or API names of the fields
+        """
+        manager = copy.copy(self)
+        manager.fields = self._get_fields_mask(fields)
+        return manager
+
     def using(self, service_account_file):
         if not os.path.isfile(service_account_file):
             raise ValueError(f"`{service_account_file}` is not a file")
@@ -57,8 +129,7 @@ class GoogleDriveDocumentManager:
             "in $GOOGLE_DOCUMENT_SERVICE_JSON " \
             "environment variable."
 
-        return service_account.Credentials.from_service_account_file(
-            service_account_file, scopes=SCOPES)
+        return cls.credentials_pool.get(service_account_file)
 
     @classmethod
     def get_default_api_credentials(cls):
@@ -80,30 +151,254 @@ class GoogleDriveDocumentManager:
     def service_account_credentials(self):
         return json.loads(open(self._service_account_file).read())
 
-    def _get_item(self, id):
-        return self._api_service.files().get(
-            fileId=id).execute()
+    def _get_items_cache_key(self, id):
+        return f"{id}!{self.fields}"
+
+    def _get_item(self, id, callback=None, error_callback=None):
+        """
+        Fetches file item, if there is items cache, the item
+        is fetched only if the version of the cached one is outdated
+        :param callback: Function, transforming the item
+        :param error_callback: Function, returning result on the HTTP error
+        """
+        service = self._api_service
+        if self.items_cache is None:
+            return self._execute_request(
+                service,
+                service.files().get(fileId=id, fields=self.fields),
+                callback=callback,
+                error_callback=error_callback
+            )
+
+        key = self._get_items_cache_key(id)
+        cached_item = self.items_cache.get(key)
+
+        def cache_item(item):
+            self.items_cache.set(
+                key, copy.deepcopy(item), self.items_cache_ttl)
+            return callback(item) if callback else item
+
+        def forget_item(error):
+            self.items_cache.delete(key)
+            if error_callback:
+                return error_callback(error)
+            raise error
+
+        def fetch_item(version_item=None):
+            if version_item is not None \
+                    and version_item['version'] == cached_item['version']:
+                item = copy.deepcopy(cached_item)
+                return callback(item) if callback else item
+
+            return self._execute_request(
+                service,
+                service.files().get(
+                    fileId=id,
+                    fields=self._get_fields_mask(f"{self.fields}, version")),
+                callback=cache_item,
+                error_callback=forget_item
+            )
+
+        if cached_item is None:
+            return fetch_item()
+
+        return self._execute_request(
+            service,
+            service.files().get(fileId=id, fields='version'),
+            callback=fetch_item,
+            error_callback=forget_item
+        )
+
+    def _index_items(self, items):
+        if self.files_index is not None:
+            self.files_index.add_items(items)
+
+    def _get_file_from_item(self, item):
+        self._index_items([item])
+
+        file_obj = self.file_cls.from_item(item)
+        file_obj.set_api_credentials(self._get_api_credentials())
+        return file_obj
+
+    def _get_typed_file_from_item(self, item):
+        """
+        Returns file of the class respective to the item mime type
+        """
+        # Entities import managers, so the factory is imported here
+        from google_documents.entities.file import GoogleDriveFilesFactory
+
+        file_obj = GoogleDriveFilesFactory.from_item(item)
+        file_obj.set_api_credentials(self._get_api_credentials())
+        return file_obj
+
+    @staticmethod
+    def _get_not_found_file(error):
+        if error.resp.status == 404:
+            return None
+        raise error
 
     def get(self, id):
-        try:
-            item = self._get_item(id)
+        """
+        Returns file by id or None, if file is not found.
+        In the batch mode returns future of the file
+        """
+        return self._get_item(
+            id,
+            callback=self._get_file_from_item,
+            error_callback=self._get_not_found_file
+        )
+
+    def get_by_path(self, path, root_id='root'):
+        """
+        Returns file by its path like "/Reports/2026/summary"
+        or None, if file is not found. If there are several files
+        with the same name, the first one is returned
+        :param root_id: Id of the folder the path starts from,
+        "My Drive" by default
+        """
+        item = PathResolver(
+            self, self.paths_cache, self.paths_cache_ttl, root_id
+        ).resolve(path)
 
-            file_obj = self.file_cls.from_item(item)
-            file_obj.set_api_credentials(self._get_api_credentials())
-            return file_obj
-        except googleapiclient.errors.HttpError:
+        if item is None:
             return None
+        # Cached item is protected from changes made by the file
+        return self._get_file_from_item(copy.deepcopy(item))
+
+    @staticmethod
+    def batch(max_batch_size=None):
+        """
+        Returns context, in which `get`, `copy`, `delete` and `put_to_folder`
+        calls are queued and sent as batch requests on exit, e.g.
+        with GoogleDriveFile.files().batch():
+            copy_future = file.copy("Copy")
+        """
+        return Batch(max_batch_size)
+
+    def in_bulk(self, ids):
+        """
+        Returns dictionary of files by their ids, fetching them
+        by batch requests. Not found files are omitted
+        """
+        with self.batch():
+            futures = {id_: self.get(id_) for id_ in ids}
+
+        files = {}
+        for id_, future in futures.items():
+            file_obj = future.result()
+            if file_obj is not None:
+                files[id_] = file_obj
+        return files
+
+    @staticmethod
+    def _run_bulk(function, items, max_workers=None):
+        return BulkOperation(function, max_workers).run(items)
+
+    def bulk_copy(self, files_names, max_workers=None):
+        """
+        Copies files concurrently
+        :param files_names: Iterable of (file, copy file name) pairs
+        :param max_workers: Count of the threads
+        :return: List of BulkResult with copies as results
+        """
+        return self._run_bulk(
+            lambda file_name: file_name[0].copy(file_name[1]),
+            files_names, max_workers
+        )
+
+    def bulk_export(self, documents_names, mime_type=None, max_workers=None):
+        """
+        Exports documents to the files concurrently
+        :param documents_names: Iterable of (document, file name) pairs
+        :param mime_type: Format to export, document default is used if None
+        :param max_workers: Count of the threads
+        :return: List of BulkResult
+        """
+        def export(document_name):
+            document, file_name = document_name
+            if mime_type:
+                return document.export(file_name, mime_type=mime_type)
+            return document.export(file_name)
+
+        return self._run_bulk(export, documents_names, max_workers)
+
+    def bulk_delete(self, files, max_workers=None):
+        """
+        Deletes files concurrently
+        :param files: Iterable of files
+        :param max_workers: Count of the threads
+        :return: List of BulkResult
+        """
+        return self._run_bulk(lambda file: file.delete(), files, max_workers)
+
+    def changes(self, start_page_token=None, page_size=None, fields=None,
+                token_file=None):
+        """
+        Returns lazy feed of the files changes, e.g.
+        for change in GoogleDriveFile.files().changes(token_file="token"):
+            print(change.file_id, change.removed, change.file)
+        :param start_page_token: Token to start from. If None, the token
+        saved in the token file is used, otherwise only changes made
+        after the first iteration are returned
+        :param page_size: Count of changes requested per API call
+        :param fields: Fields of the files to request,
+        manager fields are used by default
+        :param token_file: Path to the file, where the page token is saved
+        as the changes are consumed, to resume the sync from it
+        """
+        return ChangesFeed(
+            self,
+            start_page_token=start_page_token,
+            page_size=page_size or self.page_size,
+            fields=self._get_fields_mask(fields) if fields else self.fields,
+            token_file=token_file
+        )
+
+    def _get_files_index(self):
+        """
+        Returns files index if it can answer the lookups,
+        refreshing it if it is outdated
+        """
+        if self.files_index is None:
+            return None
+
+        self.files_index.refresh_if_needed(self)
+        return self.files_index if self.files_index.is_loaded else None
+
+    @staticmethod
+    def _get_index_lookup(params):
+        """
+        Returns lookup of the files index for the filter parameters
+        or None if they can't be looked up in the index
+        """
+        lookup = {}
+        for param, value in params.items():
+            # Names are not looked up, as `name contains` of the API
+            # matches prefixes of the words tokenized by the Drive
+            if param == 'folder':
+                lookup['parent_id'] = value.id
+            elif param == 'mime_type':
+                lookup['mime_type'] = value
+            elif param == 'trashed' and type(value) == bool:
+                lookup['trashed'] = value
+            else:
+                return None
+        return lookup
 
     @staticmethod
     def _get_filter_folder_query(folder):
         return f"'{folder.id}' in parents"
 
-    def all(self):
-        return self.filter()
+    def all(self, page_size=None):
+        return self.filter(page_size=page_size)
 
-    def filter(self, **kwargs):
+    def filter(self, page_size=None, fields=None, **kwargs):
         """
         Filters files according to passed parameters
+        :param page_size: Count of files requested per API call
+        :param fields: Fields of the files to request,
+        manager fields are used by default
+        :return: Lazy query, requesting pages of files while iterating
         """
         special_query_getters = {
             "folder": self._get_filter_folder_query
@@ -116,8 +411,8 @@ class GoogleDriveDocumentManager:
             warn("Filtering by id is not allowed by Google API. Using `get` for getting file by id")
             id_ = kwargs.pop('id')
 
-            files = self.filter(**kwargs)
-            return [file for file in files if file.id == id_]
+            files = self.filter(page_size=page_size, fields=fields, **kwargs)
+            return self.id_query_cls(files, id_)
 
         # Add mime type to search exactly files of the respective type
         # (Search only documents when we're calling
@@ -125,13 +420,18 @@ class GoogleDriveDocumentManager:
         if self.file_cls.mime_type:
             kwargs['mime_type'] = self.file_cls.mime_type
 
+        fields = self._get_fields_mask(fields) if fields else self.fields
+
+        index = self._get_files_index()
+        lookup = self._get_index_lookup(kwargs)
+        if index is not None and lookup is not None \
+                and index.has_fields(fields):
+            return IndexedFilesQuery(self, index, lookup)
+
         # Getting format query
         params_queries = []
         for param, value in kwargs.items():
-            # Replace pythonic parameters like 'some_cool_parameter'
-            # To google parameter like 'someCoolParameter'
-            param_camel_case = re.sub(
-                '_[a-z]', lambda p: p.group(0)[-1].upper(), param)
+            param_camel_case = self._to_camel_case(param)
 
             # Getting search query for every parameter
             if param in special_query_getters:
@@ -150,17 +450,11 @@ class GoogleDriveDocumentManager:
         # Getting total query
         q = ' and '.join(params_queries)
 
-        response = self._api_service.files().list(
-            q=q,
-            spaces='drive',
-            fields='files(id, name, mimeType, parents)').execute()
-
-        files_items = response.get('files', [])
-
-        result = []
-        for file_item in files_items:
-            result.append(self.file_cls.from_item(file_item))
-        return result
+        return self.query_cls(
+            self, q,
+            page_size=page_size or self.page_size,
+            fields=fields
+        )
 
 
 class GoogleDriveSpreadsheetManager(GoogleDriveDocumentManager):
@@ -176,8 +470,10 @@ class GoogleDriveSpreadsheetManager(GoogleDriveDocumentManager):
         )
 
     def create(self, title):
-        item = self._sheets_api_service.spreadsheets().create(
-            body={"properties": {"title": title}}
-        ).execute()
-
-        return self.file_cls.from_item(item)
+        service = self._sheets_api_service
+        return self._execute_request(
+            service,
+            service.spreadsheets().create(
+                body={"properties": {"title": title}}),
+            callback=self.file_cls.from_item
+        )
@@ -0,0 +1,262 @@
+import copy
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from google_documents.entity_managers.query import FilesQuery
+
+
+class FilesIndex:
+    """
+    Local SQLite index of the Google Drive files metadata.
+
+    The index is loaded by `refresh` and is kept up to date
+    by the changes feed on the following refreshes. Loaded index
+    answers the files lookups by mime type and folder
+    without the API calls
+    """
+    # Fields of the files items stored in the index
+    fields = 'id, name, mimeType, parents, modifiedTime, trashed'
+
+    # Count of items written to the database at once
+    write_chunk_size = 1000
+
+    # Seconds to wait for the database locked by another process
+    timeout = 30
+
+    def __init__(self, file_name=":memory:", refresh_interval=None):
+        """
+        :param file_name: Path to the database file
+        :param refresh_interval: If set, lookups refresh the index
+        when it is older than the interval in seconds
+        """
+        self.file_name = file_name
+        self.refresh_interval = refresh_interval
+
+        self._connection = sqlite3.connect(
+            file_name, timeout=self.timeout, check_same_thread=False)
+        self._lock = threading.RLock()
+
+        with self._transaction() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    id TEXT PRIMARY KEY, name TEXT, mime_type TEXT,
+                    modified_time TEXT, trashed INTEGER, parents TEXT
+                );
+                CREATE INDEX IF NOT EXISTS files_name ON files (name);
+                CREATE INDEX IF NOT EXISTS files_mime_type
+                    ON files (mime_type);
+                CREATE TABLE IF NOT EXISTS parents (
+                    parent_id TEXT, file_id TEXT,
+                    PRIMARY KEY (parent_id, file_id)
+                );
+                CREATE INDEX IF NOT EXISTS parents_file_id
+                    ON parents (file_id);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY, value TEXT
+                );
+            """)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock, self._connection:
+            yield self._connection
+
+    def _get_meta(self, key):
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    @property
+    def is_loaded(self):
+        """
+        True if the index has all the files and can answer lookups
+        """
+        return self._get_meta('page_token') is not None
+
+    def has_fields(self, fields):
+        """
+        Returns True if the index has all the fields of the fields mask
+        """
+        index_fields = {field.strip() for field in self.fields.split(',')}
+        return {field.strip() for field in fields.split(',')} <= index_fields
+
+    def add_items(self, items):
+        """
+        Adds or updates files items, missing fields are kept intact
+        """
+        with self._transaction() as connection:
+            for item in items:
+                parents = item.get('parents')
+                trashed = item.get('trashed')
+
+                connection.execute(
+                    "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET "
+                    "name = COALESCE(excluded.name, name), "
+                    "mime_type = COALESCE(excluded.mime_type, mime_type), "
+                    "modified_time = "
+                    "COALESCE(excluded.modified_time, modified_time), "
+                    "trashed = COALESCE(excluded.trashed, trashed), "
+                    "parents = COALESCE(excluded.parents, parents)",
+                    (item['id'], item.get('name'), item.get('mimeType'),
+                     item.get('modifiedTime'),
+                     None if trashed is None else int(trashed),
+                     None if parents is None else json.dumps(parents)))
+
+                if parents is not None:
+                    connection.execute(
+                        "DELETE FROM parents WHERE file_id = ?",
+                        (item['id'],))
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO parents VALUES (?, ?)",
+                        [(parent_id, item['id']) for parent_id in parents])
+
+    def remove(self, ids):
+        with self._transaction() as connection:
+            for id_ in ids:
+                connection.execute("DELETE FROM files WHERE id = ?", (id_,))
+                connection.execute(
+                    "DELETE FROM parents WHERE file_id = ?", (id_,))
+
+    @staticmethod
+    def _get_item_from_row(row):
+        id_, name, mime_type, modified_time, trashed, parents = row
+
+        item = {
+            'id': id_,
+            'name': name,
+            'mimeType': mime_type,
+            'modifiedTime': modified_time,
+            'trashed': None if trashed is None else bool(trashed),
+            'parents': None if parents is None else json.loads(parents),
+        }
+        return {key: value for key, value in item.items() if value is not None}
+
+    def get_item(self, id):
+        """
+        Returns file item by id or None if it is not in the index
+        """
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT * FROM files WHERE id = ?", (id,)).fetchone()
+        return self._get_item_from_row(row) if row else None
+
+    def filter_items(self, name=None, mime_type=None, parent_id=None,
+                     trashed=None, limit=None):
+        """
+        Returns files items matching all the passed conditions
+        :param name: Exact name of the file
+        :param mime_type: Mime type of the file
+        :param parent_id: Id of the folder containing the file
+        :param trashed: Whether the file is in the trash
+        :param limit: Maximal count of the items
+        """
+        query = "SELECT files.* FROM files"
+        conditions, params = [], []
+
+        if parent_id is not None:
+            query += " JOIN parents ON parents.file_id = files.id"
+            conditions.append("parents.parent_id = ?")
+            params.append(parent_id)
+        if name is not None:
+            conditions.append("files.name = ?")
+            params.append(name)
+        if mime_type is not None:
+            conditions.append("files.mime_type = ?")
+            params.append(mime_type)
+        if trashed is not None:
+            conditions.append("files.trashed = ?")
+            params.append(int(trashed))
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY files.name, files.id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._transaction() as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [self._get_item_from_row(row) for row in rows]
+
+    def _load(self, manager):
+        """
+        Loads all the files available for the manager
+        """
+        feed = manager.changes(fields=self.fields)
+        # Changes made while loading are applied on the next refresh
+        page_token = feed.get_start_page_token()
+
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM files")
+            connection.execute("DELETE FROM parents")
+
+        items = []
+        query = FilesQuery(manager, q='', page_size=manager.page_size,
+                           fields=self.fields)
+        for item in query._iter_items():
+            items.append(item)
+            if len(items) >= self.write_chunk_size:
+                self.add_items(items)
+                items = []
+        self.add_items(items)
+
+        self._set_meta('page_token', page_token)
+
+    def _apply_changes(self, manager, page_token):
+        feed = manager.changes(page_token, fields=self.fields)
+
+        for item in feed._iter_items():
+            if item.get('changeType', 'file') != 'file':
+                continue
+
+            if item.get('removed'):
+                self.remove([item['fileId']])
+            elif item.get('file'):
+                self.add_items([item['file']])
+
+        self._set_meta('page_token', feed.page_token)
+
+    def refresh(self, manager):
+        """
+        Loads the index on the first call,
+        later applies only changes made since the previous refresh
+        :param manager: Manager sending the requests
+        """
+        # Items fetched by the refresh are added by the index itself
+        manager = copy.copy(manager)
+        manager.files_index = None
+
+        with self._lock:
+            page_token = self._get_meta('page_token')
+            if page_token is None:
+                self._load(manager)
+            else:
+                self._apply_changes(manager, page_token)
+
+            self._set_meta('refreshed_at', str(time.time()))
+
+    def refresh_if_needed(self, manager):
+        """
+        Refreshes the index if it is older than the refresh interval
+        """
+        if self.refresh_interval is None:
+            return
+
+        with self._lock:
+            refreshed_at = self._get_meta('refreshed_at')
+            if refreshed_at is None or \
+                    time.time() - float(refreshed_at) > self.refresh_interval:
+                self.refresh(manager)
+
+    def close(self):
+        self._connection.close()
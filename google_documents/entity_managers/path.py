@@ -0,0 +1,123 @@
+from google_documents.entity_managers.query import FilesQuery
+from google_documents.settings import MIME_TYPES
+
+
+class PathResolver:
+    """
+    Resolves paths like "/Reports/2026/summary" to the files items
+    by the exact name queries, one per path component.
+
+    Children found by their parent and name are cached, so paths
+    with shared prefixes resolve the prefix only once. Cached items
+    may be outdated for the cache TTL, if files are renamed or moved
+    """
+
+    def __init__(self, manager, cache=None, ttl=None, root_id='root'):
+        """
+        :param manager: Manager sending the requests
+        :param cache: CacheBackend of the resolved children and paths
+        :param ttl: Seconds the resolved items are cached for
+        :param root_id: Id of the folder the paths start from,
+        "My Drive" by default
+        """
+        self.manager = manager
+        self.cache = cache
+        self.ttl = ttl
+        self.root_id = root_id
+
+        # Files of different accounts and fields are cached separately
+        self._key_prefix = \
+            f"{manager._service_account_file}!{manager.fields}!"
+
+    @staticmethod
+    def split_path(path):
+        """
+        Returns names of the path components
+        """
+        return [name for name in path.split('/') if name]
+
+    @staticmethod
+    def _quote(name):
+        escaped_name = name.replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{escaped_name}'"
+
+    def _get_cached(self, key):
+        if self.cache is None:
+            return None
+        return self.cache.get(self._key_prefix + key)
+
+    def _set_cached(self, key, value):
+        if self.cache is not None:
+            self.cache.set(self._key_prefix + key, value, self.ttl)
+
+    def _list_children(self, parent_id, name):
+        """
+        Returns items of the not trashed children with the exact name
+        """
+        files_index = self.manager._get_files_index()
+        if files_index is not None:
+            return files_index.filter_items(
+                name=name, parent_id=parent_id, trashed=False)
+
+        query = FilesQuery(
+            self.manager,
+            q=f"name = {self._quote(name)} and '{parent_id}' in parents "
+              f"and trashed = false",
+            page_size=self.manager.page_size,
+            fields=self.manager.fields
+        )
+        return list(query._iter_items())
+
+    def get_children(self, parent_id, name):
+        """
+        Returns items of the children with the name, using the cache
+        """
+        key = f"child!{parent_id}/{name}"
+
+        items = self._get_cached(key)
+        if items is None:
+            items = self._list_children(parent_id, name)
+            self._set_cached(key, items)
+        return items
+
+    @staticmethod
+    def _get_first(items, mime_type):
+        """
+        Returns the first item of the mime type, the first of any type
+        if the mime type is None, because names in a folder are not unique
+        """
+        return next((
+            item for item in items
+            if mime_type is None or item.get('mimeType') == mime_type
+        ), None)
+
+    def resolve(self, path):
+        """
+        Returns item of the file at the path or None if it is not found
+        """
+        names = self.split_path(path)
+        if not names:
+            return None
+
+        # Files of the path are found by the mime type of the manager
+        mime_type = self.manager.file_cls.mime_type
+        path_key = f"path!{mime_type}!{self.root_id}/{'/'.join(names)}"
+        item = self._get_cached(path_key)
+        if item is not None:
+            return item
+
+        parent_id = self.root_id
+        for name in names[:-1]:
+            folder_item = self._get_first(
+                self.get_children(parent_id, name), MIME_TYPES['folder'])
+            if folder_item is None:
+                return None
+            parent_id = folder_item['id']
+
+        item = self._get_first(
+            self.get_children(parent_id, names[-1]),
+            self.manager.file_cls.mime_type)
+
+        if item is not None:
+            self._set_cached(path_key, item)
+        return item
@@ -0,0 +1,236 @@
+import itertools
+
+
+class FilesQuery:
+    """
+    Lazy result of the Google Drive files search.
+
+    Pages are requested only when iteration reaches them,
+    so only one page of the results is kept in memory at a time.
+    """
+
+    # Count of items shown in the representation
+    repr_items_count = 20
+
+    def __init__(self, manager, q, page_size=None, fields=None):
+        """
+        :param manager: Manager that builds search results
+        :param q: Google Drive search query
+        :param page_size: Count of files requested per API call
+        :param fields: Fields of the file item to request
+        """
+        self.manager = manager
+        self.q = q
+        self.page_size = page_size
+        self.fields = fields
+
+    def _list_page(self, page_token, page_size):
+        service = self.manager._api_service
+        return self.manager._execute_request(
+            service,
+            service.files().list(
+                q=self.q,
+                spaces='drive',
+                pageSize=page_size,
+                pageToken=page_token,
+                fields=f'nextPageToken, files({self.fields})'),
+            # Next page can't be requested without the previous one
+            batchable=False
+        )
+
+    def _get_page_size(self, limit):
+        """
+        Returns count of files to request,
+        not exceeding the limit of files needed
+        """
+        if limit is None:
+            return self.page_size
+        return min(self.page_size or limit, limit)
+
+    @staticmethod
+    def _get_page_items(response, limit):
+        items = response.get('files', [])
+        return items if limit is None else items[:limit]
+
+    def _iter_items(self, limit=None):
+        """
+        Yields file items following pages tokens
+        :param limit: Maximal count of items to be yielded.
+        Is used to request no more items than needed
+        """
+        page_token = None
+
+        while True:
+            response = self._list_page(
+                page_token, self._get_page_size(limit))
+
+            items = self._get_page_items(response, limit)
+            self.manager._index_items(items)
+            yield from items
+
+            if limit is not None:
+                limit -= len(items)
+
+            page_token = response.get('nextPageToken')
+            if not page_token or limit == 0:
+                return
+
+    def _iter_files(self, limit=None):
+        for item in self._iter_items(limit):
+            yield self.manager.file_cls.from_item(item)
+
+    def __iter__(self):
+        return self._iter_files()
+
+    def __getitem__(self, item):
+        """
+        Allows getting single file by index using query[5]
+        or list of files using query[10:20].
+        Only pages containing requested files are fetched
+        """
+        if isinstance(item, slice):
+            if (item.start or 0) < 0 or (item.stop or 0) < 0:
+                raise ValueError("Negative indexing is not supported")
+
+            return list(itertools.islice(
+                self._iter_files(item.stop), item.start, item.stop, item.step
+            ))
+
+        if item < 0:
+            raise ValueError("Negative indexing is not supported")
+
+        files = self[item:item + 1]
+        if not files:
+            raise IndexError("Query index out of range")
+        return files[0]
+
+    def first(self):
+        """
+        Returns first found file or None, if there is no files
+        """
+        files = self[:1]
+        return files[0] if files else None
+
+    def __repr__(self):
+        items = list(map(repr, self[:self.repr_items_count + 1]))
+        if len(items) > self.repr_items_count:
+            items[-1] = "..."
+
+        return f"<{self.__class__.__name__} [{', '.join(items)}]>"
+
+
+class IndexedFilesQuery(FilesQuery):
+    """
+    Result of the Google Drive files search,
+    answered by the local files index without the API calls
+    """
+
+    def __init__(self, manager, index, lookup):
+        """
+        :param manager: Manager that builds search results
+        :param index: Loaded FilesIndex
+        :param lookup: Keyword arguments of `FilesIndex.filter_items`
+        """
+        super().__init__(manager, q=None)
+        self.index = index
+        self.lookup = lookup
+
+    def _iter_items(self, limit=None):
+        yield from self.index.filter_items(limit=limit, **self.lookup)
+
+
+class IdFilesQuery(FilesQuery):
+    """
+    Result of the Google Drive files search filtered by the file id,
+    which is not supported by the search query.
+    Pages are requested only until the file is found
+    """
+
+    def __init__(self, query, id_):
+        """
+        :param query: Query of the files to look the file up in
+        :param id_: ID of the file
+        """
+        super().__init__(query.manager, query.q, query.page_size,
+                         query.fields)
+        self.query = query
+        self.id = id_
+
+    def _iter_items(self, limit=None):
+        if limit == 0:
+            return
+
+        for item in self.query._iter_items():
+            if item.get('id') == self.id:
+                yield item
+                return
+
+
+class AsyncFilesQuery(FilesQuery):
+    """
+    Lazy result of the Google Drive files search
+    for the asynchronous managers, iterated using `async for`
+    """
+
+    async def _aiter_items(self, limit=None):
+        page_token = None
+
+        while True:
+            response = await self._list_page(
+                page_token, self._get_page_size(limit))
+
+            items = self._get_page_items(response, limit)
+            self.manager._index_items(items)
+            for item in items:
+                yield item
+
+            if limit is not None:
+                limit -= len(items)
+
+            page_token = response.get('nextPageToken')
+            if not page_token or limit == 0:
+                return
+
+    async def _aiter_files(self, limit=None):
+        async for item in self._aiter_items(limit):
+            yield self.manager.file_cls.from_item(item)
+
+    def __aiter__(self):
+        return self._aiter_files()
+
+    def __iter__(self):
+        raise TypeError(f"{self.__class__.__name__} "
+                        f"should be iterated using `async for`")
+
+    def __getitem__(self, item):
+        raise TypeError(f"{self.__class__.__name__} does not support "
+                        f"indexing, use `to_list()` instead")
+
+    async def to_list(self, limit=None):
+        """
+        Returns list of the found files
+        :param limit: Maximal count of files to return
+        """
+        return [file async for file in self._aiter_files(limit)]
+
+    async def first(self):
+        files = await self.to_list(limit=1)
+        return files[0] if files else None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} q=\"{self.q}\">"
+
+
+class AsyncIdFilesQuery(IdFilesQuery, AsyncFilesQuery):
+    """
+    Result of the asynchronous files search filtered by the file id
+    """
+
+    async def _aiter_items(self, limit=None):
+        if limit == 0:
+            return
+
+        async for item in self.query._aiter_items():
+            if item.get('id') == self.id:
+                yield item
+                return
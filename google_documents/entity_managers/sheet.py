@@ -17,18 +17,26 @@ class SheetsManager:
     def __init__(self, spreadsheet):
         self.spreadsheet = spreadsheet
 
-    def _fetch(self):
-        sheets_items = self.spreadsheet._sheets_api_service.spreadsheets().get(
+    def _get_fetch_request(self):
+        return self.spreadsheet._sheets_api_service.spreadsheets().get(
             spreadsheetId=self.spreadsheet.id,
             fields='sheets.properties'
-        ).execute().get("sheets", [])
+        )
 
+    def _set_sheets_from_response(self, response):
         self._sheets_objects = []
-        for sheet_item in sheets_items:
+        for sheet_item in response.get("sheets", []):
             sheet = Sheet.from_item(sheet_item)
             sheet.assign_spreadsheet(self.spreadsheet)
             self._sheets_objects.append(sheet)
 
+    def _fetch(self):
+        self._set_sheets_from_response(self.spreadsheet._execute_request(
+            self.spreadsheet._sheets_api_service,
+            self._get_fetch_request(),
+            batchable=False
+        ))
+
     def __len__(self):
         return len(self._sheets)
 
@@ -86,16 +94,23 @@ class SheetsManager:
 
         return sheet
 
-    def batch_create(self, sheets: [Sheet]):
-        """
-        Creates sheets in the Spreadsheet from the Sheet files
-        """
-        response = self.spreadsheet._sheets_api_service.\
+    def _get_batch_create_request(self, sheets: [Sheet]):
+        return self.spreadsheet._sheets_api_service.\
             spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet.id,
                 body={"requests": list(map(
                     self._get_add_sheet_request, sheets))}
-            ).execute()
+            )
+
+    def batch_create(self, sheets: [Sheet]):
+        """
+        Creates sheets in the Spreadsheet from the Sheet files
+        """
+        response = self.spreadsheet._execute_request(
+            self.spreadsheet._sheets_api_service,
+            self._get_batch_create_request(sheets),
+            batchable=False
+        )
 
         # Append new sheets to sheets collection
         self._update_sheets_from_response(sheets, response)
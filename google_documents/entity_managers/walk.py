@@ -0,0 +1,147 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from google_documents.entity_managers.query import FilesQuery
+from google_documents.settings import MIME_TYPES
+
+
+class FolderWalk:
+    """
+    Breadth-first traversal of the folders tree, yielding files items.
+
+    Children of many folders are requested by one query and pages
+    of the queries are requested concurrently. Next level is requested
+    as soon as its folders are found, without waiting for the whole
+    previous level. Trashed files are skipped
+    """
+
+    # Count of the folders combined in one query
+    parents_per_query = 50
+
+    # Count of the concurrent requests
+    concurrency = 4
+
+    def __init__(self, manager, folder_id, max_depth=None, concurrency=None,
+                 fields=None):
+        """
+        :param manager: Manager sending the requests
+        :param folder_id: Id of the folder to walk
+        :param max_depth: Depth of the walk, 1 means only children.
+        All the levels are walked if None
+        :param concurrency: Count of the concurrent requests
+        :param fields: Fields of the files to request,
+        manager fields are used by default
+        """
+        self.manager = manager
+        self.folder_id = folder_id
+        self.max_depth = max_depth
+        self.concurrency = concurrency or self.concurrency
+
+        # Parents of the items are needed to build the tree
+        self.fields = manager._get_fields_mask(
+            f"{fields or manager.fields}, parents")
+
+    def _get_query(self, parent_ids):
+        parents_query = " or ".join(
+            f"'{parent_id}' in parents" for parent_id in parent_ids)
+
+        return FilesQuery(
+            self.manager,
+            q=f"({parents_query}) and trashed = false",
+            page_size=self.manager.page_size,
+            fields=self.fields
+        )
+
+    def _is_walked_folder(self, item, depth):
+        """
+        Returns True if children of the item are walked
+        :param depth: Depth of the item
+        """
+        return item.get('mimeType') == MIME_TYPES['folder'] and \
+            (self.max_depth is None or depth < self.max_depth)
+
+    def _iter_index_items(self, files_index):
+        level, depth, walked_ids = [self.folder_id], 1, {self.folder_id}
+
+        while level and (self.max_depth is None or depth <= self.max_depth):
+            next_level = []
+
+            for parent_id in level:
+                for item in files_index.filter_items(parent_id=parent_id):
+                    if item.get('trashed'):
+                        continue
+
+                    if self._is_walked_folder(item, depth) \
+                            and item['id'] not in walked_ids:
+                        walked_ids.add(item['id'])
+                        next_level.append(item['id'])
+                    yield item
+
+            level, depth = next_level, depth + 1
+
+    def _iter_api_items(self):
+        # Ids of the folders, which children are not requested yet,
+        # by the depth of the children
+        pending_ids = {}
+        # Running requests of the pages with their depth and query
+        running = {}
+        walked_ids = {self.folder_id}
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        def submit(depth, query, page_token=None):
+            future = executor.submit(
+                query._list_page, page_token, query.page_size)
+            running[future] = (depth, query)
+
+        def submit_pending():
+            for depth, parent_ids in pending_ids.items():
+                # Incomplete group is requested only when
+                # no more folders of the level can be found
+                is_level_found = all(
+                    running_depth >= depth
+                    for running_depth, _ in running.values())
+
+                while len(parent_ids) >= self.parents_per_query \
+                        or (parent_ids and is_level_found):
+                    submit(depth,
+                           self._get_query(
+                               parent_ids[:self.parents_per_query]))
+                    del parent_ids[:self.parents_per_query]
+
+        try:
+            submit(1, self._get_query([self.folder_id]))
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                items = []
+                for future in done:
+                    depth, query = running.pop(future)
+                    response = future.result()
+
+                    page_token = response.get('nextPageToken')
+                    if page_token:
+                        submit(depth, query, page_token)
+
+                    page_items = response.get('files', [])
+                    for item in page_items:
+                        if self._is_walked_folder(item, depth) \
+                                and item['id'] not in walked_ids:
+                            walked_ids.add(item['id'])
+                            pending_ids.setdefault(depth + 1, []) \
+                                .append(item['id'])
+                    items.extend(page_items)
+
+                # Requests are sent before the items are handled
+                submit_pending()
+
+                self.manager._index_items(items)
+                yield from items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter__(self):
+        files_index = self.manager._get_files_index()
+        if files_index is not None:
+            return self._iter_index_items(files_index)
+        return self._iter_api_items()
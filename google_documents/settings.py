@@ -4,4 +4,5 @@ MIME_TYPES = {
             'wordprocessingml.document',
     'document': 'application/vnd.google-apps.document',
     'spreadsheet': 'application/vnd.google-apps.spreadsheet',
+    'csv': 'text/csv',
 }
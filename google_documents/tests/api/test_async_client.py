@@ -0,0 +1,146 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from aiohttp import web
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient import discovery
+from googleapiclient.errors import HttpError
+
+from google_documents.api.async_client import AsyncClient
+from google_documents.api.scheduler import RequestScheduler, TokenBucket
+
+MAX_CONCURRENCY = 2
+
+
+class AsyncClientTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.running_requests = 0
+        self.max_running_requests = 0
+
+        app = web.Application()
+        app.router.add_get(
+            "/v4/spreadsheets/{id}/values/{range}", self.handle_values)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        # Service sending requests to the local server
+        self.service = discovery.build(
+            "sheets", "v4",
+            credentials=AnonymousCredentials(),
+            static_discovery=True,
+            client_options={"api_endpoint": f"http://127.0.0.1:{port}/"}
+        )
+        self.client = AsyncClient(max_concurrency=MAX_CONCURRENCY)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def handle_values(self, request):
+        self.running_requests += 1
+        self.max_running_requests = max(
+            self.max_running_requests, self.running_requests)
+
+        await asyncio.sleep(0.01)
+        self.running_requests -= 1
+
+        if request.match_info["id"] == "missing":
+            return web.json_response({"error": {}}, status=404)
+
+        return web.json_response({
+            "range": request.match_info["range"],
+            "values": [[request.match_info["id"]]]
+        })
+
+    def get_values_request(self, spreadsheet_id):
+        return self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range="A1")
+
+    async def test_execute(self):
+        response = await self.client.execute(self.get_values_request("id"))
+
+        self.assertEqual(response["values"], [["id"]])
+
+    async def test_http_error(self):
+        with self.assertRaises(HttpError):
+            await self.client.execute(self.get_values_request("missing"))
+
+        # Error callback result is returned instead of raising the error
+        result = await self.client.execute_request(
+            self.service, self.get_values_request("missing"),
+            error_callback=lambda error: None)
+        self.assertIsNone(result)
+
+    async def test_concurrency_limit(self):
+        responses = await asyncio.gather(*(
+            self.client.execute(self.get_values_request(str(i)))
+            for i in range(10)
+        ))
+
+        self.assertEqual(len(responses), 10)
+        self.assertEqual(self.max_running_requests, MAX_CONCURRENCY)
+
+    async def test_chained_request(self):
+        # Callback may send the next request depending on the response
+        result = await self.client.execute_request(
+            self.service, self.get_values_request("first"),
+            callback=lambda response: self.client.execute_request(
+                self.service,
+                self.get_values_request(response["values"][0][0] + "-next")
+            ))
+
+        self.assertEqual(result["values"], [["first-next"]])
+
+    async def test_quota_wait_does_not_block_loop(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        request_scheduler = RequestScheduler(quota_limits=[])
+        request_scheduler.get_buckets = lambda request: [bucket]
+        client = AsyncClient(request_scheduler=request_scheduler)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.ensure_future(tick())
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await asyncio.gather(*(
+                client.execute(self.get_values_request(str(i)))
+                for i in range(3)
+            ))
+        finally:
+            ticker.cancel()
+            await client.close()
+
+        # Tokens are granted with the rate, other tasks are running meanwhile
+        self.assertGreaterEqual(loop.time() - start, 0.09)
+        self.assertGreater(ticks, 5)
+
+
+class AsyncClientLoopsTestCase(TestCase):
+    def test_session_of_previous_loop_is_closed(self):
+        client = AsyncClient()
+
+        idle_loop = asyncio.new_event_loop()
+        self.addCleanup(idle_loop.close)
+        idle_loop.run_until_complete(client._prepare())
+        idle_loop_session = client._session
+
+        # Session of the idle loop is closed on it
+        asyncio.run(client._prepare())
+        closed_loop_session = client._session
+        self.assertTrue(idle_loop_session.closed)
+        self.assertIsNot(closed_loop_session, idle_loop_session)
+
+        # Session of the closed loop is detached from its connections
+        asyncio.run(client.close())
+        self.assertTrue(closed_loop_session.closed)
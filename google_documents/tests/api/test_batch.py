@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from google_documents.entities.file import GoogleDriveFile
+from google_documents.tests.fakes import FakeDriveService, FakeServiceManager
+
+FILES_COUNT = 5
+
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.service = FakeDriveService([
+            {"id": str(i), "name": f"File {i}"}
+            for i in range(FILES_COUNT)
+        ])
+
+        self.manager = FakeServiceManager(GoogleDriveFile)
+        self.manager._api_service = self.service
+
+    def test_requests_are_queued(self):
+        with self.manager.batch(max_batch_size=2):
+            futures = [self.manager.get(str(i)) for i in range(FILES_COUNT)]
+
+            # Nothing is sent while the batch is active
+            self.assertFalse(any(future.done() for future in futures))
+
+        self.assertEqual(
+            [future.result().name for future in futures],
+            [f"File {i}" for i in range(FILES_COUNT)]
+        )
+        # Requests should be split to batches of the max size
+        self.assertEqual(self.service.batch_sizes, [2, 2, 1])
+
+    def test_in_bulk(self):
+        files = self.manager.in_bulk(["1", "3", "missing"])
+
+        self.assertEqual(sorted(files), ["1", "3"])
+        self.assertEqual(files["3"].name, "File 3")
+        self.assertEqual(self.service.batch_sizes, [3])
+
+    def test_failed_block_is_not_sent(self):
+        with self.assertRaises(RuntimeError):
+            with self.manager.batch():
+                future = self.manager.get("1")
+                raise RuntimeError()
+
+        self.assertTrue(future.cancelled())
+        self.assertEqual(self.service.batch_sizes, [])
+
+    def test_get_without_batch(self):
+        self.assertEqual(self.manager.get("2").name, "File 2")
+        self.assertIsNone(self.manager.get("missing"))
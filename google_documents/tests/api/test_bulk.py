@@ -0,0 +1,58 @@
+import threading
+from unittest import TestCase
+
+from google_documents.api.bulk import (
+    BulkError,
+    BulkOperation,
+    BulkResult,
+    raise_errors
+)
+from google_documents.entities.file import GoogleDriveFile
+from google_documents.entity_managers.file import GoogleDriveDocumentManager
+
+
+class FakeFile(GoogleDriveFile):
+    def copy(self, file_name):
+        if file_name == "fail":
+            raise ValueError(file_name)
+
+        return FakeFile(id=f"{self.id} copy", name=file_name)
+
+
+class BulkOperationTestCase(TestCase):
+    def test_results_order(self):
+        results = BulkOperation(lambda i: i * 2, max_workers=4).run(range(20))
+
+        self.assertEqual([result.item for result in results], list(range(20)))
+        self.assertEqual([result.result for result in results],
+                         [i * 2 for i in range(20)])
+
+    def test_runs_on_threads(self):
+        threads = BulkOperation(
+            lambda i: threading.get_ident(), max_workers=4
+        ).run(range(20))
+
+        self.assertNotIn(threading.get_ident(),
+                         {result.result for result in threads})
+
+    def test_bulk_copy_errors(self):
+        file = FakeFile(id="template")
+
+        results = GoogleDriveDocumentManager(FakeFile).bulk_copy(
+            [(file, "first"), (file, "fail"), (file, "second")])
+
+        self.assertEqual([result.ok for result in results],
+                         [True, False, True])
+        self.assertEqual(results[0].result.name, "first")
+        self.assertIsInstance(results[1].error, ValueError)
+
+    def test_raise_errors(self):
+        ok_results = [BulkResult(1, result=2)]
+        failed_result = BulkResult(3, error=ValueError(3))
+
+        self.assertIs(raise_errors(ok_results), ok_results)
+
+        with self.assertRaises(BulkError) as context:
+            raise_errors(ok_results + [failed_result])
+        self.assertEqual(context.exception.results, [failed_result])
+        self.assertIsInstance(context.exception.__cause__, ValueError)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from google_documents.api.cache import MemoryCacheBackend, SQLiteCacheBackend
+
+
+class CacheBackendTestMixin:
+    def get_backend(self, max_size):
+        raise NotImplementedError
+
+    def test_set_get(self):
+        backend = self.get_backend(max_size=10)
+        backend.set("spreadsheet!A1", [["a"]], ttl=60)
+
+        self.assertEqual(backend.get("spreadsheet!A1"), [["a"]])
+        self.assertIsNone(backend.get("spreadsheet!A2"))
+        self.assertEqual(backend.keys("spreadsheet!"), ["spreadsheet!A1"])
+        self.assertEqual(backend.keys("other!"), [])
+
+        backend.delete("spreadsheet!A1")
+        self.assertIsNone(backend.get("spreadsheet!A1"))
+
+    def test_lru_eviction(self):
+        backend = self.get_backend(max_size=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        self.assertEqual(backend.get("a"), 1)
+        backend.set("c", 3, ttl=60)
+
+        self.assertEqual(backend.get("a"), 1)
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("c"), 3)
+
+    def test_ttl(self):
+        backend = self.get_backend(max_size=10)
+        backend.set("a", 1, ttl=-1)
+
+        self.assertIsNone(backend.get("a"))
+
+
+class MemoryCacheBackendTestCase(CacheBackendTestMixin, TestCase):
+    def get_backend(self, max_size):
+        return MemoryCacheBackend(max_size)
+
+
+class SQLiteCacheBackendTestCase(CacheBackendTestMixin, TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_backend(self, max_size):
+        return SQLiteCacheBackend(
+            os.path.join(self.directory.name, "cache.sqlite3"), max_size)
+
+    def test_shared_between_instances(self):
+        self.get_backend(max_size=10).set("a", [[1, "b"]], ttl=60)
+
+        self.assertEqual(self.get_backend(max_size=10).get("a"), [[1, "b"]])
@@ -0,0 +1,93 @@
+import datetime
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from google_documents.api.credentials import CredentialsPool
+
+
+def make_service_account_item(key_id):
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048)
+
+    return {
+        "type": "service_account",
+        "project_id": "test",
+        "private_key_id": key_id,
+        "private_key": private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ).decode(),
+        "client_email": "test@test.iam.gserviceaccount.com",
+        "client_id": "1",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+
+
+class CountingCredentialsPool(CredentialsPool):
+    refreshes_count = 0
+
+    def _refresh(self, credentials):
+        # Emulating token response without calling OAuth server
+        self.refreshes_count += 1
+        credentials.token = f"token-{self.refreshes_count}"
+        credentials.expiry = datetime.datetime.utcnow() + \
+            datetime.timedelta(hours=1)
+
+
+class CredentialsPoolTestCase(TestCase):
+    def setUp(self):
+        self.pool = CountingCredentialsPool(scopes=["scope"])
+
+        file_descriptor, self.file_name = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(make_service_account_item("first"), file)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_credentials_are_shared(self):
+        credentials = self.pool.get(self.file_name)
+
+        self.assertIs(self.pool.get(self.file_name), credentials)
+        # Token is fetched only once for all the users
+        self.assertEqual(self.pool.refreshes_count, 1)
+        self.assertEqual(credentials.token, "token-1")
+
+    def test_credentials_are_separated_by_subject(self):
+        credentials = self.pool.get(self.file_name)
+        delegated = self.pool.get(self.file_name, subject="user@test.com")
+
+        self.assertIsNot(delegated, credentials)
+        self.assertIs(self.pool.get(self.file_name, subject="user@test.com"),
+                      delegated)
+        self.assertEqual(delegated.token, "token-2")
+
+    def test_reload_on_file_change(self):
+        credentials = self.pool.get(self.file_name)
+
+        with open(self.file_name, "w") as file:
+            json.dump(make_service_account_item("second"), file)
+        # Making sure modification time has changed
+        mtime = time.time() + 10
+        os.utime(self.file_name, (mtime, mtime))
+
+        new_credentials = self.pool.get(self.file_name)
+        self.assertIsNot(new_credentials, credentials)
+        self.assertEqual(new_credentials.signer.key_id, "second")
+
+    def test_refresh_before_expiration(self):
+        credentials = self.pool.get(self.file_name)
+
+        # Token is going to expire earlier than refresh margin
+        credentials.expiry = datetime.datetime.utcnow() + \
+            self.pool.refresh_margin / 2
+
+        self.pool.get(self.file_name)
+        self.assertEqual(self.pool.refreshes_count, 2)
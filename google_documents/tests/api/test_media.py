@@ -0,0 +1,80 @@
+import io
+import os
+import re
+import tempfile
+from unittest import TestCase
+
+import httplib2
+
+from google_documents.api.media import download, open_atomically
+
+CONTENT = bytes(range(256)) * 40
+
+
+class FakeRangeHttp:
+    """
+    Serves CONTENT by the requested byte ranges
+    """
+    def __init__(self):
+        self.ranges = []
+
+    def request(self, uri, method="GET", headers=None, **kwargs):
+        start, end = map(int, re.match(
+            r"bytes=(\d+)-(\d+)", headers["range"]).groups())
+        self.ranges.append((start, end))
+
+        chunk = CONTENT[start:end + 1]
+        return httplib2.Response({
+            "status": 206,
+            "content-range":
+                f"bytes {start}-{start + len(chunk) - 1}/{len(CONTENT)}"
+        }), chunk
+
+
+class FakeMediaRequest:
+    def __init__(self):
+        self.uri = "https://www.googleapis.com/drive/v3/files/id/export"
+        self.headers = {}
+        self.http = FakeRangeHttp()
+
+
+class DownloadTestCase(TestCase):
+    def test_download_by_chunks(self):
+        request = FakeMediaRequest()
+        file = io.BytesIO()
+        progress = []
+
+        download(request, file, chunk_size=4096,
+                 progress_callback=lambda *args: progress.append(args))
+
+        self.assertEqual(file.getvalue(), CONTENT)
+        self.assertEqual(request.http.ranges,
+                         [(0, 4095), (4096, 8191), (8192, 12287)])
+        self.assertEqual(progress[-1], (len(CONTENT), len(CONTENT)))
+
+
+class OpenAtomicallyTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "export.docx")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_file_is_written(self):
+        with open_atomically(self.file_name) as file:
+            file.write(b"data")
+            # File appears only after the writing
+            self.assertFalse(os.path.exists(self.file_name))
+
+        with open(self.file_name, "rb") as file:
+            self.assertEqual(file.read(), b"data")
+
+    def test_failed_writing(self):
+        with self.assertRaises(RuntimeError):
+            with open_atomically(self.file_name) as file:
+                file.write(b"data")
+                raise RuntimeError()
+
+        # Neither file, nor temporary file should exist
+        self.assertEqual(os.listdir(self.directory.name), [])
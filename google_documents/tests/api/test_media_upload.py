@@ -0,0 +1,143 @@
+import json
+import os
+import re
+import tempfile
+from unittest import TestCase
+
+import httplib2
+from googleapiclient import discovery
+
+from google_documents.api.media import (
+    UploadSession,
+    get_media_upload,
+    upload
+)
+
+CHUNK_SIZE = 256 * 1024
+CONTENT = os.urandom(CHUNK_SIZE * 3 + 100)
+SESSION_URI = "https://upload.example.com/session"
+
+
+class FakeResumableHttp:
+    """
+    Emulates resumable upload protocol of the Google APIs
+    """
+    def __init__(self, fail_on_chunk=None):
+        self.received = b""
+        self.sent_bytes = 0
+        self.chunks_count = 0
+        self.fail_on_chunk = fail_on_chunk
+        self.expired = False
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        if uri != SESSION_URI:
+            # Starting the session
+            return httplib2.Response(
+                {"status": 200, "location": SESSION_URI}), b""
+
+        if self.expired:
+            # Server has forgotten the session,
+            # the new one is started with the same URI
+            self.expired = False
+            self.received = b""
+            return httplib2.Response({"status": 404}), b""
+
+        content_range = headers.get("Content-Range")
+        if content_range.startswith("bytes */"):
+            # Asking for the upload status
+            return self._get_response()
+
+        self.chunks_count += 1
+        if self.chunks_count == self.fail_on_chunk:
+            raise RuntimeError("Upload has been interrupted")
+
+        data = body.read() if hasattr(body, "read") else body
+        start = int(re.match(r"bytes (\d+)-", content_range).group(1))
+        self.received = self.received[:start] + data
+        self.sent_bytes += len(data)
+        return self._get_response()
+
+    def _get_response(self):
+        if len(self.received) == len(CONTENT):
+            return httplib2.Response({"status": 200}), \
+                json.dumps({"id": "file"}).encode()
+        return httplib2.Response({
+            "status": 308,
+            "range": f"bytes=0-{len(self.received) - 1}"
+        }), b""
+
+
+class UploadTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.session_file = os.path.join(self.directory.name, "session")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_request(self, http):
+        service = discovery.build("drive", "v3", http=http,
+                                  static_discovery=True)
+        return service.files().update(
+            fileId="file",
+            media_body=get_media_upload(
+                CONTENT, "application/octet-stream", CHUNK_SIZE)
+        )
+
+    def test_upload_by_chunks(self):
+        http = FakeResumableHttp()
+        progress = []
+
+        response = upload(
+            self.get_request(http),
+            progress_callback=lambda *args: progress.append(args))
+
+        self.assertEqual(response, {"id": "file"})
+        self.assertEqual(http.received, CONTENT)
+        self.assertEqual(http.chunks_count, 4)
+        self.assertEqual(len(progress), 3)
+
+    def test_resume_interrupted_upload(self):
+        http = FakeResumableHttp(fail_on_chunk=3)
+        with self.assertRaises(RuntimeError):
+            upload(self.get_request(http),
+                   session=UploadSession(self.session_file))
+
+        # Session URI is saved
+        self.assertTrue(os.path.exists(self.session_file))
+
+        http.fail_on_chunk = None
+        response = upload(self.get_request(http),
+                          session=UploadSession(self.session_file))
+
+        self.assertEqual(response, {"id": "file"})
+        self.assertEqual(http.received, CONTENT)
+        # Uploaded chunks should not be sent again
+        self.assertEqual(http.sent_bytes, len(CONTENT))
+        # Session is removed after the upload
+        self.assertFalse(os.path.exists(self.session_file))
+
+    def test_expired_session_is_restarted(self):
+        http = FakeResumableHttp(fail_on_chunk=2)
+        with self.assertRaises(RuntimeError):
+            upload(self.get_request(http),
+                   session=UploadSession(self.session_file))
+
+        http.fail_on_chunk = None
+        http.expired = True
+        response = upload(self.get_request(http),
+                          session=UploadSession(self.session_file))
+
+        self.assertEqual(response, {"id": "file"})
+        self.assertEqual(http.received, CONTENT)
+
+    def test_completed_session_is_not_sent_again(self):
+        http = FakeResumableHttp()
+        UploadSession(self.session_file).save(SESSION_URI)
+        http.received = CONTENT
+
+        response = upload(self.get_request(http),
+                          session=UploadSession(self.session_file))
+
+        self.assertEqual(response, {"id": "file"})
+        self.assertEqual(http.chunks_count, 0)
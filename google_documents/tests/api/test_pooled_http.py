@@ -0,0 +1,91 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+from google_documents.api.transport import PooledHttp
+
+RESPONSE_CONTENT = b'{"values": []}' * 100
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """
+    Responds with gzipped content, recording received requests
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append(
+            (self.client_address, self.headers.get("Content-Encoding"), body))
+
+        content = gzip.compress(RESPONSE_CONTENT)
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class PooledHttpTestCase(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        self.server.received = []
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+
+        self.uri = f"http://127.0.0.1:{self.server.server_port}/"
+        self.http = PooledHttp(compress_min_size=100)
+
+    def tearDown(self):
+        self.http.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_response_is_decompressed(self):
+        response, content = self.http.request(self.uri, "POST", body=b"{}")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(content, RESPONSE_CONTENT)
+        self.assertEqual(response["content-length"],
+                         str(len(RESPONSE_CONTENT)))
+
+    def test_large_body_is_compressed(self):
+        small_body, large_body = b"{}", b"[1]" * 100
+        headers = {"Content-Type": "application/json; charset=UTF-8"}
+
+        self.http.request(self.uri, "POST", body=small_body, headers=headers)
+        self.http.request(self.uri, "POST", body=large_body, headers=headers)
+
+        (_, small_encoding, small_received), \
+            (_, large_encoding, large_received) = self.server.received
+        self.assertEqual((small_encoding, small_received), (None, small_body))
+        self.assertEqual(large_encoding, "gzip")
+        self.assertEqual(gzip.decompress(large_received), large_body)
+
+    def test_media_is_not_compressed(self):
+        body = b"a,b\n" * 100
+
+        # Chunk of the resumable upload and media of another type
+        self.http.request(
+            self.uri + "?uploadType=resumable&upload_id=1", "POST",
+            body=body, headers={"Content-Type": "text/csv",
+                                "Content-Range": "bytes 0-399/*"})
+        self.http.request(self.uri, "POST", body=body,
+                          headers={"Content-Type": "application/zip"})
+
+        self.assertEqual(
+            [(encoding, received)
+             for _, encoding, received in self.server.received],
+            [(None, body), (None, body)])
+
+    def test_connection_is_kept_alive(self):
+        for _ in range(3):
+            self.http.request(self.uri, "POST", body=b"{}")
+
+        client_addresses = {
+            address for address, _, _ in self.server.received}
+        self.assertEqual(len(client_addresses), 1)
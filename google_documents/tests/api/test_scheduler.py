@@ -0,0 +1,139 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest import TestCase
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from google_documents.api.scheduler import (
+    Priority,
+    RequestScheduler,
+    TokenBucket
+)
+
+
+def make_http_error(status, reason=None, headers=None):
+    content = json.dumps(
+        {"error": {"errors": [{"reason": reason}]}}).encode()
+    return HttpError(
+        httplib2.Response({"status": status, **(headers or {})}), content)
+
+
+class TokenBucketTestCase(TestCase):
+    def test_rate_limit(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+
+        # First token is available at once, others are added with the rate
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_priority_order(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+
+        order = []
+
+        def acquire(priority):
+            bucket.acquire(priority)
+            order.append(priority)
+
+        # Bulk request is waiting first
+        threads = [threading.Thread(target=acquire, args=(Priority.BULK,))]
+        threads[0].start()
+        time.sleep(0.01)
+        threads += [
+            threading.Thread(target=acquire, args=(Priority.INTERACTIVE,))]
+        threads[1].start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, [Priority.INTERACTIVE, Priority.BULK])
+
+    def test_try_acquire(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        self.assertIsNone(bucket.try_acquire())
+        delay = bucket.try_acquire()
+        self.assertGreater(delay, 0)
+
+        time.sleep(delay + 0.01)
+        self.assertIsNone(bucket.try_acquire())
+
+
+class RequestSchedulerTestCase(TestCase):
+    def setUp(self):
+        self.scheduler = RequestScheduler(quota_limits=[])
+        self.scheduler.backoff_base = 0.001
+
+    def test_retry_delay(self):
+        self.assertIsNone(
+            self.scheduler.get_retry_delay(make_http_error(404), 0))
+        self.assertIsNone(
+            self.scheduler.get_retry_delay(make_http_error(403), 0))
+        self.assertIsNotNone(self.scheduler.get_retry_delay(
+            make_http_error(403, "userRateLimitExceeded"), 0))
+        self.assertIsNotNone(
+            self.scheduler.get_retry_delay(make_http_error(503), 0))
+
+        # Retries are limited
+        self.assertIsNone(self.scheduler.get_retry_delay(
+            make_http_error(503), self.scheduler.max_retries))
+
+    def test_retry_after(self):
+        error = make_http_error(429, headers={"retry-after": "7"})
+
+        self.assertEqual(self.scheduler.get_retry_delay(error, 0), 7)
+
+    def test_retry(self):
+        errors = [make_http_error(500), ConnectionError()]
+
+        def send():
+            if errors:
+                raise errors.pop(0)
+            return "response"
+
+        self.assertEqual(self.scheduler.retry(send), "response")
+
+    def test_not_retryable_error(self):
+        def send():
+            raise make_http_error(400)
+
+        with self.assertRaises(HttpError):
+            self.scheduler.retry(send)
+
+    def test_is_idempotent(self):
+        def request(method, uri):
+            return SimpleNamespace(method=method, uri=uri)
+
+        base = "https://sheets.googleapis.com/v4/spreadsheets"
+        self.assertTrue(self.scheduler.is_idempotent(
+            request("GET", f"{base}/id/values/A1")))
+        self.assertTrue(self.scheduler.is_idempotent(
+            request("POST", f"{base}/id/values:batchUpdate")))
+        self.assertFalse(self.scheduler.is_idempotent(
+            request("POST", f"{base}/id:batchUpdate")))
+        self.assertFalse(self.scheduler.is_idempotent(
+            request("POST", f"{base}/id/values/A1:append?alt=json")))
+        self.assertFalse(self.scheduler.is_idempotent(
+            request("POST", "https://www.googleapis.com/drive/v3/files")))
+        self.assertFalse(self.scheduler.is_idempotent(request(
+            "POST", "https://www.googleapis.com/drive/v3/files/id/copy")))
+
+    def test_non_idempotent_retry(self):
+        errors = [make_http_error(429), make_http_error(503)]
+
+        def send():
+            if errors:
+                raise errors.pop(0)
+            return "response"
+
+        # Request rejected by the quota is retried, failed one is not
+        with self.assertRaises(HttpError):
+            self.scheduler.retry(send, idempotent=False)
+        self.assertEqual(errors, [])
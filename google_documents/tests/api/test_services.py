@@ -0,0 +1,57 @@
+import threading
+from unittest import TestCase
+
+from google.auth.credentials import AnonymousCredentials
+from google.oauth2 import service_account
+
+from google_documents.api.services import ServiceRegistry
+from google_documents.tests.api.test_credentials import \
+    make_service_account_item
+
+
+class ServiceRegistryTestCase(TestCase):
+    def setUp(self):
+        self.registry = ServiceRegistry()
+        self.credentials = AnonymousCredentials()
+
+    def test_service_is_built_once(self):
+        service = self.registry.get("drive", "v3", self.credentials)
+
+        self.assertIs(self.registry.get("drive", "v3", self.credentials),
+                      service)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_services_are_separated_by_key(self):
+        drive = self.registry.get("drive", "v3", self.credentials)
+        sheets = self.registry.get("sheets", "v4", self.credentials)
+        other = self.registry.get("drive", "v3", AnonymousCredentials())
+
+        self.assertIsNot(drive, sheets)
+        self.assertIsNot(drive, other)
+        self.assertEqual(len(self.registry), 3)
+
+    def test_identity_includes_subject(self):
+        credentials = service_account.Credentials.from_service_account_info(
+            make_service_account_item("key"), scopes=["scope"])
+        delegated = credentials.with_subject("user@test.com")
+
+        identity = self.registry.get_credentials_identity
+        self.assertEqual(identity(credentials),
+                         identity(credentials.with_scopes(["scope"])))
+        self.assertNotEqual(identity(credentials), identity(delegated))
+
+    def test_concurrent_access(self):
+        services = []
+
+        def get_service():
+            services.append(
+                self.registry.get("sheets", "v4", self.credentials))
+
+        threads = [threading.Thread(target=get_service) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # All threads should get the same service object
+        self.assertEqual(len({id(service) for service in services}), 1)
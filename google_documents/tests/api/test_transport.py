@@ -0,0 +1,30 @@
+import threading
+from unittest import TestCase
+
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient import discovery
+
+from google_documents.api.transport import get_thread_http
+
+
+class ThreadTransportTestCase(TestCase):
+    def setUp(self):
+        service = discovery.build(
+            "drive", "v3", credentials=AnonymousCredentials(),
+            static_discovery=True)
+        self.request = service.files().get(fileId="id")
+
+    def test_transport_is_reused_in_thread(self):
+        http = get_thread_http(self.request)
+
+        self.assertIs(get_thread_http(self.request), http)
+        self.assertIs(http.credentials, self.request.http.credentials)
+
+    def test_transport_per_thread(self):
+        transports = []
+        thread = threading.Thread(
+            target=lambda: transports.append(get_thread_http(self.request)))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(transports[0], get_thread_http(self.request))
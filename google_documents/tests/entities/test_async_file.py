@@ -0,0 +1,66 @@
+from unittest import IsolatedAsyncioTestCase
+
+from google_documents.tests.fakes import (
+    FakeAsyncFile,
+    FakeAsyncSpreadsheet,
+    FakeDriveService
+)
+
+SHEET_ITEM = {
+    "properties": {"sheetId": 0, "index": 0, "title": "Sheet1"}
+}
+
+
+class AsyncLazyFieldsTestCase(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.file = FakeAsyncFile.from_item({"id": "file", "name": "File"})
+        self.file._api_service = FakeDriveService([{
+            "id": "file", "name": "File", "version": "3"
+        }])
+
+    async def test_lazy_field_is_not_loaded_blocking(self):
+        with self.assertRaises(TypeError):
+            self.file.version
+
+    async def test_load_fields(self):
+        await self.file.load_fields()
+
+        self.assertEqual(self.file.version, "3")
+        # Fields not returned by the API are not requested again
+        self.assertIsNone(self.file.modified_time)
+
+
+class AsyncSheetsTestCase(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.spreadsheet = FakeAsyncSpreadsheet([SHEET_ITEM])
+
+    async def test_sheets_are_fetched_by_all(self):
+        sheets = self.spreadsheet.sheets
+
+        with self.assertRaises(TypeError):
+            sheets["Sheet1"]
+
+        self.assertEqual([sheet.title for sheet in await sheets.all()],
+                         ["Sheet1"])
+        self.assertEqual(sheets["Sheet1"].id, 0)
+
+    async def test_create(self):
+        sheets = self.spreadsheet.sheets
+
+        sheet = await sheets.create(index=1, title="Sheet2")
+
+        self.assertEqual(sheet.id, 1)
+        self.assertEqual([sheet.title for sheet in sheets],
+                         ["Sheet1", "Sheet2"])
+
+    async def test_read_iter(self):
+        self.spreadsheet = FakeAsyncSpreadsheet([{"properties": {
+            **SHEET_ITEM["properties"],
+            "gridProperties": {"rowCount": 4, "columnCount": 1}
+        }}])
+
+        rows = [row async for row in self.spreadsheet.read_iter(
+            "Sheet1!A:A", chunk_rows=2)]
+
+        # Every window contains its name in the first row
+        self.assertEqual(rows, [["Sheet1!A1:A2"], [], ["Sheet1!A3:A4"]])
@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from googleapiclient.errors import HttpError
+
+from google_documents.entities.file import GoogleDriveFile
+from google_documents.tests.fakes import FakeDriveService
+
+FILE_ITEM = {
+    "id": "file",
+    "name": "File",
+    "mimeType": "text/plain",
+    "parents": ["folder"],
+    "modifiedTime": "2020-01-01T00:00:00.000Z",
+    "version": "3",
+}
+
+
+class FakeServiceFile(GoogleDriveFile):
+    # Allows using fake service instead of the real one
+    _api_service = None
+
+
+class LazyFieldsTestCase(TestCase):
+    def setUp(self):
+        self.service = FakeDriveService([FILE_ITEM])
+        self.get_calls = self.service.files_resource.get_calls
+
+    def make_file(self, item):
+        file = FakeServiceFile.from_item(item)
+        file._api_service = self.service
+        return file
+
+    def test_known_fields_are_not_loaded(self):
+        file = self.make_file(FILE_ITEM)
+
+        self.assertEqual(file.name, "File")
+        self.assertEqual([folder.id for folder in file.parents], ["folder"])
+        self.assertEqual(self.get_calls, [])
+
+    def test_missing_fields_loaded_once(self):
+        file = self.make_file({"id": "file", "name": "File"})
+
+        self.assertEqual(file.parent_ids, ["folder"])
+        self.assertEqual(file.version, "3")
+        self.assertEqual(file.modified_time, FILE_ITEM["modifiedTime"])
+
+        # All missing fields should be loaded by the single call
+        self.assertEqual(self.get_calls, [
+            ("file", "parents, modifiedTime, version")
+        ])
+
+    def test_repr_does_not_load_fields(self):
+        file = self.make_file({"id": "file"})
+
+        self.assertEqual(repr(file), "<FakeServiceFile: file - None>")
+        self.assertEqual(self.get_calls, [])
+
+    def test_failed_loading_is_repeated(self):
+        self.service.files_resource.items = []
+        file = self.make_file({"id": "file", "name": "File"})
+
+        with self.assertRaises(HttpError):
+            file.version
+
+        self.service.files_resource.items = [FILE_ITEM]
+        self.assertEqual(file.version, "3")
+        self.assertEqual(len(self.get_calls), 2)
@@ -0,0 +1,177 @@
+from unittest import TestCase
+
+from google_documents.entities.range import (
+    CoalescedRanges,
+    SheetRange,
+    column_letters_to_number,
+    column_number_to_letters,
+    split_values
+)
+from google_documents.tests.fakes import FakeSpreadsheet
+
+
+class ColumnLettersTestCase(TestCase):
+    def test_conversion(self):
+        for letters, number in (("A", 1), ("Z", 26), ("AA", 27),
+                                ("AB", 28), ("ZZZ", 18278)):
+            self.assertEqual(column_letters_to_number(letters), number)
+            self.assertEqual(column_number_to_letters(number), letters)
+
+
+class SheetRangeTestCase(TestCase):
+    def test_parse(self):
+        self.assertEqual(SheetRange.parse("Sheet1!A1:D10"),
+                         SheetRange("Sheet1", 1, 1, 10, 4))
+        self.assertEqual(SheetRange.parse("'It''s'!B:C"),
+                         SheetRange("It's", None, 2, None, 3))
+        self.assertEqual(SheetRange.parse("A5"), SheetRange(None, 5, 1, 5, 1))
+        self.assertEqual(SheetRange.parse("Sheet1"), SheetRange("Sheet1"))
+
+    def test_parse_bare_titles(self):
+        # Short titles are not columns without the cells part
+        self.assertEqual(SheetRange.parse("Mar"), SheetRange("Mar"))
+        self.assertEqual(SheetRange.parse("'My sheet'"),
+                         SheetRange("My sheet"))
+        self.assertEqual(SheetRange.parse("'It''s'"), SheetRange("It's"))
+
+        for range_name in ("'Mar'", "'My sheet'", "'It''s'"):
+            self.assertEqual(SheetRange.parse(range_name).to_a1(), range_name)
+        self.assertEqual(SheetRange.parse("Mar").to_a1(), "'Mar'")
+
+    def test_parse_absolute_and_r1c1(self):
+        self.assertEqual(SheetRange.parse("Sheet1!$B$2:C$5"),
+                         SheetRange("Sheet1", 2, 2, 5, 3))
+        self.assertEqual(SheetRange.parse("Sheet1!R2C2:R5C3"),
+                         SheetRange("Sheet1", 2, 2, 5, 3))
+
+    def test_to_a1(self):
+        for range_name in ("Sheet1!A1:D10", "'My sheet'!A:B", "C7",
+                           "Sheet1!2:5", "B5:D", "Sheet1"):
+            self.assertEqual(SheetRange.parse(range_name).to_a1(), range_name)
+
+    def test_split_rows(self):
+        windows = SheetRange.parse("Sheet1!B2:C8").split_rows(3)
+
+        self.assertEqual([window.to_a1() for window in windows],
+                         ["Sheet1!B2:C4", "Sheet1!B5:C7", "Sheet1!B8:C8"])
+
+    def test_split_unlimited_rows(self):
+        sheet_range = SheetRange.parse("A:B")
+
+        with self.assertRaises(ValueError):
+            sheet_range.split_rows(3)
+
+        windows = sheet_range.split_rows(3, rows_count=5)
+        self.assertEqual([window.to_a1() for window in windows],
+                         ["A1:B3", "A4:B5"])
+
+    def test_intersection(self):
+        sheet_range = SheetRange.parse("Sheet1!B2:D10")
+
+        self.assertEqual(
+            sheet_range.intersection(SheetRange.parse("Sheet1!C:F")),
+            SheetRange.parse("Sheet1!C2:D10"))
+        self.assertIsNone(
+            sheet_range.intersection(SheetRange.parse("Sheet1!E1:F2")))
+        self.assertIsNone(
+            sheet_range.intersection(SheetRange.parse("Sheet2!B2:D10")))
+
+    def test_union(self):
+        sheet_range = SheetRange.parse("Sheet1!A1:B5")
+
+        self.assertEqual(sheet_range.union(SheetRange.parse("Sheet1!A6:B9")),
+                         SheetRange.parse("Sheet1!A1:B9"))
+        self.assertEqual(sheet_range.union(SheetRange.parse("Sheet1!C1:C5")),
+                         SheetRange.parse("Sheet1!A1:C5"))
+        self.assertEqual(sheet_range.union(SheetRange.parse("Sheet1!A:B")),
+                         SheetRange.parse("Sheet1!A:B"))
+
+        self.assertEqual(
+            sheet_range.bounding(SheetRange.parse("Sheet1!B3:C9")),
+            SheetRange.parse("Sheet1!A1:C9"))
+
+        # Union of these ranges is not rectangular
+        self.assertIsNone(sheet_range.union(SheetRange.parse("Sheet1!C2:C5")))
+        self.assertIsNone(sheet_range.union(SheetRange.parse("Sheet1!A7:B9")))
+
+    def test_contains(self):
+        sheet_range = SheetRange.parse("Sheet1!B:D")
+
+        self.assertIn(SheetRange.parse("Sheet1!C5:D7"), sheet_range)
+        self.assertNotIn(SheetRange.parse("Sheet1!C5:E7"), sheet_range)
+        self.assertNotIn(SheetRange.parse("C5:D7"), sheet_range)
+
+    def test_cut(self):
+        sheet_range = SheetRange.parse("Sheet1!A1:C4")
+        values = [["a", "b", "c"], ["d", "", ""], ["", "", "i"]]
+
+        self.assertEqual(
+            sheet_range.cut(values, SheetRange.parse("Sheet1!A2:B4")),
+            [["d"]])
+        self.assertEqual(
+            sheet_range.cut(values, SheetRange.parse("Sheet1!B1:C3")),
+            [["b", "c"], [], ["", "i"]])
+
+
+class CoalescedRangesTestCase(TestCase):
+    def test_plan(self):
+        plan = CoalescedRanges([
+            "Sheet1!A1:B5", "Sheet1!A6:B9", "Sheet1!B2:B3", "Sheet1!A1:B5",
+            "Sheet2!A1", "NamedRange",
+        ])
+
+        self.assertEqual(plan.fetched_ranges_names,
+                         ["Sheet1!A1:B9", "Sheet2!A1", "NamedRange"])
+
+        values = [[["a", "b"], ["c", "d"], ["e", "f"]], [["g"]], [["h"]]]
+        self.assertEqual(plan.cut(values), [
+            [["a", "b"], ["c", "d"], ["e", "f"]], [], [["d"], ["f"]],
+            [["a", "b"], ["c", "d"], ["e", "f"]], [["g"]], [["h"]],
+        ])
+
+
+    def test_overlapping_ranges_are_read_once(self):
+        plan = CoalescedRanges(["Sheet1!A1:B2", "Sheet1!B1:C2", "Mar"])
+
+        self.assertEqual(plan.fetched_ranges_names, ["Sheet1!A1:C2", "Mar"])
+        self.assertEqual(
+            plan.cut([[["a", "b", "c"], ["d", "e", "f"]], [["g"]]]),
+            [[["a", "b"], ["d", "e"]], [["b", "c"], ["e", "f"]], [["g"]]])
+
+
+class BatchReadTestCase(TestCase):
+    def test_ranges_are_coalesced(self):
+        spreadsheet = FakeSpreadsheet()
+
+        values = spreadsheet.batch_read(
+            ["Sheet1!A1:A2", "Sheet1!A1", "Sheet2!B3"])
+
+        self.assertEqual(
+            spreadsheet._sheets_api_service.values_resource.requests,
+            [("batchGet", ["Sheet1!A1:A2", "Sheet2!B3"])])
+        self.assertEqual(values, [
+            [["Sheet1!A1:A2"]], [["Sheet1!A1:A2"]], [["Sheet2!B3"]]])
+
+
+class SplitValuesTestCase(TestCase):
+    def test_split(self):
+        values = [["a" * 10, i] for i in range(10)]
+
+        parts = split_values("Sheet1!B3", values, max_size=60)
+
+        self.assertEqual([part["range"] for part in parts], [
+            "Sheet1!B3:C5", "Sheet1!B6:C8", "Sheet1!B9:C11", "Sheet1!B12:C12"
+        ])
+        self.assertEqual(sum((part["values"] for part in parts), []), values)
+
+    def test_large_row(self):
+        parts = split_values("A1:A2", [["a" * 100], ["b"]], max_size=10)
+
+        self.assertEqual([part["range"] for part in parts], ["A1", "A2"])
+
+    def test_named_range_is_not_split(self):
+        values = [["a" * 10, i] for i in range(10)]
+
+        for range_name in ("MyRange", "'My sheet'"):
+            self.assertEqual(split_values(range_name, values, max_size=60),
+                             [{"range": range_name, "values": values}])
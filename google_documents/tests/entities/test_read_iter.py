@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from google_documents.entities.file import GoogleDriveSpreadsheet
+from google_documents.entities.range import SheetRange
+
+ROWS_COUNT = 10
+
+
+class FakeSpreadsheet(GoogleDriveSpreadsheet):
+    """
+    Spreadsheet with data in the rows 1-3 and 7, other rows are empty
+    """
+    rows = {1: ["a"], 2: ["b"], 3: ["c"], 7: ["d"]}
+
+    def __init__(self):
+        super().__init__(id="spreadsheet")
+        self.read_ranges = []
+
+    def _get_sheet_rows_count(self, sheet_title):
+        return ROWS_COUNT
+
+    def read(self, range_name):
+        self.read_ranges.append(range_name)
+
+        sheet_range = SheetRange.parse(range_name)
+        values = [
+            self.rows.get(row, [])
+            for row in range(sheet_range.start_row, sheet_range.end_row + 1)
+        ]
+
+        # API does not return trailing empty rows
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+
+class ReadIterTestCase(TestCase):
+    def test_read_by_windows(self):
+        spreadsheet = FakeSpreadsheet()
+
+        rows = list(spreadsheet.read_iter("Sheet1!A:A", chunk_rows=4))
+
+        self.assertEqual(rows, [["a"], ["b"], ["c"], [], [], [], ["d"]])
+        self.assertEqual(spreadsheet.read_ranges,
+                         ["Sheet1!A1:A4", "Sheet1!A5:A8", "Sheet1!A9:A10"])
+
+    def test_rows_are_yielded_lazily(self):
+        spreadsheet = FakeSpreadsheet()
+
+        rows = spreadsheet.read_iter("Sheet1!A1:A10", chunk_rows=2)
+        self.assertEqual(next(rows), ["a"])
+        rows.close()
+
+        # Only current and prefetched windows are read
+        self.assertEqual(spreadsheet.read_ranges,
+                         ["Sheet1!A1:A2", "Sheet1!A3:A4"])
+
+    def test_empty_rows_are_separate_lists(self):
+        spreadsheet = FakeSpreadsheet()
+
+        rows = list(spreadsheet.read_iter("Sheet1!A:A", chunk_rows=4))
+        rows[3].append("x")
+
+        self.assertEqual(rows[4:6], [[], []])
@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from google_documents.entities.values_cache import ValuesCache
+from google_documents.tests import fakes
+from google_documents.tests.fakes import FakeDriveService
+
+
+class FakeSpreadsheet(fakes.FakeSpreadsheet):
+    def __init__(self, values_cache):
+        super().__init__()
+        self._api_service = FakeDriveService(
+            [{"id": "spreadsheet", "version": "1"}])
+        self.values_cache = values_cache
+
+    @property
+    def requests(self):
+        return self._sheets_api_service.values_resource.requests
+
+
+class ValuesCacheTestCase(TestCase):
+    def test_read_is_cached(self):
+        spreadsheet = FakeSpreadsheet(ValuesCache(ttl=60))
+
+        for _ in range(3):
+            self.assertEqual(spreadsheet["Config!A1:Z50"],
+                             [["Config!A1:Z50"]])
+
+        self.assertEqual(spreadsheet.requests, [("get", "Config!A1:Z50")])
+
+    def test_cached_values_are_shared_by_instances(self):
+        values_cache = ValuesCache()
+        FakeSpreadsheet(values_cache).read("Config!A1:B2")
+
+        spreadsheet = FakeSpreadsheet(values_cache)
+        spreadsheet.read("Config!A1:B2")
+
+        self.assertEqual(spreadsheet.requests, [])
+
+    def test_write_invalidates_overlapping_ranges(self):
+        spreadsheet = FakeSpreadsheet(ValuesCache())
+        spreadsheet.batch_read(["Config!A1:B2", "Config!D1:D2", "Data!A1"])
+
+        spreadsheet.write("Config!B2:C3", [["x"]])
+        spreadsheet.batch_read(["Config!A1:B2", "Config!D1:D2", "Data!A1"])
+
+        self.assertEqual(spreadsheet.requests, [
+            ("batchGet", ["Config!A1:B2", "Config!D1:D2", "Data!A1"]),
+            ("update", "Config!B2:C3"),
+            ("batchGet", ["Config!A1:B2"]),
+        ])
+
+    def test_named_ranges_are_invalidated(self):
+        spreadsheet = FakeSpreadsheet(ValuesCache())
+        spreadsheet.read("MyNamedRange")
+
+        spreadsheet.write("Config!A1", [["x"]])
+        spreadsheet.read("MyNamedRange")
+
+        self.assertEqual(spreadsheet.requests, [
+            ("get", "MyNamedRange"),
+            ("update", "Config!A1"),
+            ("get", "MyNamedRange"),
+        ])
+
+    def test_cached_values_are_copied(self):
+        spreadsheet = FakeSpreadsheet(ValuesCache())
+
+        spreadsheet.read("Config!A1")[0].append("changed")
+
+        self.assertEqual(spreadsheet.read("Config!A1"), [["Config!A1"]])
+
+    def test_values_are_validated_by_version(self):
+        spreadsheet = FakeSpreadsheet(ValuesCache(check_version=True))
+        spreadsheet.read("Config!A1")
+        spreadsheet.read("Config!A1")
+
+        self.assertEqual(spreadsheet.requests, [("get", "Config!A1")])
+
+        spreadsheet._api_service.files_resource.items[0]["version"] = "2"
+        spreadsheet.read("Config!A1")
+
+        self.assertEqual(spreadsheet.requests,
+                         [("get", "Config!A1"), ("get", "Config!A1")])
+
+    def test_write_invalidates_whole_sheet(self):
+        for sheet_name in ("Mar", "'My sheet'"):
+            spreadsheet = FakeSpreadsheet(ValuesCache())
+            spreadsheet.read(sheet_name)
+
+            spreadsheet.write(f"{sheet_name}!A1:B2", [["x"]])
+            spreadsheet.read(sheet_name)
+
+            self.assertEqual(spreadsheet.requests, [
+                ("get", sheet_name),
+                ("update", f"{sheet_name}!A1:B2"),
+                ("get", sheet_name),
+            ])
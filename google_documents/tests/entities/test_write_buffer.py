@@ -0,0 +1,175 @@
+import threading
+from unittest import TestCase
+
+from google_documents.entities.sheet import Sheet
+from google_documents.tests import fakes
+
+
+class FakeSpreadsheet(fakes.FakeSpreadsheet):
+    """
+    Spreadsheet recording the writes and clears sent past the buffer
+    """
+
+    def __init__(self, values=(), sheets=()):
+        super().__init__(list(values), sheets)
+        self.requests = []
+
+    def batch_write(self, value_ranges, value_input_option="RAW"):
+        if self._write_buffer is not None:
+            return super().batch_write(value_ranges, value_input_option)
+        self.requests.append(("write", value_ranges))
+
+    def batch_clear(self, ranges_names):
+        if self._write_buffer is not None:
+            return super().batch_clear(ranges_names)
+        self.requests.append(("clear", ranges_names))
+
+    def write(self, range_name, data, value_input_option="RAW"):
+        if self._write_buffer is not None:
+            return super().write(range_name, data, value_input_option)
+        self.requests.append(("write", range_name, data))
+
+    def clear(self, range_name):
+        if self._write_buffer is not None:
+            return super().clear(range_name)
+        self.requests.append(("clear", range_name))
+
+
+SHEET_ITEM = {"properties": {"sheetId": 0, "index": 0, "title": "Sheet1"}}
+
+
+class WriteBufferTestCase(TestCase):
+    def test_writes_are_merged(self):
+        spreadsheet = FakeSpreadsheet()
+
+        with spreadsheet.buffered():
+            for row in range(1, 4):
+                spreadsheet[f"Sheet1!A{row}"] = [[row]]
+                spreadsheet[f"Sheet1!B{row}"] = [[row * 10]]
+            spreadsheet["Sheet1!B2"] = [["overwritten"]]
+            spreadsheet["Sheet1!D7"] = [["x"]]
+
+            self.assertEqual(spreadsheet.requests, [])
+
+        self.assertEqual(spreadsheet.requests, [
+            ("write", [
+                {"range": "Sheet1!A1:B3",
+                 "values": [[1, 10], [2, "overwritten"], [3, 30]]},
+                {"range": "Sheet1!D7", "values": [["x"]]},
+            ])
+        ])
+
+    def test_clears_are_sent_before_writes(self):
+        spreadsheet = FakeSpreadsheet()
+
+        with spreadsheet.buffered():
+            spreadsheet["Sheet1!A1:B1"] = [["a", "b"]]
+            spreadsheet.clear("Sheet1!A:A")
+            spreadsheet.clear("Sheet1!B:B")
+            spreadsheet["Sheet1!A2"] = [["c"]]
+
+        self.assertEqual(spreadsheet.requests, [
+            ("clear", ["Sheet1!A:B"]),
+            ("write", [{"range": "Sheet1!A2", "values": [["c"]]}]),
+        ])
+
+    def test_named_range_is_not_buffered(self):
+        spreadsheet = FakeSpreadsheet()
+
+        with spreadsheet.buffered():
+            spreadsheet["Sheet1!A1"] = [["a"]]
+            spreadsheet["MyNamedRange"] = [["b"]]
+            spreadsheet.clear("MyNamedRange")
+
+        # Pending values are sent before the named range is written
+        self.assertEqual(spreadsheet.requests, [
+            ("write", [{"range": "Sheet1!A1", "values": [["a"]]}]),
+            ("write", "MyNamedRange", [["b"]]),
+            ("clear", "MyNamedRange"),
+        ])
+
+    def test_flush_by_threshold(self):
+        spreadsheet = FakeSpreadsheet()
+
+        with spreadsheet.buffered(max_cells=2):
+            spreadsheet["Sheet1!A1"] = [["a"]]
+            spreadsheet["Sheet1!A2"] = [["b"]]
+            self.assertEqual(len(spreadsheet.requests), 1)
+
+            spreadsheet["Sheet1!A3"] = [["c"]]
+
+        self.assertEqual(len(spreadsheet.requests), 2)
+
+    def test_reads_see_pending_values(self):
+        spreadsheet = FakeSpreadsheet([["a", "b"], ["c", "d"]])
+
+        with spreadsheet.buffered():
+            spreadsheet.clear("Sheet1!B1:B2")
+            spreadsheet["Sheet1!A3"] = [["e"]]
+
+            self.assertEqual(spreadsheet["Sheet1!A1:B3"],
+                             [["a"], ["c"], ["e"]])
+
+        self.assertEqual(spreadsheet["Sheet1!A1:B3"],
+                         [["a", "b"], ["c", "d"]])
+
+    def test_pending_values_are_dropped_on_error(self):
+        spreadsheet = FakeSpreadsheet()
+
+        with self.assertRaises(RuntimeError):
+            with spreadsheet.buffered():
+                spreadsheet["Sheet1!A1"] = [["a"]]
+                raise RuntimeError
+
+        self.assertEqual(spreadsheet.requests, [])
+
+    def test_sheet_buffered(self):
+        spreadsheet = FakeSpreadsheet()
+        sheet = Sheet(id=1, index=0, title="My sheet")
+        sheet.assign_spreadsheet(spreadsheet)
+
+        with sheet.buffered():
+            sheet["A1"] = [["a"]]
+            sheet["B1"] = [["b"]]
+
+        self.assertEqual(spreadsheet.requests, [
+            ("write", [{"range": "'My sheet'!A1:B1", "values": [["a", "b"]]}])
+        ])
+
+    def test_first_sheet_is_the_same_target(self):
+        spreadsheet = FakeSpreadsheet(sheets=[SHEET_ITEM])
+
+        with spreadsheet.buffered():
+            spreadsheet["A1"] = [["a"]]
+            spreadsheet["Sheet1!B1"] = [["b"]]
+
+        self.assertEqual(spreadsheet.requests, [
+            ("write", [{"range": "Sheet1!A1:B1", "values": [["a", "b"]]}])
+        ])
+
+    def test_flush_does_not_detach_other_threads(self):
+        spreadsheet = FakeSpreadsheet()
+        sending, sent = threading.Event(), threading.Event()
+        batch_write = spreadsheet.batch_write
+
+        def blocking_batch_write(value_ranges, value_input_option="RAW"):
+            sending.set()
+            sent.wait(1)
+            return batch_write(value_ranges, value_input_option)
+
+        spreadsheet.batch_write = blocking_batch_write
+
+        with spreadsheet.buffered() as write_buffer:
+            spreadsheet["Sheet1!A1"] = [["a"]]
+            thread = threading.Thread(target=write_buffer.flush)
+            thread.start()
+            sending.wait(1)
+
+            # Writes of this thread are still buffered
+            self.assertIs(spreadsheet._write_buffer, write_buffer)
+            sent.set()
+            thread.join()
+
+        self.assertEqual(spreadsheet.requests, [
+            ("write", [{"range": "Sheet1!A1", "values": [["a"]]}])
+        ])
@@ -0,0 +1,50 @@
+import threading
+from unittest import TestCase
+
+from google_documents.entities.file import GoogleDriveSpreadsheet
+
+
+class FakeSpreadsheet(GoogleDriveSpreadsheet):
+    def __init__(self):
+        super().__init__(id="spreadsheet")
+        self.written = []
+        self._lock = threading.Lock()
+
+    def batch_write(self, value_ranges, value_input_option="RAW"):
+        if any(value_range["range"] == "Sheet1!A3:B4"
+               for value_range in value_ranges):
+            raise RuntimeError("Request has failed")
+
+        with self._lock:
+            self.written.extend(value_ranges)
+
+
+class WriteChunkedTestCase(TestCase):
+    def test_failed_parts_are_reported(self):
+        spreadsheet = FakeSpreadsheet()
+        values = [["value", i] for i in range(6)]
+
+        results = spreadsheet.write_chunked(
+            "Sheet1!A1", values, max_request_size=30)
+
+        self.assertEqual([result.ok for result in results],
+                         [True, False, True])
+        self.assertEqual(
+            sorted(value_range["range"]
+                   for value_range in spreadsheet.written),
+            ["Sheet1!A1:B2", "Sheet1!A5:B6"])
+
+        # Failed part can be written again
+        self.assertEqual(results[1].item, [
+            {"range": "Sheet1!A3:B4", "values": values[2:4]}])
+
+    def test_named_range_is_written_at_once(self):
+        spreadsheet = FakeSpreadsheet()
+        values = [["value", i] for i in range(6)]
+
+        results = spreadsheet.write_chunked(
+            "MyRange", values, max_request_size=30)
+
+        self.assertEqual([result.ok for result in results], [True])
+        self.assertEqual(spreadsheet.written,
+                         [{"range": "MyRange", "values": values}])
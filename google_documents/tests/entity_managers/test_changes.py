@@ -0,0 +1,82 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from google_documents.entities.file import (
+    GoogleDriveDocument,
+    GoogleDriveFile,
+    GoogleDriveSpreadsheet
+)
+from google_documents.settings import MIME_TYPES
+from google_documents.tests.fakes import FakeDriveService, FakeServiceManager
+
+CHANGES = [
+    {"changeType": "file", "fileId": "1", "time": "2026-01-01T00:00:00Z",
+     "file": {"id": "1", "name": "Doc",
+              "mimeType": MIME_TYPES["document"]}},
+    {"changeType": "drive", "driveId": "shared"},
+    {"changeType": "file", "fileId": "2", "removed": True},
+    {"changeType": "file", "fileId": "3",
+     "file": {"id": "3", "name": "Sheet",
+              "mimeType": MIME_TYPES["spreadsheet"]}},
+]
+
+
+class ChangesFeedTestCase(TestCase):
+    def setUp(self):
+        self.service = FakeDriveService([], CHANGES)
+        self.directory = tempfile.TemporaryDirectory()
+        self.token_file = os.path.join(self.directory.name, "token")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_manager(self, file_cls=GoogleDriveFile):
+        manager = FakeServiceManager(file_cls)
+        manager._api_service = self.service
+        return manager
+
+    def test_typed_changes(self):
+        changes = list(self.get_manager().changes(
+            start_page_token="0", page_size=2))
+
+        self.assertEqual([change.file_id for change in changes],
+                         ["1", "2", "3"])
+        self.assertIsInstance(changes[0].file, GoogleDriveDocument)
+        self.assertTrue(changes[1].removed)
+        self.assertIsNone(changes[1].file)
+        self.assertIsInstance(changes[2].file, GoogleDriveSpreadsheet)
+        self.assertEqual(self.service.changes_resource.list_calls,
+                         ["0", "2"])
+
+    def test_changes_of_the_type(self):
+        changes = self.get_manager(GoogleDriveSpreadsheet).changes(
+            start_page_token="0")
+
+        self.assertEqual([change.file_id for change in changes], ["2", "3"])
+
+    def test_page_token_is_saved(self):
+        changes = iter(self.get_manager().changes(
+            start_page_token="0", page_size=2, token_file=self.token_file))
+        next(changes)
+
+        # Page is not finished, so its token is not saved
+        self.assertFalse(os.path.exists(self.token_file))
+
+        list(changes)
+        with open(self.token_file) as file:
+            self.assertEqual(file.read(), str(len(CHANGES)))
+
+    def test_sync_is_resumed(self):
+        with open(self.token_file, "w") as file:
+            file.write("2")
+
+        changes = self.get_manager().changes(token_file=self.token_file)
+
+        self.assertEqual([change.file_id for change in changes], ["2", "3"])
+
+    def test_start_page_token(self):
+        feed = self.get_manager().changes(token_file=self.token_file)
+
+        self.assertEqual(list(feed), [])
+        self.assertEqual(feed.page_token, str(len(CHANGES)))
@@ -0,0 +1,124 @@
+from unittest import TestCase
+
+from google_documents.entities.file import GoogleDriveFile, \
+    GoogleDriveSpreadsheet
+from google_documents.entity_managers.index import FilesIndex
+from google_documents.settings import MIME_TYPES
+from google_documents.tests.fakes import (
+    FakeDriveService,
+    FakeFolder,
+    FakeServiceManager
+)
+
+ITEMS = [
+    {"id": "root", "name": "Root", "mimeType": MIME_TYPES["folder"],
+     "parents": []},
+    {"id": "1", "name": "Budget 2026", "parents": ["root"],
+     "mimeType": MIME_TYPES["spreadsheet"], "trashed": False},
+    {"id": "2", "name": "Notes", "parents": ["root"],
+     "mimeType": MIME_TYPES["document"], "trashed": False},
+    {"id": "3", "name": "Old budget", "parents": ["other"],
+     "mimeType": MIME_TYPES["spreadsheet"], "trashed": True},
+]
+
+
+class FilesIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = FilesIndex()
+        self.index.add_items(ITEMS)
+
+    def tearDown(self):
+        self.index.close()
+
+    def get_ids(self, **lookup):
+        return [item["id"] for item in self.index.filter_items(**lookup)]
+
+    def test_lookups(self):
+        self.assertEqual(self.get_ids(name="Notes"), ["2"])
+        self.assertEqual(self.get_ids(parent_id="root"), ["1", "2"])
+        self.assertEqual(
+            self.get_ids(mime_type=MIME_TYPES["spreadsheet"], trashed=False),
+            ["1"])
+
+    def test_missing_fields_are_kept(self):
+        self.index.add_items([{"id": "2", "name": "Renamed"}])
+
+        self.assertEqual(self.index.get_item("2"), {
+            **ITEMS[2], "name": "Renamed"})
+
+    def test_parents_are_replaced(self):
+        self.index.add_items([{"id": "2", "parents": ["other"]}])
+
+        self.assertEqual(self.get_ids(parent_id="root"), ["1"])
+        self.assertEqual(self.get_ids(parent_id="other"), ["2", "3"])
+
+
+class IndexedManagerTestCase(TestCase):
+    def setUp(self):
+        self.service = FakeDriveService([dict(item) for item in ITEMS])
+        self.index = FilesIndex()
+
+        self.manager = FakeServiceManager(GoogleDriveFile)
+        self.manager._api_service = self.service
+        self.manager.files_index = self.index
+
+    def tearDown(self):
+        self.index.close()
+
+    def get_ids(self, **lookup):
+        return [item["id"] for item in self.index.filter_items(**lookup)]
+
+    @property
+    def list_calls(self):
+        return self.service.files_resource.list_calls
+
+    def test_filter_is_answered_by_loaded_index(self):
+        self.assertFalse(self.index.is_loaded)
+        self.index.refresh(self.manager)
+        list_calls_count = len(self.list_calls)
+
+        files = list(self.manager.filter(
+            mime_type=MIME_TYPES["spreadsheet"], trashed=False))
+
+        self.assertEqual([file.id for file in files], ["1"])
+        self.assertEqual(len(self.list_calls), list_calls_count)
+
+    def test_unsupported_filter_is_sent_to_api(self):
+        self.index.refresh(self.manager)
+        list_calls_count = len(self.list_calls)
+
+        list(self.manager.filter(starred=True))
+        # Names are matched by the API word prefixes
+        list(self.manager.filter(name="budget"))
+
+        self.assertEqual(len(self.list_calls), list_calls_count + 2)
+
+    def test_incremental_refresh(self):
+        self.index.refresh(self.manager)
+
+        self.service.changes_resource.changes.extend([
+            {"changeType": "file", "fileId": "2", "removed": True},
+            {"changeType": "file", "fileId": "4",
+             "file": {"id": "4", "name": "New budget", "parents": ["root"],
+                      "mimeType": MIME_TYPES["spreadsheet"]}},
+        ])
+        self.index.refresh(self.manager)
+
+        self.assertIsNone(self.index.get_item("2"))
+        self.assertEqual(self.get_ids(parent_id="root"), ["1", "4"])
+
+    def test_children_are_answered_by_index(self):
+        self.index.refresh(self.manager)
+        list_calls_count = len(self.list_calls)
+
+        folder = FakeFolder(id="root", name="Root")
+        folder.manager = self.manager
+        children = list(folder.children)
+
+        self.assertEqual(len(self.list_calls), list_calls_count)
+        self.assertIsInstance(children[0], GoogleDriveSpreadsheet)
+
+    def test_fetched_items_are_indexed(self):
+        self.manager.get("2")
+
+        self.assertEqual(self.index.get_item("2")["name"], "Notes")
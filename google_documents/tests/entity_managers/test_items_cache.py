@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from google_documents.api.cache import MemoryCacheBackend
+from google_documents.entities.file import GoogleDriveFile
+from google_documents.tests.fakes import FakeDriveService, FakeServiceManager
+
+
+class ItemsCacheTestCase(TestCase):
+    def setUp(self):
+        self.items = [
+            {"id": str(i), "name": f"File {i}", "version": "1"}
+            for i in range(3)
+        ]
+        self.service = FakeDriveService(self.items)
+
+        self.manager = FakeServiceManager(GoogleDriveFile)
+        self.manager._api_service = self.service
+        self.manager.items_cache = MemoryCacheBackend()
+
+    @property
+    def get_calls(self):
+        return self.service.files_resource.get_calls
+
+    def test_unchanged_file_is_not_fetched(self):
+        self.manager.get("1")
+        file_obj = self.manager.get("1")
+
+        self.assertEqual(file_obj.name, "File 1")
+        self.assertEqual([fields for _, fields in self.get_calls], [
+            "id, mimeType, name, parents, version", "version"])
+
+    def test_changed_file_is_fetched(self):
+        self.manager.get("1")
+
+        self.items[1].update(name="Renamed", version="2")
+        file_obj = self.manager.get("1")
+
+        self.assertEqual(file_obj.name, "Renamed")
+        self.assertEqual(len(self.get_calls), 3)
+
+    def test_deleted_file_is_forgotten(self):
+        self.manager.get("1")
+        del self.items[1]
+
+        self.assertIsNone(self.manager.get("1"))
+        self.assertEqual(len(self.manager.items_cache), 0)
+
+    def test_in_bulk_checks_versions_in_batch(self):
+        self.manager.in_bulk(["0", "1", "2"])
+        files = self.manager.in_bulk(["0", "1", "2"])
+
+        self.assertEqual(sorted(files), ["0", "1", "2"])
+        self.assertEqual(self.service.batch_sizes, [3, 3])
+        self.assertEqual(
+            [fields for _, fields in self.get_calls[3:]], ["version"] * 3)
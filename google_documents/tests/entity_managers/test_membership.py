@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from google_documents.entities.file import GoogleDriveFile
+from google_documents.tests.fakes import (
+    FakeFolder,
+    FakeServiceManager,
+    FakeTreeService,
+    get_tree_items
+)
+
+
+class FolderMembershipTestCase(TestCase):
+    def setUp(self):
+        self.service = FakeTreeService(get_tree_items())
+        self.manager = FakeServiceManager(GoogleDriveFile)
+        self.manager._api_service = self.service
+
+        self.folder = FakeFolder(id="0", name="Folder 0")
+        self.folder.manager = self.manager
+
+    def test_known_parents_are_reused(self):
+        files = [
+            GoogleDriveFile.from_item({"id": "0.0", "parents": ["0"]}),
+            GoogleDriveFile.from_item({"id": "1.0", "parents": ["1"]}),
+        ]
+
+        self.assertEqual(self.folder.contains_many(files), [True, False])
+        self.assertEqual(self.service.files_resource.list_calls, [])
+
+    def test_children_are_listed_once(self):
+        files = [GoogleDriveFile(id=id_) for id_ in
+                 ["0.0", "0.1", "1.0", "0.0.doc", "missing"]]
+
+        self.assertEqual(self.folder.filter_members(files), files[:2])
+        # One query with pages of 2 items
+        self.assertEqual(self.service.files_resource.list_calls,
+                         [(("0",), None)])
+        # Parents of the found children are kept
+        self.assertEqual(files[0]._item["parents"], ["0"])
+        self.assertNotIn("parents", files[2]._item)
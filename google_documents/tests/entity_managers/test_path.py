@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from google_documents.api.cache import MemoryCacheBackend
+from google_documents.entities.file import (
+    GoogleDriveFile,
+    GoogleDriveFolder,
+    GoogleDriveSpreadsheet
+)
+from google_documents.tests.fakes import (
+    FakeNamesService,
+    FakeServiceManager,
+    get_tree_items
+)
+
+
+class FakePathsManager(FakeServiceManager):
+    paths_cache = None
+
+
+class GetByPathTestCase(TestCase):
+    def setUp(self):
+        items = get_tree_items()
+        items.append({"id": "quoted", "name": "It's \\ here",
+                      "parents": ["root"], "mimeType": "text/plain"})
+
+        self.service = FakeNamesService(items)
+        self.manager = FakePathsManager(GoogleDriveFile)
+        self.manager._api_service = self.service
+        self.manager.paths_cache = MemoryCacheBackend()
+
+    def test_get_by_path(self):
+        file = self.manager.get_by_path("/Folder 1/Subfolder 1.0/Doc")
+
+        self.assertEqual(file.name, "Doc")
+        self.assertEqual(file.id, "1.0.doc")
+        self.assertEqual(self.service.files_resource.list_calls, [
+            ("root", "Folder 1"), ("1", "Subfolder 1.0"), ("1.0", "Doc")])
+
+    def test_not_found(self):
+        self.assertIsNone(self.manager.get_by_path("/Folder 1/Missing/Doc"))
+        self.assertIsNone(self.manager.get_by_path("/"))
+
+    def test_shared_prefix_is_resolved_once(self):
+        self.manager.get_by_path("/Folder 1/Subfolder 1.0/Doc")
+        self.manager.get_by_path("/Folder 1/Subfolder 1.1/Doc")
+        file = self.manager.get_by_path("Folder 1/Subfolder 1.0/Doc/")
+
+        self.assertEqual(file.id, "1.0.doc")
+        self.assertEqual(self.service.files_resource.list_calls, [
+            ("root", "Folder 1"), ("1", "Subfolder 1.0"), ("1.0", "Doc"),
+            ("1", "Subfolder 1.1"), ("1.1", "Doc")])
+
+    def test_without_cache(self):
+        self.manager.paths_cache = None
+
+        self.manager.get_by_path("/Folder 0")
+        self.manager.get_by_path("/Folder 0")
+
+        self.assertEqual(len(self.service.files_resource.list_calls), 2)
+
+    def test_name_is_quoted(self):
+        file = self.manager.get_by_path("/It's \\ here")
+
+        self.assertEqual(file.id, "quoted")
+
+    def test_file_is_not_used_as_folder(self):
+        self.assertIsNone(self.manager.get_by_path("/It's \\ here/Doc"))
+
+    def test_cached_path_of_another_type(self):
+        folders_manager = FakePathsManager(GoogleDriveFolder)
+        spreadsheets_manager = FakePathsManager(GoogleDriveSpreadsheet)
+        for manager in (folders_manager, spreadsheets_manager):
+            manager._api_service = self.service
+            manager.paths_cache = self.manager.paths_cache
+
+        folder = folders_manager.get_by_path("/Folder 1")
+
+        self.assertEqual(folder.id, "1")
+        self.assertIsNone(spreadsheets_manager.get_by_path("/Folder 1"))
@@ -0,0 +1,89 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from google_documents.entities.file import GoogleDriveFile
+from google_documents.entity_managers.async_file import \
+    AsyncGoogleDriveDocumentManager
+from google_documents.entity_managers.query import FilesQuery
+from google_documents.tests.fakes import FakeAsyncFile, \
+    FakeDriveService, FakeManager, FakeServiceManager
+
+FILES_COUNT = 25
+
+
+class FilesQueryTestCase(TestCase):
+    def setUp(self):
+        self.manager = FakeManager(GoogleDriveFile, [
+            {"id": str(i), "name": f"File {i}"}
+            for i in range(FILES_COUNT)
+        ])
+        self.calls = self.manager._api_service.files_resource.list_calls
+
+    def get_query(self, page_size=10):
+        return FilesQuery(self.manager, q="", page_size=page_size,
+                          fields="id, name")
+
+    def test_iteration_follows_pages(self):
+        ids = [file.id for file in self.get_query()]
+
+        self.assertEqual(ids, [str(i) for i in range(FILES_COUNT)])
+        self.assertEqual(len(self.calls), 3)
+
+    def test_iteration_is_lazy(self):
+        files = iter(self.get_query())
+        next(files)
+
+        self.assertEqual(len(self.calls), 1)
+
+    def test_slicing(self):
+        files = self.get_query()[12:15]
+
+        self.assertEqual([file.id for file in files], ["12", "13", "14"])
+        # Pages after the slice end should not be requested
+        self.assertEqual(self.calls, [10, 5])
+
+    def test_first(self):
+        self.assertEqual(self.get_query().first().id, "0")
+        # Only one file should be requested
+        self.assertEqual(self.calls, [1])
+
+    def test_index(self):
+        self.assertEqual(self.get_query()[24].id, "24")
+
+        with self.assertRaises(IndexError):
+            self.get_query()[FILES_COUNT]
+
+    def test_filter_by_id(self):
+        manager = FakeServiceManager(GoogleDriveFile)
+        manager._api_service = self.manager._api_service
+
+        with self.assertWarns(UserWarning):
+            query = manager.filter(page_size=10, id="12")
+
+        self.assertEqual([file.id for file in query], ["12"])
+        # Pages after the found file should not be requested
+        self.assertEqual(self.calls, [10, 10])
+
+
+class FakeAsyncManager(AsyncGoogleDriveDocumentManager):
+    _api_service = None
+
+
+class AsyncFilesQueryTestCase(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.manager = FakeAsyncManager(FakeAsyncFile)
+        self.manager._api_service = FakeDriveService([
+            {"id": str(i), "name": f"File {i}"}
+            for i in range(FILES_COUNT)
+        ])
+
+    async def test_async_iteration(self):
+        files = await self.manager.filter(page_size=10).to_list(limit=12)
+
+        self.assertEqual([file.id for file in files],
+                         [str(i) for i in range(12)])
+
+    async def test_filter_by_id(self):
+        with self.assertWarns(UserWarning):
+            query = self.manager.filter(id="3")
+
+        self.assertEqual([file.id for file in await query.to_list()], ["3"])
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from google_documents.tests import fakes
+
+SHEET_ITEM = {"properties": {"sheetId": 0, "index": 0, "title": "Sheet1"}}
+
+
+class FakeSpreadsheet(fakes.FakeSpreadsheet):
+    """
+    Spreadsheet recording requests sent via scheduler
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = []
+
+    def _execute_request(self, service, request, callback=None, **kwargs):
+        self.requests.append(request)
+        return super()._execute_request(service, request, callback, **kwargs)
+
+
+class SheetsManagerTestCase(TestCase):
+    def setUp(self):
+        self.spreadsheet = FakeSpreadsheet(sheets=[SHEET_ITEM])
+
+    def test_requests_are_scheduled(self):
+        sheets = self.spreadsheet.sheets
+
+        self.assertEqual(sheets["Sheet1"].id, 0)
+        sheet = sheets.create(index=1, title="Sheet2")
+        sheet.delete()
+
+        self.assertEqual(len(self.spreadsheet.requests), 3)
+        self.assertIsNone(sheet.spreadsheet)
+        self.assertEqual(
+            [item["properties"]["title"] for item in
+             self.spreadsheet._sheets_api_service.spreadsheets().sheets],
+            ["Sheet1"])
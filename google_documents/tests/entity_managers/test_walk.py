@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from google_documents.entities.file import GoogleDriveDocument, \
+    GoogleDriveFile
+from google_documents.entity_managers.walk import FolderWalk
+from google_documents.tests.fakes import (
+    FakeFolder,
+    FakeServiceManager,
+    FakeTreeService,
+    get_tree_items
+)
+
+
+class FakePagesManager(FakeServiceManager):
+    # Small pages to check the pagination
+    page_size = 2
+
+
+class FakeFolderWalk(FolderWalk):
+    parents_per_query = 2
+
+
+class FolderWalkTestCase(TestCase):
+    def setUp(self):
+        self.service = FakeTreeService(get_tree_items())
+        self.manager = FakePagesManager(GoogleDriveFile)
+        self.manager._api_service = self.service
+
+    def walk(self, max_depth=None):
+        return list(FakeFolderWalk(self.manager, "root", max_depth))
+
+    def test_walk(self):
+        items = self.walk()
+
+        self.assertEqual(sorted(item["id"] for item in items), sorted(
+            item["id"] for item in get_tree_items()
+            if not item.get("trashed")))
+
+        # Folders are yielded before their children
+        yielded_ids = {"root"}
+        for item in items:
+            self.assertIn(item["parents"][0], yielded_ids)
+            yielded_ids.add(item["id"])
+
+    def test_parents_are_combined(self):
+        self.walk()
+
+        queried_parents = [
+            parent_ids for parent_ids, page_token
+            in self.service.files_resource.list_calls if page_token is None
+        ]
+        # Root, 3 folders by 2 and 6 subfolders by 2
+        self.assertEqual(len(queried_parents), 1 + 2 + 3)
+        self.assertEqual(
+            sorted(sum(map(list, queried_parents), [])),
+            sorted(["root", "0", "1", "2", "0.0", "0.1", "1.0", "1.1",
+                    "2.0", "2.1"]))
+
+    def test_max_depth(self):
+        items = self.walk(max_depth=2)
+
+        self.assertEqual(len(items), 9)
+        self.assertFalse(any(item["name"] == "Doc" for item in items))
+
+    def test_folder_walk_yields_typed_files(self):
+        folder = FakeFolder(id="root", name="Root")
+        folder.manager = self.manager
+
+        files = list(folder.walk(concurrency=2))
+
+        self.assertEqual(len(files), 15)
+        self.assertTrue(all(
+            isinstance(file, GoogleDriveDocument) for file in files
+            if file.name == "Doc"))
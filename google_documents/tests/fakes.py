@@ -0,0 +1,364 @@
+"""
+Fake Google Drive API service for the tests running without network
+"""
+import re
+import threading
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from google_documents.api.batch import execute_request
+from google_documents.entities.async_file import (
+    AsyncGoogleDriveFile,
+    AsyncGoogleDriveSpreadsheet
+)
+from google_documents.entities.file import (
+    GoogleDriveFolder,
+    GoogleDriveSpreadsheet
+)
+from google_documents.entity_managers.file import GoogleDriveDocumentManager
+from google_documents.settings import MIME_TYPES
+
+
+class FakeRequest:
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+
+    def execute(self, http=None):
+        if self.error:
+            raise self.error
+        return self.response
+
+
+class FakeBatchRequest:
+    def __init__(self, service):
+        self.service = service
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request, callback))
+
+    def execute(self, http=None):
+        self.service.batch_sizes.append(len(self.requests))
+
+        for request_id, (request, callback) in enumerate(self.requests):
+            try:
+                response, error = request.execute(), None
+            except HttpError as e:
+                response, error = None, e
+            callback(str(request_id), response, error)
+
+
+class FakeFilesResource:
+    def __init__(self, items):
+        self.items = items
+        self.list_calls = []
+        self.get_calls = []
+
+    def _get_item(self, file_id):
+        for item in self.items:
+            if item["id"] == file_id:
+                return item
+        return None
+
+    def list(self, pageSize, pageToken=None, **kwargs):
+        """
+        Emulates paginated `files().list`, using offset as page token
+        """
+        self.list_calls.append(pageSize)
+
+        start = int(pageToken or 0)
+        response = {"files": self.items[start:start + pageSize]}
+        if start + pageSize < len(self.items):
+            response["nextPageToken"] = str(start + pageSize)
+        return FakeRequest(response)
+
+    def get(self, fileId, fields=None):
+        self.get_calls.append((fileId, fields))
+
+        item = self._get_item(fileId)
+        if item is None:
+            return FakeRequest(error=HttpError(
+                httplib2.Response({"status": 404}), b"File not found"))
+
+        if fields:
+            field_names = [field.strip() for field in fields.split(",")]
+            item = {
+                name: value for name, value in item.items()
+                if name in field_names
+            }
+        return FakeRequest(item)
+
+
+class FakeChangesResource:
+    """
+    Emulates changes feed, using offset as page token
+    """
+
+    def __init__(self, changes=None):
+        self.changes = changes if changes is not None else []
+        self.list_calls = []
+
+    def getStartPageToken(self):
+        return FakeRequest({"startPageToken": str(len(self.changes))})
+
+    def list(self, pageToken, pageSize=100, **kwargs):
+        self.list_calls.append(pageToken)
+
+        start = int(pageToken)
+        response = {"changes": self.changes[start:start + pageSize]}
+        if start + pageSize < len(self.changes):
+            response["nextPageToken"] = str(start + pageSize)
+        else:
+            response["newStartPageToken"] = str(len(self.changes))
+        return FakeRequest(response)
+
+
+class FakeDriveService:
+    def __init__(self, items, changes=None):
+        self.files_resource = FakeFilesResource(items)
+        self.changes_resource = FakeChangesResource(changes)
+        self.batch_sizes = []
+
+    def files(self):
+        return self.files_resource
+
+    def changes(self):
+        return self.changes_resource
+
+    def new_batch_http_request(self):
+        return FakeBatchRequest(self)
+
+
+def get_tree_items():
+    """
+    Returns items of the tree: root / folder {i} / subfolder {i}.{j} / doc
+    """
+    items = [{"id": "trashed", "name": "Trashed", "parents": ["root"],
+              "mimeType": MIME_TYPES["document"], "trashed": True}]
+
+    for i in range(3):
+        items.append({"id": f"{i}", "name": f"Folder {i}",
+                      "parents": ["root"], "mimeType": MIME_TYPES["folder"]})
+        for j in range(2):
+            items.append({"id": f"{i}.{j}", "name": f"Subfolder {i}.{j}",
+                          "parents": [f"{i}"],
+                          "mimeType": MIME_TYPES["folder"]})
+            items.append({"id": f"{i}.{j}.doc", "name": "Doc",
+                          "parents": [f"{i}.{j}"],
+                          "mimeType": MIME_TYPES["document"]})
+    return items
+
+
+class FakeTreeFilesResource:
+    """
+    Emulates `files().list` by the parents query, using offset as page token
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.list_calls = []
+        self._lock = threading.Lock()
+
+    def list(self, q, pageSize, pageToken=None, **kwargs):
+        parent_ids = set(re.findall(r"'([^']+)' in parents", q))
+        with self._lock:
+            self.list_calls.append((tuple(sorted(parent_ids)), pageToken))
+
+        items = [
+            item for item in self.items
+            if parent_ids & set(item["parents"])
+            and not item.get("trashed")
+        ]
+
+        start = int(pageToken or 0)
+        response = {"files": items[start:start + pageSize]}
+        if start + pageSize < len(items):
+            response["nextPageToken"] = str(start + pageSize)
+        return FakeRequest(response)
+
+
+class FakeTreeService:
+    def __init__(self, items):
+        self.files_resource = FakeTreeFilesResource(items)
+
+    def files(self):
+        return self.files_resource
+
+
+class FakeNamesFilesResource:
+    """
+    Emulates `files().list` by the exact name and parent query
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.list_calls = []
+
+    def list(self, q, pageToken=None, **kwargs):
+        name = re.search(r"name = '((?:[^'\\]|\\.)*)'", q).group(1)
+        name = re.sub(r"\\(.)", r"\1", name)
+        parent_id = re.search(r"'([^']+)' in parents", q).group(1)
+        self.list_calls.append((parent_id, name))
+
+        return FakeRequest({"files": [
+            item for item in self.items
+            if item["name"] == name and parent_id in item["parents"]
+            and not item.get("trashed")
+        ]})
+
+
+class FakeNamesService:
+    def __init__(self, items):
+        self.files_resource = FakeNamesFilesResource(items)
+
+    def files(self):
+        return self.files_resource
+
+
+class FakeValuesResource:
+    """
+    Emulates `spreadsheets().values()`, every range contains its name
+    unless the values are passed
+    """
+
+    def __init__(self, values=None):
+        self.values = values
+        self.requests = []
+
+    def _get_values(self, range_name):
+        return self.values if self.values is not None else [[range_name]]
+
+    def get(self, spreadsheetId, range):
+        self.requests.append(("get", range))
+        return FakeRequest({"values": self._get_values(range)})
+
+    def batchGet(self, spreadsheetId, ranges):
+        self.requests.append(("batchGet", ranges))
+        return FakeRequest({"valueRanges": [
+            {"values": self._get_values(range_name)} for range_name in ranges
+        ]})
+
+    def update(self, spreadsheetId, range, body, valueInputOption):
+        self.requests.append(("update", range))
+        return FakeRequest({"updatedRange": range})
+
+
+class FakeSpreadsheetsResource:
+    def __init__(self, values=None, sheets=()):
+        self.values_resource = FakeValuesResource(values)
+        self.sheets = list(sheets)
+        self.get_calls = 0
+
+    def values(self):
+        return self.values_resource
+
+    def get(self, spreadsheetId, fields):
+        self.get_calls += 1
+        return FakeRequest({"sheets": self.sheets})
+
+    def batchUpdate(self, spreadsheetId, body):
+        """
+        Emulates adding and deleting of the sheets,
+        numbering new ones after existing ones
+        """
+        replies = []
+        for request in body["requests"]:
+            if "deleteSheet" in request:
+                sheet_id = request["deleteSheet"]["sheetId"]
+                self.sheets = [
+                    sheet for sheet in self.sheets
+                    if sheet["properties"]["sheetId"] != sheet_id]
+                replies.append({})
+                continue
+
+            properties = {**request["addSheet"]["properties"],
+                          "sheetId": len(self.sheets)}
+            self.sheets.append({"properties": properties})
+            replies.append({"addSheet": {"properties": properties}})
+        return FakeRequest({"replies": replies})
+
+
+class FakeSheetsService:
+    def __init__(self, values=None, sheets=()):
+        self.spreadsheets_resource = FakeSpreadsheetsResource(values, sheets)
+
+    @property
+    def values_resource(self):
+        return self.spreadsheets_resource.values_resource
+
+    def spreadsheets(self):
+        return self.spreadsheets_resource
+
+
+class FakeManager:
+    _execute_request = staticmethod(execute_request)
+
+    def __init__(self, file_cls, items):
+        self.file_cls = file_cls
+        self._api_service = FakeDriveService(items)
+
+    def _index_items(self, items):
+        pass
+
+
+class FakeAsyncClient:
+    """
+    Async client executing the fake requests in place
+    """
+
+    async def execute(self, request):
+        return request.execute()
+
+    async def execute_request(self, service, request, callback=None,
+                              error_callback=None, batchable=True):
+        response = request.execute()
+        return callback(response) if callback else response
+
+
+class FakeServiceManager(GoogleDriveDocumentManager):
+    # Allows using fake service instead of the real one
+    _api_service = None
+
+    def _get_api_credentials(self):
+        return None
+
+
+class FakeFolder(GoogleDriveFolder):
+    # Manager of the folder children, fake one in the tests
+    manager = None
+
+    def files(self):
+        return self.manager
+
+
+class FakeSpreadsheet(GoogleDriveSpreadsheet):
+    """
+    Spreadsheet executing requests of the fake sheets service in place
+    """
+    _api_service = None
+    _sheets_api_service = None
+
+    def __init__(self, values=None, sheets=()):
+        super().__init__(id="spreadsheet")
+        self._sheets_api_service = FakeSheetsService(values, sheets)
+
+    @staticmethod
+    def _execute_request(service, request, callback=None, **kwargs):
+        response = request.execute()
+        return callback(response) if callback else response
+
+
+class FakeAsyncFile(AsyncGoogleDriveFile):
+    async_client = FakeAsyncClient()
+    _api_service = None
+
+
+class FakeAsyncSpreadsheet(AsyncGoogleDriveSpreadsheet):
+    async_client = FakeAsyncClient()
+    _sheets_api_service = None
+
+    def __init__(self, sheets=()):
+        super().__init__(id="spreadsheet")
+        self._sheets_api_service = FakeSheetsService(sheets=sheets)
@@ -0,0 +1,114 @@
+import datetime
+import os
+import tempfile
+from unittest import TestCase
+
+import pyarrow
+import pyarrow.parquet as parquet
+
+from google_documents.utils.arrow import _write_arrow, columns_to_arrow
+
+
+class FakeWriteSpreadsheet:
+    def __init__(self):
+        self.write_calls = []
+
+    def write_chunked(self, range_name, data, value_input_option="RAW"):
+        self.write_calls.append((range_name, data))
+        return [range_name]
+
+
+class ColumnsToArrowTestCase(TestCase):
+    def setUp(self):
+        # Trailing empty cells of the columns are not returned by the API
+        self.columns = [
+            ["Name", "a", "", "c"],
+            ["Count", 1, 2, 3],
+            ["Price", 1.5, "", 2],
+            ["Date", 43861.5],
+            ["Mixed", 1, "b"],
+        ]
+
+    def test_types_are_inferred(self):
+        table = columns_to_arrow(self.columns)
+
+        self.assertEqual(table.column_names,
+                         ["Name", "Count", "Price", "Date", "Mixed"])
+        self.assertEqual(table.schema.field("Count").type, pyarrow.int64())
+        self.assertEqual(table.schema.field("Price").type, pyarrow.float64())
+        self.assertEqual(table.column("Name").to_pylist(), ["a", None, "c"])
+        self.assertEqual(table.column("Price").to_pylist(), [1.5, None, 2.0])
+        self.assertEqual(table.column("Mixed").to_pylist(), ["1", "b", None])
+
+    def test_schema(self):
+        schema = pyarrow.schema([
+            ("Date", pyarrow.timestamp("ms")),
+            ("Count", pyarrow.float32()),
+        ])
+
+        table = columns_to_arrow(self.columns, schema=schema)
+
+        self.assertEqual(table.schema.field("Count").type, pyarrow.float32())
+        self.assertEqual(table.column("Date").to_pylist(), [
+            datetime.datetime(2020, 1, 31, 12), None, None])
+
+    def test_without_columns(self):
+        table = columns_to_arrow(
+            self.columns[1:3], skip_rows=1, first_row_as_columns=False)
+
+        self.assertEqual(table.column_names, ["0", "1"])
+        self.assertEqual(table.num_rows, 3)
+
+
+class WriteArrowTestCase(TestCase):
+    def setUp(self):
+        self.spreadsheet = FakeWriteSpreadsheet()
+        self.table = pyarrow.table({
+            "name": ["a", None, "c"],
+            "count": pyarrow.array([1, 2, 3], pyarrow.int32()),
+            "date": pyarrow.array(
+                [datetime.date(2020, 1, 31)] * 3, pyarrow.date32()),
+            "time": pyarrow.array(
+                [datetime.datetime(2020, 1, 31, 12)] * 3,
+                pyarrow.timestamp("s", tz="UTC")),
+        })
+
+    def test_write_chunks(self):
+        results = _write_arrow(
+            self.spreadsheet, self.table, "Sheet 1!B2", chunk_rows=2)
+
+        self.assertEqual(results, ["'Sheet 1'!B2:E4", "'Sheet 1'!B5:E5"])
+        self.assertEqual(self.spreadsheet.write_calls[0][1], [
+            ["name", "count", "date", "time"],
+            ["a", 1, 43861.0, 43861.5],
+            ["", 2, 43861.0, 43861.5],
+        ])
+
+    def test_write_parquet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "data.parquet")
+            parquet.write_table(self.table, file_name)
+
+            _write_arrow(self.spreadsheet, file_name, "A1",
+                         include_columns=False, fillna=None)
+
+        self.assertEqual(self.spreadsheet.write_calls, [
+            ("A1:D3", [
+                ["a", 1, 43861.0, 43861.5],
+                [None, 2, 43861.0, 43861.5],
+                ["c", 3, 43861.0, 43861.5],
+            ])
+        ])
+
+    def test_empty_table(self):
+        _write_arrow(self.spreadsheet, self.table.slice(0, 0), "A1")
+
+        self.assertEqual(self.spreadsheet.write_calls, [
+            ("A1:D1", [["name", "count", "date", "time"]])])
+
+    def test_named_range_is_rejected(self):
+        for range_name in ("MyRange", "'Sheet 1'"):
+            with self.assertRaises(ValueError):
+                _write_arrow(self.spreadsheet, self.table, range_name)
+
+        self.assertEqual(self.spreadsheet.write_calls, [])
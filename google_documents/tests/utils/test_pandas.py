@@ -0,0 +1,145 @@
+import json
+from decimal import Decimal
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from google_documents.utils.pandas import (
+    _read_csv_export,
+    columns_to_data_frame,
+    data_frame_to_values
+)
+
+
+class DataFrameToValuesTestCase(TestCase):
+    def setUp(self):
+        self.data_frame = pd.DataFrame({
+            "int": np.array([1, 2], dtype=np.int32),
+            "float": [1.5, np.nan],
+            "bool": [True, False],
+            "date": pd.to_datetime(["2020-01-31 12:00", None]),
+            "object": [np.int64(3), None],
+        }, index=pd.Index(["a", "b"], name="key"))
+
+    def test_values_are_native(self):
+        values = data_frame_to_values(self.data_frame, fillna="")
+
+        self.assertEqual(values, [
+            ["key", "int", "float", "bool", "date", "object"],
+            ["a", 1, 1.5, True, "2020-01-31 12:00:00", 3],
+            ["b", 2, "", False, "", ""],
+        ])
+        self.assertIs(type(values[1][1]), int)
+        # Values are ready for the request body
+        json.dumps(values)
+
+    def test_serial_dates(self):
+        data_frame = pd.DataFrame({
+            "date": pd.to_datetime(["1900-01-01 12:00"]).tz_localize("UTC"),
+            "day": [pd.Timestamp("1900-01-01").date()],
+            "duration": pd.to_timedelta(["1 day 6 hours"]),
+        })
+
+        values = data_frame_to_values(
+            data_frame, include_index=False, include_columns=False,
+            datetime_format="serial")
+
+        self.assertEqual(values, [[2.5, 2, 1.25]])
+
+    def test_without_index_and_columns(self):
+        values = data_frame_to_values(
+            self.data_frame[["int", "object"]], fillna=None,
+            include_index=False, include_columns=False)
+
+        self.assertEqual(values, [[1, 3], [2, None]])
+
+    def test_multi_index(self):
+        data_frame = pd.DataFrame(
+            {"value": [Decimal("1.5")]},
+            index=pd.MultiIndex.from_tuples([("x", 1)], names=[None, "n"]))
+
+        self.assertEqual(data_frame_to_values(data_frame), [
+            ["level_0", "n", "value"],
+            ["x", 1, 1.5],
+        ])
+
+    def test_nullable_types(self):
+        data_frame = pd.DataFrame({
+            "int": pd.array([1, None], dtype="Int64"),
+            "category": pd.Categorical(["a", None]),
+        })
+
+        values = data_frame_to_values(
+            data_frame, fillna="-", include_index=False)
+
+        self.assertEqual(values, [["int", "category"], [1, "a"], ["-", "-"]])
+
+
+class FakeCsvSpreadsheet:
+    def __init__(self, csv):
+        self.csv = csv
+        self.export_calls = []
+
+    def export(self, file, mime_type):
+        self.export_calls.append(mime_type)
+        file.write(self.csv.encode())
+
+
+class ColumnsToDataFrameTestCase(TestCase):
+    def setUp(self):
+        # Trailing empty cells of the columns are not returned by the API
+        self.columns = [
+            ["Name", "a", "b", "c"],
+            ["Count", 1, 2, 3],
+            ["Price", 1.5, "", 2],
+            ["Date", 43861.5],
+            ["Flag", True, False, True],
+        ]
+
+    def test_types_are_inferred(self):
+        data_frame = columns_to_data_frame(self.columns)
+
+        self.assertEqual(list(data_frame.columns),
+                         ["Name", "Count", "Price", "Date", "Flag"])
+        self.assertEqual(data_frame["Count"].dtype, np.int64)
+        self.assertEqual(data_frame["Price"].dtype, np.float64)
+        self.assertTrue(np.isnan(data_frame["Price"][1]))
+        self.assertEqual(data_frame["Flag"].dtype, bool)
+        self.assertEqual(data_frame["Name"].tolist(), ["a", "b", "c"])
+
+    def test_dtype(self):
+        data_frame = columns_to_data_frame(
+            self.columns, first_column_as_index=True,
+            dtype={"Date": "datetime64[ns]", "Count": "float64"})
+
+        self.assertEqual(data_frame.index.tolist(), ["a", "b", "c"])
+        self.assertEqual(data_frame.index.name, "Name")
+        self.assertEqual(data_frame["Count"].dtype, np.float64)
+        self.assertEqual(data_frame["Date"]["a"],
+                         pd.Timestamp("2020-01-31 12:00"))
+        self.assertTrue(pd.isna(data_frame["Date"]["b"]))
+
+    def test_skip_rows_without_columns(self):
+        data_frame = columns_to_data_frame(
+            self.columns[:2], skip_rows=2, first_row_as_columns=False)
+
+        self.assertEqual(list(data_frame.columns), [0, 1])
+        self.assertEqual(data_frame.values.tolist(), [["b", 2], ["c", 3]])
+
+    def test_empty_data(self):
+        with self.assertRaises(ValueError):
+            columns_to_data_frame([])
+
+    def test_csv_export(self):
+        spreadsheet = FakeCsvSpreadsheet(
+            "Name,Count,Date\na,1,2020-01-31\nb,2,2020-02-01\n")
+
+        data_frame = _read_csv_export(
+            spreadsheet, first_column_as_index=True,
+            dtype={"Count": "float64", "Date": "datetime64[ns]"})
+
+        self.assertEqual(spreadsheet.export_calls, ["text/csv"])
+        self.assertEqual(data_frame.index.tolist(), ["a", "b"])
+        self.assertEqual(data_frame["Count"].dtype, np.float64)
+        self.assertEqual(data_frame["Date"]["b"], pd.Timestamp("2020-02-01"))
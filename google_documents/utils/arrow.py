@@ -0,0 +1,300 @@
+import os
+
+import numpy as np
+import pyarrow
+import pyarrow.compute as compute
+import pyarrow.parquet as parquet
+from pyarrow import types
+
+from google_documents.api.bulk import raise_errors
+from google_documents.entities.range import SheetRange, quote_sheet_title
+from google_documents.utils.spreadsheet import get_spreadsheet
+
+# Serial number of 1970-01-01, as the serial numbers of dates
+# in the Google Sheets are days since 1899-12-30
+UNIX_EPOCH_SERIAL_NUMBER = 25569
+
+MICROSECONDS_PER_DAY = 24 * 60 * 60 * 10 ** 6
+
+# Count of rows converted and written at once by `arrow_to_spreadsheet`
+CHUNK_ROWS = 10000
+
+
+def _to_array(values, type=None):
+    """
+    Returns Arrow array of the column values.
+    Empty cells are nulls, columns of mixed types are kept as text
+    """
+    try:
+        array = pyarrow.array(values, type=type)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # Empty cells inside the range are returned as empty strings,
+        # which don't fit numbers and booleans
+        values = [None if value == "" else value for value in values]
+        try:
+            array = pyarrow.array(values, type=type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            if type is not None:
+                raise
+            array = pyarrow.array([
+                None if value is None else str(value) for value in values])
+
+    if types.is_string(array.type):
+        array = compute.if_else(compute.equal(array, ""), None, array)
+    return array
+
+
+def _serial_numbers_to_dates(array, type):
+    """
+    Converts serial numbers of days to the timestamps or dates type
+    """
+    microseconds = compute.round(compute.multiply(
+        compute.subtract(array, UNIX_EPOCH_SERIAL_NUMBER),
+        MICROSECONDS_PER_DAY))
+    return microseconds.cast(pyarrow.int64()) \
+        .cast(pyarrow.timestamp("us")).cast(type, safe=False)
+
+
+def _column_to_array(values, rows_count, type=None):
+    """
+    Returns array of the column values padded with nulls to the rows count
+    :param type: Arrow type of the column, inferred if None.
+    Timestamps and dates are converted from the serial numbers
+    """
+    values = values + [None] * (rows_count - len(values))
+
+    if type is not None and (types.is_timestamp(type) or types.is_date(type)):
+        return _serial_numbers_to_dates(
+            _to_array(values, pyarrow.float64()), type)
+    return _to_array(values, type)
+
+
+def columns_to_arrow(
+        columns,
+        skip_rows=0,
+        first_row_as_columns=True,
+        schema=None
+):
+    """
+    Builds Arrow table from the columns read from the Google Spreadsheet
+    :param columns: List of the columns values, trailing empty cells
+    of which may be omitted
+    :param skip_rows: Count of the rows to skip
+    :param first_row_as_columns: True if the first row contains column names,
+    otherwise columns are named by their positions
+    :param schema: pyarrow.Schema with types of the columns by their names,
+    types of other columns are inferred
+    """
+    columns = [column[skip_rows:] for column in columns]
+
+    if first_row_as_columns:
+        if not any(columns):
+            raise ValueError(
+                "Cannot extract columns from the empty Spreadsheet data")
+
+        names = [str(column[0]) if column else "" for column in columns]
+        columns = [column[1:] for column in columns]
+    else:
+        names = [str(position) for position in range(len(columns))]
+
+    rows_count = max(map(len, columns), default=0)
+    fields_types = {
+        field.name: field.type for field in schema} if schema else {}
+
+    return pyarrow.Table.from_arrays([
+        _column_to_array(column, rows_count, fields_types.get(name))
+        for name, column in zip(names, columns)
+    ], names=names)
+
+
+def spreadsheet_range_to_arrow(
+        spreadsheet_id,
+        range_name,
+        google_service_account_file=None,
+        skip_rows=0,
+        first_row_as_columns=True,
+        schema=None
+):
+    """
+    Reads range of the Google Spreadsheet to the Arrow table.
+    Values are read unformatted column by column, and every column
+    is converted to the Arrow array at once
+    :param spreadsheet_id: ID of the spreadsheet to read
+    :param range_name: Range name of the data
+    :param google_service_account_file: Path to the service account file
+    :param skip_rows: Count of the rows to skip
+    :param first_row_as_columns: True if the first row contains column names
+    :param schema: pyarrow.Schema with types of the columns by their names.
+    Dates are read as serial numbers, unless their columns
+    have timestamp or date types here
+    :return: pyarrow.Table
+    """
+    spreadsheet = get_spreadsheet(
+        spreadsheet_id, google_service_account_file)
+
+    return columns_to_arrow(
+        spreadsheet.read_columns(range_name),
+        skip_rows=skip_rows,
+        first_row_as_columns=first_row_as_columns,
+        schema=schema
+    )
+
+
+def _array_to_values(array, fillna):
+    """
+    Returns JSON friendly values of the Arrow array.
+    Timestamps, dates and durations become serial numbers of days
+    """
+    type = array.type
+
+    if types.is_dictionary(type):
+        array, type = array.dictionary_decode(), type.value_type
+
+    if types.is_timestamp(type) or types.is_date(type):
+        # Serial numbers keep the local time of timezone aware timestamps
+        if types.is_timestamp(type) and type.tz is not None:
+            array = compute.local_timestamp(array)
+        microseconds = array.cast(pyarrow.timestamp("us")) \
+            .cast(pyarrow.int64())
+        array = compute.add(
+            compute.divide(microseconds.cast(pyarrow.float64()),
+                           MICROSECONDS_PER_DAY),
+            UNIX_EPOCH_SERIAL_NUMBER)
+    elif types.is_duration(type) or types.is_time(type):
+        microseconds = array.cast(
+            pyarrow.duration("us") if types.is_duration(type)
+            else pyarrow.time64("us")).cast(pyarrow.int64())
+        array = compute.divide(
+            microseconds.cast(pyarrow.float64()), MICROSECONDS_PER_DAY)
+    elif types.is_decimal(type):
+        array = array.cast(pyarrow.float64())
+
+    values = array.to_pylist()
+    for position in np.flatnonzero(
+            array.is_null().to_numpy(zero_copy_only=False)):
+        values[position] = fillna
+    return values
+
+
+def _iter_parquet_batches(parquet_file, chunk_rows):
+    try:
+        yield from parquet_file.iter_batches(batch_size=chunk_rows)
+    finally:
+        parquet_file.close()
+
+
+def _iter_batches(source, chunk_rows):
+    """
+    Returns schema of the source and iterator of its record batches
+    :param source: pyarrow.Table, pyarrow.RecordBatchReader
+    or path to the Parquet file
+    """
+    if isinstance(source, (str, os.PathLike)):
+        parquet_file = parquet.ParquetFile(source)
+        return parquet_file.schema_arrow, \
+            _iter_parquet_batches(parquet_file, chunk_rows)
+    if isinstance(source, pyarrow.Table):
+        return source.schema, source.to_batches(max_chunksize=chunk_rows)
+    return source.schema, iter(source)
+
+
+def _write_arrow(
+        spreadsheet,
+        source,
+        range_name,
+        include_columns=True,
+        fillna='',
+        chunk_rows=None,
+        value_input_option="RAW"
+):
+    sheet_range = SheetRange.parse(range_name)
+    # Chunks are written after each other, so the start cell is required
+    if sheet_range.start_row is None and sheet_range.start_column is None:
+        raise ValueError(
+            f"Range `{range_name}` has no start cell, named ranges and "
+            f"whole sheets are not supported, pass A1 range like "
+            f"`{quote_sheet_title(sheet_range.sheet_title)}!A1`")
+
+    chunk_rows = chunk_rows or CHUNK_ROWS
+    schema, batches = _iter_batches(source, chunk_rows)
+
+    start_row = sheet_range.start_row or 1
+    start_column = sheet_range.start_column or 1
+
+    results = []
+    rows_offset = 0
+
+    def write(rows):
+        nonlocal rows_offset
+
+        chunk_range = SheetRange(
+            sheet_range.sheet_title,
+            start_row + rows_offset, start_column,
+            start_row + rows_offset + len(rows) - 1,
+            start_column + len(rows[0]) - 1)
+        results.extend(spreadsheet.write_chunked(
+            chunk_range.to_a1(), rows, value_input_option))
+        rows_offset += len(rows)
+
+    header = [schema.names] if include_columns else []
+
+    for batch in batches:
+        # Batches of the readers may be larger than the chunk
+        for offset in range(0, batch.num_rows, chunk_rows):
+            chunk = batch.slice(offset, chunk_rows)
+
+            rows = header + list(map(list, zip(*[
+                _array_to_values(column, fillna)
+                for column in chunk.columns
+            ])))
+            header = []
+            if rows:
+                write(rows)
+
+    if header and header[0]:
+        write(header)
+    return results
+
+
+def arrow_to_spreadsheet(
+        source,
+        spreadsheet_id,
+        range_name,
+        google_service_account_file=None,
+        include_columns=True,
+        fillna='',
+        chunk_rows=None,
+        value_input_option="RAW",
+        partial_results=False
+):
+    """
+    Writes Arrow table or Parquet file in the Google Spreadsheet by chunks
+    of rows, so only one chunk is converted to the Python values at a time.
+    Timestamps and dates are written as serial numbers of days,
+    format the cells as dates to display them
+    :param source: pyarrow.Table, pyarrow.RecordBatchReader
+    or path to the Parquet file
+    :param spreadsheet_id: ID of the spreadsheet to write
+    :param range_name: A1 range name for the data,
+    its top left cell is the start of the data
+    :param google_service_account_file: Path to the service account file
+    :param include_columns: True if write column names to the spreadsheet
+    :param fillna: value by which to replace null values
+    :param chunk_rows: Count of rows converted and written at once
+    :param value_input_option: How to recognize input data
+    :param partial_results: If True, results are returned even if some
+    write requests have failed, otherwise BulkError is raised
+    :return: List of BulkResult of the write requests,
+    failed ones may be written again
+    """
+    spreadsheet = get_spreadsheet(
+        spreadsheet_id, google_service_account_file)
+
+    results = _write_arrow(
+        spreadsheet, source, range_name,
+        include_columns=include_columns,
+        fillna=fillna,
+        chunk_rows=chunk_rows,
+        value_input_option=value_input_option
+    )
+    return results if partial_results else raise_errors(results)
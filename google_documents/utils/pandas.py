@@ -1,6 +1,174 @@
-from pandas import DataFrame
+import datetime
+import math
+import tempfile
+from decimal import Decimal
 
-from google_documents.entities.file import GoogleDriveSpreadsheet
+import numpy as np
+from pandas import (
+    DataFrame,
+    Index,
+    NaT,
+    RangeIndex,
+    Series,
+    Timestamp,
+    isna,
+    read_csv,
+    to_numeric,
+    to_timedelta
+)
+from pandas.api.types import is_datetime64_any_dtype
+
+from google_documents.api.bulk import raise_errors
+from google_documents.settings import MIME_TYPES
+from google_documents.utils.spreadsheet import get_spreadsheet
+
+# Day 0 of the dates serial numbers in the Google Sheets
+SERIAL_NUMBER_EPOCH = Timestamp("1899-12-30")
+
+# Format of the dates written as text,
+# which is recognized by the Google Sheets as the date
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _fill_na(values, na_mask, fillna):
+    """
+    Replaces NA values of the list by the fill value in place
+    :param na_mask: Boolean array, True for the NA values
+    """
+    for position in np.flatnonzero(na_mask):
+        values[position] = fillna
+    return values
+
+
+def _datetime_column_to_values(column, datetime_format):
+    if datetime_format == "serial":
+        # Serial numbers keep the local time of timezone aware dates
+        if column.dt.tz is not None:
+            column = column.dt.tz_localize(None)
+        return ((column - SERIAL_NUMBER_EPOCH) /
+                np.timedelta64(1, "D")).tolist()
+
+    return column.dt.strftime(DATETIME_FORMAT).tolist()
+
+
+def _value_to_json(value, fillna, datetime_format):
+    """
+    Converts single value of the object column to the JSON friendly one
+    """
+    if isinstance(value, np.datetime64):
+        value = Timestamp(value)
+    elif isinstance(value, np.timedelta64):
+        value = value / np.timedelta64(1, "D")
+    elif isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float):
+        return fillna if math.isnan(value) else value
+    if value is None or value is NaT:
+        return fillna
+
+    if isinstance(value, datetime.datetime):
+        value = value.replace(tzinfo=None)
+        if datetime_format == "serial":
+            return (Timestamp(value) - SERIAL_NUMBER_EPOCH) / \
+                np.timedelta64(1, "D")
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, datetime.date):
+        if datetime_format == "serial":
+            return (value - SERIAL_NUMBER_EPOCH.date()).days
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return value / datetime.timedelta(days=1)
+    if isinstance(value, Decimal):
+        return float(value)
+
+    # Missing values of the nullable types
+    if not isinstance(value, (list, tuple, dict)) and isna(value):
+        return fillna
+    return str(value)
+
+
+def _column_to_values(column: Series, fillna, datetime_format):
+    """
+    Returns JSON friendly values of the column.
+    Columns of numeric and dates types are converted at once,
+    only values of object columns are converted one by one
+    """
+    dtype = column.dtype
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+        # NumPy integers and booleans become native ones
+        return np.asarray(column).tolist()
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        values = np.asarray(column)
+        return _fill_na(values.tolist(), np.isnan(values), fillna)
+    if isinstance(dtype, np.dtype) and dtype.kind == "m":
+        return _fill_na((column / np.timedelta64(1, "D")).tolist(),
+                        np.asarray(column.isna()), fillna)
+    if dtype.kind == "M":
+        return _fill_na(_datetime_column_to_values(column, datetime_format),
+                        np.asarray(column.isna()), fillna)
+
+    return [
+        _value_to_json(value, fillna, datetime_format)
+        for value in np.asarray(column, dtype=object)
+    ]
+
+
+def _get_index_names(index):
+    # Names of the unnamed levels are the same as `reset_index` gives
+    if index.nlevels == 1:
+        return [index.name if index.name is not None else "index"]
+    return [
+        name if name is not None else f"level_{level}"
+        for level, name in enumerate(index.names)
+    ]
+
+
+def data_frame_to_values(
+        data_frame: DataFrame,
+        fillna='',
+        include_index=True,
+        include_columns=True,
+        datetime_format="text"
+):
+    """
+    Returns values of the data frame to write to the Google Spreadsheet.
+    Values are converted column by column without copying the data frame
+    :param data_frame: Pandas dataframe with data
+    :param fillna: value by which to replace dataframe NA values
+    :param include_index: True if write data frame index to the spreadsheet
+    :param include_columns: True if write data frame column to the spreadsheet
+    :param datetime_format: "text" to write dates as text
+    like "2020-01-31 00:00:00", "serial" to write them
+    as the serial numbers of days since 1899-12-30
+    :return: List of rows
+    """
+    columns, header = [], []
+
+    if include_index:
+        index = data_frame.index
+        columns.extend(
+            Series(index.get_level_values(level))
+            for level in range(index.nlevels))
+        header.extend(_get_index_names(index))
+
+    columns.extend(column for _, column in data_frame.items())
+    header.extend(data_frame.columns)
+
+    values = []
+    if include_columns:
+        values.append([
+            _value_to_json(name, fillna, datetime_format) for name in header])
+
+    # Rows are built from the converted columns in one pass
+    values.extend(map(list, zip(*[
+        _column_to_values(column, fillna, datetime_format)
+        for column in columns
+    ])))
+    return values
 
 
 def data_frame_to_google_spreadsheet(
@@ -11,7 +179,9 @@ def data_frame_to_google_spreadsheet(
         fillna='',
         include_index=True,
         include_columns=True,
-        value_input_option=None
+        value_input_option="RAW",
+        datetime_format="text",
+        partial_results=False
 ):
     """
     Writes pandas data frame in the Google Spreadsheet
@@ -22,47 +192,33 @@ def data_frame_to_google_spreadsheet(
     :param fillna: value by which to replace dataframe NA values
     :param include_index: True if write data frame index to the spreadsheet
     :param include_columns: True if write data frame column to the spreadsheet
-    :param value_input_option: 'RAW' if you want
-    to allow Google Sheets to format your values,
-    'USER_ENTERED' to keep values in the same format
-    :return:
+    :param value_input_option: 'RAW' to write values as they are,
+    'USER_ENTERED' to let Google Sheets parse them
+    like typed by the user (e.g. dates written as text)
+    :param datetime_format: How to write dates, see `data_frame_to_values`
+    :param partial_results: If True, results are returned even if some
+    write requests have failed, otherwise BulkError is raised
+    :return: List of BulkResult of the write requests,
+    failed ones may be written again
     """
-    if include_index:
-        # Resetting index will append index
-        # To the first rows of data frame values
-        data_frame_to_write = data_frame.reset_index()
-    else:
-        # Otherwise we just copying the dataframe
-        data_frame_to_write = data_frame.copy()
-
-    # Filling all na values
-    data_frame_to_write = data_frame_to_write.fillna(fillna)
-
-    # Getting list of data frame columns
-    data_frame_values_list = data_frame.values.tolist()
-
-    # Appending columns at the top of the values list
-    if include_columns:
-        data_frame_values_list.insert(0, data_frame_to_write.columns)
-
-    # Initializing Google Spreadsheet
-    spreadsheet_manager = GoogleDriveSpreadsheet.files()
-
-    # Using custom credentials
-    if google_service_account_file:
-        spreadsheet_manager.using(google_service_account_file)
+    data_frame_values_list = data_frame_to_values(
+        data_frame,
+        fillna=fillna,
+        include_index=include_index,
+        include_columns=include_columns,
+        datetime_format=datetime_format
+    )
 
-    spreadsheet = spreadsheet_manager.get(id=spreadsheet_id)
-    if not spreadsheet:
-        raise ValueError("Spreadsheet `id` is not valid. "
-                         "Spreadsheet may not exist or "
-                         "service account may not have access to it")
+    spreadsheet = get_spreadsheet(
+        spreadsheet_id, google_service_account_file)
 
-    spreadsheet.write(
+    # Large data frames are written by the concurrent requests
+    results = spreadsheet.write_chunked(
         range_name=range_name,
         data=data_frame_values_list,
         value_input_option=value_input_option
     )
+    return results if partial_results else raise_errors(results)
 
 
 def google_spreadsheet_to_data_frame(
@@ -74,17 +230,8 @@ def google_spreadsheet_to_data_frame(
         first_column_as_index=False
 
 ):
-    spreadsheet_manager = GoogleDriveSpreadsheet.files()
-
-    # Using custom service account if needed
-    if google_service_account_file:
-        spreadsheet_manager.using(google_service_account_file)
-
-    spreadsheet = spreadsheet_manager.get(id=spreadsheet_id)
-    if not spreadsheet:
-        raise ValueError("Spreadsheet `id` is not valid. "
-                         "Spreadsheet may not exist or "
-                         "service account may not have access to it")
+    spreadsheet = get_spreadsheet(
+        spreadsheet_id, google_service_account_file)
 
     data: list = spreadsheet.read(range_name=range_name)
 
@@ -109,3 +256,165 @@ def google_spreadsheet_to_data_frame(
             index.append(row.pop(0))
 
     return DataFrame.from_records(data, index=index, columns=columns)
+
+
+def serial_numbers_to_datetimes(values):
+    """
+    Converts serial numbers of days since 1899-12-30 to datetimes
+    """
+    days = to_timedelta(to_numeric(Series(values)), unit="D")
+    # Serial numbers are floats, so datetimes are rounded to milliseconds
+    return (SERIAL_NUMBER_EPOCH + days).dt.round("ms")
+
+
+def _column_to_series(values, rows_count, dtype=None):
+    """
+    Returns series of the column values padded to the rows count.
+    Type of the series is inferred if it is not passed
+    """
+    column = np.empty(rows_count, dtype=object)
+    column[:len(values)] = values
+    # Empty cells inside the range are returned as empty strings
+    column[column == ""] = None
+
+    if dtype is None:
+        return Series(column).infer_objects()
+    if is_datetime64_any_dtype(dtype):
+        return serial_numbers_to_datetimes(column).astype(dtype)
+    return Series(column).astype(dtype)
+
+
+def columns_to_data_frame(
+        columns,
+        skip_rows=0,
+        first_row_as_columns=True,
+        first_column_as_index=False,
+        dtype=None
+):
+    """
+    Builds data frame from the columns read from the Google Spreadsheet
+    :param columns: List of the columns values, trailing empty cells
+    of which may be omitted
+    :param skip_rows: Count of the rows to skip
+    :param first_row_as_columns: True if the first row contains column names
+    :param first_column_as_index: True if the first column is the index
+    :param dtype: Types of the columns by their names, other types
+    are inferred. Datetime columns are converted from the serial numbers
+    """
+    dtype = dtype or {}
+    columns = [column[skip_rows:] for column in columns]
+
+    if first_row_as_columns:
+        if not any(columns):
+            raise ValueError(
+                "Cannot extract columns from the empty Spreadsheet data")
+
+        names = [column[0] if column else "" for column in columns]
+        columns = [column[1:] for column in columns]
+    else:
+        names = list(range(len(columns)))
+
+    rows_count = max(map(len, columns), default=0)
+    series = [
+        _column_to_series(column, rows_count, dtype.get(name))
+        for name, column in zip(names, columns)
+    ]
+
+    index = RangeIndex(rows_count)
+    if first_column_as_index:
+        if not series:
+            raise ValueError(
+                "Cannot extract index from the empty Spreadsheet data")
+        index = Index(series.pop(0), name=names.pop(0))
+
+    # Series are aligned by their positions, the index is set after
+    data_frame = DataFrame(
+        dict(enumerate(series)), index=RangeIndex(rows_count))
+    data_frame.columns = names
+    data_frame.index = index
+    return data_frame
+
+
+def _read_csv_export(
+        spreadsheet,
+        skip_rows=0,
+        first_row_as_columns=True,
+        first_column_as_index=False,
+        dtype=None
+):
+    """
+    Exports the first sheet of the spreadsheet as CSV by chunks
+    to the temporary file and parses it by `pandas.read_csv`
+    """
+    dtype = dtype or {}
+    dates_columns = [
+        name for name, column_dtype in dtype.items()
+        if is_datetime64_any_dtype(column_dtype)
+    ]
+
+    with tempfile.TemporaryFile() as file:
+        spreadsheet.export(file, mime_type=MIME_TYPES['csv'])
+        file.seek(0)
+
+        return read_csv(
+            file,
+            skiprows=skip_rows,
+            header=0 if first_row_as_columns else None,
+            index_col=0 if first_column_as_index else None,
+            dtype={
+                name: column_dtype for name, column_dtype in dtype.items()
+                if name not in dates_columns
+            },
+            parse_dates=dates_columns or False
+        )
+
+
+def google_spreadsheet_to_typed_data_frame(
+        spreadsheet_id,
+        range_name=None,
+        google_service_account_file=None,
+        skip_rows=0,
+        first_row_as_columns=True,
+        first_column_as_index=False,
+        dtype=None,
+        csv_export=False
+):
+    """
+    Reads data frame with typed columns from the Google Spreadsheet.
+    Values are read unformatted and column by column, so types
+    of the columns are inferred at once
+    :param spreadsheet_id: ID of the spreadsheet to read
+    :param range_name: Range name of the data
+    :param google_service_account_file: Path to the service account file
+    :param skip_rows: Count of the rows to skip
+    :param first_row_as_columns: True if the first row contains column names
+    :param first_column_as_index: True if the first column is the index
+    :param dtype: Types of the columns by their names, other types
+    are inferred. Dates are read as serial numbers,
+    unless their columns have datetime types here
+    :param csv_export: If True, the first sheet is exported as CSV
+    and parsed by `pandas.read_csv`, which is faster for large sheets.
+    Values are read as they are displayed, `range_name` should be None
+    """
+    if csv_export and range_name is not None:
+        raise ValueError("Only the whole first sheet "
+                         "can be read by the CSV export")
+    if not csv_export and range_name is None:
+        raise ValueError("`range_name` is required "
+                         "if the CSV export is not used")
+
+    spreadsheet = get_spreadsheet(
+        spreadsheet_id, google_service_account_file)
+
+    if csv_export:
+        return _read_csv_export(
+            spreadsheet, skip_rows, first_row_as_columns,
+            first_column_as_index, dtype)
+
+    return columns_to_data_frame(
+        spreadsheet.read_columns(range_name),
+        skip_rows=skip_rows,
+        first_row_as_columns=first_row_as_columns,
+        first_column_as_index=first_column_as_index,
+        dtype=dtype
+    )
@@ -0,0 +1,22 @@
+from google_documents.entities.file import GoogleDriveSpreadsheet
+
+
+def get_spreadsheet(spreadsheet_id, google_service_account_file=None):
+    """
+    Returns spreadsheet by its id,
+    raises ValueError if it is not accessible
+    :param spreadsheet_id: ID of the spreadsheet
+    :param google_service_account_file: Path to the service account file
+    """
+    spreadsheet_manager = GoogleDriveSpreadsheet.files()
+
+    # Using custom service account if needed
+    if google_service_account_file:
+        spreadsheet_manager.using(google_service_account_file)
+
+    spreadsheet = spreadsheet_manager.get(id=spreadsheet_id)
+    if not spreadsheet:
+        raise ValueError("Spreadsheet `id` is not valid. "
+                         "Spreadsheet may not exist or "
+                         "service account may not have access to it")
+    return spreadsheet
@@ -13,10 +13,20 @@ setup(
     author='Vitalii Pavliuk',
     author_email='pavliuk96@gmail.com',
     license='MIT',
-    packages=find_packages(exclude=['google_documents.tests', 'google_documents.tests.entities']),
+    packages=find_packages(exclude=['google_documents.tests',
+                                    'google_documents.tests.*']),
     zip_safe=False,
+    # Pinned pandas and Google API client don't support older versions
+    python_requires=">=3.11",
     install_requires=[
-        "google-api-python-client==1.6.6",
-        "pandas==0.23.4"
-    ]
+        "google-api-python-client==2.201.0",
+        "pandas==3.0.6",
+        "requests==2.34.2"
+    ],
+    extras_require={
+        # Asynchronous entities from `google_documents.entities.async_file`
+        "async": ["aiohttp==3.14.5"],
+        # Arrow and Parquet helpers from `google_documents.utils.arrow`
+        "arrow": ["pyarrow==26.0.0"]
+    }
 )